@@ -0,0 +1,204 @@
+#----------------------------| Fake OpenWeatherMap API |----------------------------
+"""Local stand-in for the OpenWeatherMap API, for benchmarks and offline runs.
+
+Serves canned Current Weather Data (/weather) and One Call (/onecall) payloads after a
+configurable latency. Payloads are made for a few known cities, or read from recorded
+responses (weather.json, onecall.json) in a fixtures folder. Every response has an ETag,
+and a request whose If-None-Match is the ETag of the same payload gets an empty 304.
+Payloads change on every request, or only every `period` seconds like the real API.
+
+usage:
+    python benchmarks/fake_owm.py [--port 8080] [--latency 0.05] [--fixtures DIR] [--period 600]
+    WEATHER_API_URL=http://127.0.0.1:8080/data/2.5 python main.py
+"""
+import argparse, collections, hashlib, json, os, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# city : (latitude, longitude, country code, official name)
+CITIES = {  "NEW DELHI" : (28.6139, 77.209, "IN", "New Delhi"),
+            "LONDON" : (51.5085, -0.1257, "GB", "London"),
+            "NEW YORK" : (40.7143, -74.006, "US", "New York"),
+            "TOKYO" : (35.6895, 139.6917, "JP", "Tokyo"),
+            "SYDNEY" : (-33.8679, 151.2073, "AU", "Sydney"),
+            "MUMBAI" : (19.0144, 72.8479, "IN", "Mumbai"),
+         }
+
+# (weather id, main, description, icon) cycled through hours and days
+CONDITIONS = [(800, "Clear", "clear sky", "01d"), (801, "Clouds", "few clouds", "02d"),
+              (803, "Clouds", "broken clouds", "04d"), (500, "Rain", "light rain", "10d"),
+              (211, "Thunderstorm", "thunderstorm", "11d"), (701, "Mist", "mist", "50d")]
+
+
+def calculated(tick : int) -> int:
+    """Calculation time (dt) of tick-th payload, a second apart within the current 10 minutes"""
+
+    __now = int(time.time())
+    return __now - __now % 600 + tick % 600
+
+
+def weather_payload(city : str, tick : int = 0, dt : int | None = None) -> dict | None:
+    """Current weather of known city, like /weather returns it in metric units.
+    tick changes temperatures a little and calculation time (dt, unless given), so every refresh brings new values.
+    return:
+        payload, None if city is unknown"""
+
+    if city.upper() not in CITIES:
+        return None
+    __lat, __lon, __con_code, __name = CITIES[city.upper()]
+    __now = int(time.time()) if dt is None else dt
+    __id, __main, __des, __icon = CONDITIONS[tick % len(CONDITIONS)]
+
+    return {"coord" : {"lon" : __lon, "lat" : __lat},
+            "weather" : [{"id" : __id, "main" : __main, "description" : __des, "icon" : __icon}],
+            "main" : {"temp" : 24.5 + tick % 5 * 0.25, "feels_like" : 24.1 + tick % 5 * 0.25, "temp_min" : 21.0,
+                      "temp_max" : 27.0, "pressure" : 1012, "humidity" : 48},
+            "visibility" : 6000, "wind" : {"speed" : 3.1, "deg" : 250}, "clouds" : {"all" : 20},
+            "dt" : calculated(tick) if dt is None else dt,
+            "sys" : {"country" : __con_code, "sunrise" : __now - 21600, "sunset" : __now + 21600},
+            "timezone" : 0, "id" : 1000 + list(CITIES).index(city.upper()), "name" : __name, "cod" : 200}
+
+
+def onecall_payload(lat : float, lon : float, tick : int = 0, dt : int | None = None) -> dict:
+    """48 hours and 8 days of forecast at lat, lon, like /onecall returns it in metric units"""
+
+    __hour = int(time.time()) // 3600 * 3600
+    __day = __hour // 86400 * 86400 + 43200
+    __condition = lambda i: dict(zip(("id", "main", "description", "icon"), CONDITIONS[(i + tick) % len(CONDITIONS)]))
+
+    __hourly = [{"dt" : __hour + 3600 * i, "temp" : 20 + (i + tick) % 9 * 0.75, "feels_like" : 19.5 + (i + tick) % 9 * 0.75,
+                 "humidity" : 40 + i % 20, "pop" : i % 10 / 10, "wind_speed" : 2 + i % 5, "weather" : [__condition(i)]}
+                for i in range(48)]
+    __daily = [{"dt" : __day + 86400 * i, "sunrise" : __day + 86400 * i - 21600, "sunset" : __day + 86400 * i + 21600,
+                "moonrise" : __day + 86400 * i - 10800, "moonset" : __day + 86400 * i + 25200,
+                "temp" : {"day" : 26 + (i + tick) % 6, "min" : 18 + i % 4, "max" : 30 + i % 3, "night" : 19 + (i + tick) % 5,
+                          "eve" : 24, "morn" : 20},
+                "feels_like" : {"day" : 26 + (i + tick) % 6, "night" : 19, "eve" : 24, "morn" : 20},
+                "humidity" : 35 + i * 3, "pop" : i % 5 / 5, "wind_speed" : 3 + i % 4, "weather" : [__condition(i)]}
+               for i in range(8)]
+
+    return {"lat" : lat, "lon" : lon, "timezone" : "UTC", "timezone_offset" : 0,
+            "current" : {"dt" : calculated(tick) if dt is None else dt, "temp" : __hourly[0]["temp"]}, "hourly" : __hourly, "daily" : __daily}
+
+
+#====================================================| Fake Server |====================================================
+class FakeOWM:
+    """Fake OpenWeatherMap API on localhost, running in a background thread.
+    Every response waits `latency` seconds, like a real network round trip.
+    With a period, payloads are calculated (dt) at the start of every period and are the same till the next one."""
+
+    def __init__(self, port : int = 0, latency : float = 0.0, fixtures : str | None = None, period : int | None = None):
+        self.latency = latency
+        self.period = period
+        self.hits = collections.Counter()          # { endpoint : number of requests }
+        self.__lock = threading.Lock()
+        self.__fixtures = {}
+        if fixtures:
+            for endpoint in ("weather", "onecall"):
+                __path = os.path.join(fixtures, f"{endpoint}.json")
+                if os.path.exists(__path):
+                    with open(__path) as f:
+                        self.__fixtures[endpoint] = json.load(f)
+
+        self.__server = ThreadingHTTPServer(("127.0.0.1", port), self.__handler())
+        self.__server.daemon_threads = True
+        self.__thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of API, to be given as WEATHER_API_URL"""
+
+        return f"http://127.0.0.1:{self.__server.server_address[1]}/data/2.5"
+
+    def start(self) -> "FakeOWM":
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name="fake-owm", daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def __enter__(self) -> "FakeOWM":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def respond(self, endpoint : str, query : dict[str, str]) -> tuple[int, dict]:
+        """Status and payload of a request to endpoint with query"""
+
+        with self.__lock:
+            self.hits[endpoint] += 1
+            __tick = self.hits[endpoint]
+        __dt = None
+        if self.period:
+            __now = int(time.time())
+            __tick, __dt = __now // self.period, __now - __now % self.period
+        if endpoint in self.__fixtures:
+            return (200, self.__fixtures[endpoint])
+
+        if endpoint == "weather":
+            __payload = weather_payload(query.get("q", ""), __tick, __dt)
+            if __payload is None:
+                return (404, {"cod" : "404", "message" : "city not found"})
+            return (200, __payload)
+
+        if endpoint == "onecall":
+            try:
+                __payload = onecall_payload(float(query["lat"]), float(query["lon"]), __tick, __dt)
+            except (KeyError, ValueError):
+                return (400, {"cod" : "400", "message" : "wrong latitude or longitude"})
+            for part in query.get("exclude", "").split(","):
+                __payload.pop(part.strip(), None)
+            return (200, __payload)
+
+        return (404, {"cod" : "404", "message" : "Internal error"})
+
+    def __handler(self) -> type:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"       # keep-alive, like the real API
+
+            def do_GET(self) -> None:
+                __url = urlparse(self.path)
+                __query = {key : values[0] for key, values in parse_qs(__url.query).items()}
+                if fake.latency:
+                    time.sleep(fake.latency)
+
+                __status, __payload = fake.respond(__url.path.rstrip("/").rsplit("/", 1)[-1], __query)
+                __body = json.dumps(__payload).encode()
+                __etag = f'"{hashlib.sha1(__body).hexdigest()[:16]}"'
+                if (__status == 200) and (self.headers.get("If-None-Match") == __etag):
+                    __status, __body = 304, b""
+
+                self.send_response(__status)
+                if __body:
+                    self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(__body)))
+                self.send_header("ETag", __etag)
+                self.end_headers()
+                self.wfile.write(__body)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the OpenWeatherMap API")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds every response waits")
+    parser.add_argument("--fixtures", help="folder with recorded weather.json and onecall.json")
+    parser.add_argument("--period", type=int, help="seconds payloads stay the same, 600 like the real API (default: none)")
+    args = parser.parse_args()
+
+    with FakeOWM(args.port, args.latency, args.fixtures, args.period) as fake:
+        print(f"WEATHER_API_URL={fake.url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,386 @@
+#----------------------------| Weather App Benchmarks |----------------------------
+"""Benchmarks of the Weather App, against the local fake OpenWeatherMap API (fake_owm.py).
+
+    cold_start          -> `import main` in a new interpreter, and a new window till first weather is shown
+    fetch_new_city      -> fetch and parse weather of a city searched first time (no window needed)
+    fetch_known_city    -> fetch and parse weather of a city searched before (no window needed)
+    search_to_paint     -> search of a city till its weather is shown in window
+    update_values       -> update_values() of shown weather
+    graph_redraw        -> update and draw both graphs
+    soak                -> 24 hours of 5 minute refreshes back to back, with memory growth
+                           (through the window if there is a display, else through WeatherCore),
+                           or with simulated time between refreshes (--cycle-interval)
+
+Benchmarks which need a window are skipped if there is no display.
+Results are printed as JSON, or written to --output.
+
+Exits with 1 if memory of soak grows more than --max-growth KB a refresh.
+
+usage: python benchmarks/run.py [--iterations 20] [--latency 0.05] [--soak-cycles 288] [--cycle-interval auto]
+                                [--max-growth 2] [--only fetch_new_city,soak]
+"""
+import argparse, datetime, gc, json, os, platform, subprocess, sys, tempfile, time, tracemalloc
+import numpy as np
+from fake_owm import FakeOWM
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+BENCHMARKS = ("cold_start", "fetch_new_city", "fetch_known_city", "search_to_paint", "update_values", "graph_redraw", "soak")
+
+
+#====================================================| Helpers |====================================================
+def stats(samples : list[float]) -> dict[str, float | int]:
+    """Summary of timings in milli seconds"""
+
+    __samples = np.asarray(samples, dtype=float)
+    return {"n" : int(__samples.size), "mean_ms" : round(float(__samples.mean()), 3),
+            "p50_ms" : round(float(np.percentile(__samples, 50)), 3), "p95_ms" : round(float(np.percentile(__samples, 95)), 3),
+            "min_ms" : round(float(__samples.min()), 3), "max_ms" : round(float(__samples.max()), 3)}
+
+
+def rss_kb() -> int | None:
+    """Resident memory of this process in KB, None if it can't be read"""
+
+    try:
+        with open("/proc/self/statm") as s:
+            return int(s.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class SimulatedClock:
+    """Stand-in of the time module for weather_core and fake_owm, whose time() and monotonic() run `offset` seconds
+    ahead of the real clock, so a soak waits minutes between refreshes in no time.
+    Everything else (perf_counter, sleep...) is the real time module."""
+
+    def __init__(self):
+        self.offset = 0.0
+
+    def time(self) -> float:
+        return time.time() + self.offset
+
+    def monotonic(self) -> float:
+        return time.monotonic() + self.offset
+
+    def __getattr__(self, name : str):
+        return getattr(time, name)
+
+
+def has_display() -> bool:
+    import tkinter as tk
+
+    try:
+        tk.Tk().destroy()
+    except tk.TclError:
+        return False
+    return True
+
+
+def isolate(folder : str) -> None:
+    """Keep saved forecasts and locations of benchmarks out of ./assets"""
+
+    import weather_core
+
+    weather_core.CurrentWeather._forecasts = weather_core.ForecastStore(os.path.join(folder, "forecast_cache.json"))
+    weather_core.CurrentWeather._locations = weather_core.LocationCache(os.path.join(folder, "location_cache.json"))
+
+
+def new_app(folder : str) -> "main.WeatherApp":
+    """Weather App window, after weather of default city is shown"""
+
+    import main
+
+    isolate(folder)
+    __app = main.WeatherApp()
+    while __app.start:
+        __app.update()
+        time.sleep(0.001)
+    return __app
+
+
+def paint(app : "main.WeatherApp", action, timeout : float = 30) -> float:
+    """Run action, then run Tk loop till weather is shown again
+    return:
+        milli seconds from action till weather is shown"""
+
+    __shown = []
+    __render = app.render_weather
+
+    def render() -> None:
+        __render()
+        __shown.append(time.perf_counter())
+
+    app.render_weather = render
+    try:
+        __start = time.perf_counter()
+        action()
+        while not __shown:
+            if time.perf_counter() - __start > timeout:
+                raise TimeoutError("weather was not shown")
+            app.update()
+            time.sleep(0.001)
+    finally:
+        del app.render_weather
+    return (__shown[0] - __start) * 1000
+
+
+#====================================================| Benchmarks |====================================================
+def cold_start(iterations : int, display : bool) -> dict:
+    __env = dict(os.environ)
+    __imports = []
+    for _ in range(iterations):
+        __start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import main"], cwd=ROOT, env=__env, check=True)
+        __imports.append((time.perf_counter() - __start) * 1000)
+
+    __result = {"import" : stats(__imports)}
+    if display:
+        __windows = []
+        for _ in range(iterations):
+            __start = time.perf_counter()
+            subprocess.run([sys.executable, os.path.abspath(__file__), "--child", "cold_start"], cwd=ROOT, env=__env, check=True)
+            __windows.append((time.perf_counter() - __start) * 1000)
+        __result["first_paint"] = stats(__windows)
+    else:
+        __result["first_paint"] = {"skipped" : "no display"}
+    return __result
+
+
+def fetch(iterations : int, city : str, new_city : bool) -> dict:
+    import weather_core
+
+    __core = weather_core.WeatherCore()
+    __core.get_forecast(city)           # warm up connection pool and location cache
+    __times = []
+    for _ in range(iterations):
+        __core._client.cache.clear()
+        if new_city:
+            __core._coords.clear()
+        __start = time.perf_counter()
+        if __core.get_forecast(city) != 0:
+            raise RuntimeError(f"weather of {city} not found")
+        __details = __core.current_weather_details()
+        __core.week_forecast_details(__details["bg color"])
+        __times.append((time.perf_counter() - __start) * 1000)
+    return stats(__times)
+
+
+def search_to_paint(app : "main.WeatherApp", iterations : int, city : str) -> dict:
+    __times = []
+    for _ in range(iterations):
+        app.weather._client.cache.clear()
+        __times.append(paint(app, lambda: (app.city.set(city), app.Search_Weather())))
+    return stats(__times)
+
+
+def update_values(app : "main.WeatherApp", iterations : int) -> dict:
+    __times = []
+    for _ in range(iterations):
+        __start = time.perf_counter()
+        app.update_values()
+        app.update_idletasks()
+        __times.append((time.perf_counter() - __start) * 1000)
+    return stats(__times)
+
+
+def graph_redraw(app : "main.WeatherApp", iterations : int) -> dict:
+    if not app.graphs:
+        return {"skipped" : "graphs are only made in expand view"}
+    __times = []
+    for _ in range(iterations):
+        app.cw_drawn = app.week_drawn = None         # redraw even if weather is same
+        __start = time.perf_counter()
+        app.CW_graph_update()
+        app.WF_graph_update()
+        app.cw_canvas.draw()
+        app.week_canvas.draw()
+        __times.append((time.perf_counter() - __start) * 1000)
+    return stats(__times)
+
+
+def soak(cycles : int, city : str, app : "main.WeatherApp | None", interval : float | str | None = None,
+         max_growth : float | None = None) -> dict:
+    """Refresh `cycles` times, sampling memory 24 times.
+    Without interval, refreshes run back to back with the cache cleared (288 is a day of 5 minute refreshes).
+    With interval, a simulated clock of weather_core and the fake API moves between refreshes, by interval seconds
+    or, if it is "auto", by the wait next_refresh() gives, so payloads expire by their TTL, unchanged weather comes
+    back as 304 and refreshes back off like in the app. Without a window, hourly forecast is asked for
+    every other simulated hour, like switching view."""
+
+    import fake_owm, weather_core
+
+    __core = app.weather if app else weather_core.WeatherCore()
+    __clock = None if interval is None else SimulatedClock()
+    __unchanged = [0, 0]            # refreshes in a row, and in all, which brought nothing new
+
+    def refresh() -> float:
+        """Refresh once
+        return:
+            seconds till next refresh, as the app would schedule it"""
+
+        if app is not None:
+            __before = app.unchanged
+            app.temp_update()
+            while app.updating is not None:
+                app.update()
+                time.sleep(0.001)
+            __unchanged[1] += app.unchanged > __before
+            __next = app.jobs.active().get("refresh", (0.0, None))[0]
+            app.jobs.cancel("refresh")          # soak runs the refreshes
+            return __next
+
+        if __clock is None:
+            __core.get_forecast(city)
+            __core.week_forecast_details(__core.current_weather_details()["bg color"])
+            return 0.0
+
+        __exit_code, __current_json, __forecast_json = __core.fetch_forecast(city, True)
+        if (__exit_code == 0) and __core.same_forecast(__current_json, __forecast_json):
+            __unchanged[0] += 1
+            __unchanged[1] += 1
+        elif (__exit_code == 0) and (__core.set_forecast(__current_json, __forecast_json) == 0):
+            __unchanged[0] = 0
+            __core.week_forecast_details(__core.current_weather_details()["bg color"])
+        return __core.next_refresh(__unchanged[0]) / 1000
+
+    if __clock is not None:
+        weather_core.time = fake_owm.time = __clock
+    try:
+        __next = refresh()          # first refresh makes the caches of app, they are not growth
+        gc.collect()
+        tracemalloc.start()
+        __every = max(1, cycles // 24)
+        __times, __waits, __samples = [], [], []
+        for cycle in range(cycles):
+            if __clock is None:
+                __core._client.cache.clear()
+            else:
+                __waits.append(__next if interval == "auto" else float(interval))
+                __clock.offset += __waits[-1]
+                if app is None:
+                    __core.fetch_hourly = (__clock.offset // 3600 % 2 == 1)
+            __start = time.perf_counter()
+            __next = refresh()
+            __times.append((time.perf_counter() - __start) * 1000)
+
+            if (cycle % __every == 0) or (cycle == cycles - 1):
+                gc.collect()
+                __samples.append({"cycle" : cycle, "traced_kb" : tracemalloc.get_traced_memory()[0] // 1024, "rss_kb" : rss_kb()})
+
+        __peak = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    finally:
+        weather_core.time = fake_owm.time = time
+
+    __x = [sample["cycle"] for sample in __samples]
+    __growth = float(np.polyfit(__x, [sample["traced_kb"] for sample in __samples], 1)[0]) if len(__samples) > 1 else 0.0
+    return {"through" : "window" if app else "core", "cycles" : cycles,
+            "simulated_hours" : round((__clock.offset / 3600) if __clock else (cycles * 5 / 60), 2),
+            "cycle_interval" : interval, "refresh" : stats(__times),
+            "wait_s" : {"min" : min(__waits), "max" : max(__waits), "mean" : round(sum(__waits) / len(__waits), 1)} if __waits else None,
+            "unchanged_refreshes" : __unchanged[1],
+            "memory" : {"traced_start_kb" : __samples[0]["traced_kb"], "traced_end_kb" : __samples[-1]["traced_kb"],
+                        "traced_peak_kb" : __peak, "growth_kb_per_cycle" : round(__growth, 3),
+                        "growth_limit_kb_per_cycle" : max_growth,
+                        "rss_start_kb" : __samples[0]["rss_kb"], "rss_end_kb" : __samples[-1]["rss_kb"]},
+            "samples" : __samples}
+
+
+def run(args : argparse.Namespace, api_url : str) -> dict:
+    __only = args.only.split(",") if args.only else BENCHMARKS
+    __display = has_display()
+    __results = {}
+
+    with tempfile.TemporaryDirectory(prefix="weather-bench-") as folder:
+        isolate(folder)
+
+        if "cold_start" in __only:
+            __results["cold_start"] = cold_start(args.iterations, __display)
+        if "fetch_new_city" in __only:
+            __results["fetch_new_city"] = fetch(args.iterations, args.city, new_city=True)
+        if "fetch_known_city" in __only:
+            __results["fetch_known_city"] = fetch(args.iterations, args.city, new_city=False)
+
+        __app = new_app(folder) if (__display and set(__only) & {"search_to_paint", "update_values", "graph_redraw", "soak"}) else None
+        for name, bench in (("search_to_paint", lambda: search_to_paint(__app, args.iterations, args.city)),
+                            ("update_values", lambda: update_values(__app, args.iterations)),
+                            ("graph_redraw", lambda: graph_redraw(__app, args.iterations))):
+            if name in __only:
+                __results[name] = bench() if __app else {"skipped" : "no display"}
+        if "soak" in __only:
+            __results["soak"] = soak(args.soak_cycles, args.city, __app, args.cycle_interval, args.max_growth)
+
+        if __app:
+            __app.destroy()
+
+    import weather_core
+
+    # stages of every search and refresh above, recorded by the app itself
+    __stages = {stage : {"n" : count, "p50_ms" : round(p50, 3), "p95_ms" : round(p95, 3)}
+                for stage, (count, p50, p95, _) in weather_core.CurrentWeather._timings.summary().items()}
+    __results["stages"] = __stages
+
+    return {"timestamp" : datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "python" : platform.python_version(), "platform" : platform.platform(), "api_url" : api_url,
+            "latency_s" : None if args.api_url else args.latency, "iterations" : args.iterations,
+            "city" : args.city, "display" : __display, "results" : __results}
+
+
+def child(name : str) -> None:
+    """Benchmark which needs a new interpreter, run by the parent benchmark"""
+
+    if name == "cold_start":
+        with tempfile.TemporaryDirectory(prefix="weather-bench-") as folder:
+            new_app(folder).destroy()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Weather App benchmarks against a local fake OpenWeatherMap API")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds every fake API response waits")
+    parser.add_argument("--soak-cycles", type=int, default=288, help="refreshes of soak run, 288 is 24 hours of 5 minutes")
+    parser.add_argument("--cycle-interval", help="simulated seconds between soak refreshes, or auto to wait like the app "
+                        "(default: back to back with the cache cleared)")
+    parser.add_argument("--max-growth", type=float, default=2.0, help="KB of memory a soak refresh may grow by")
+    parser.add_argument("--city", default="NEW DELHI")
+    parser.add_argument("--only", help=f"comma separated benchmarks of {', '.join(BENCHMARKS)}")
+    parser.add_argument("--api-url", help="benchmark against this API instead of the fake one")
+    parser.add_argument("--output", help="write results to this file instead of printing them")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.cycle_interval not in (None, "auto"):
+        args.cycle_interval = float(args.cycle_interval)
+
+    os.chdir(ROOT)          # app reads ./assets
+    if args.child:
+        child(args.child)
+        sys.exit(0)
+
+    fake = None
+    if not args.api_url:
+        # with simulated time between soak refreshes, payloads change every 10 minutes like the real API
+        fake = FakeOWM(latency=args.latency, period=None if args.cycle_interval is None else 600).start()
+    api_url = args.api_url or fake.url
+    os.environ["WEATHER_API_URL"] = api_url          # before weather_core is imported
+    if fake:
+        os.environ.setdefault("WEATHER_RATE_LIMIT", "0")        # fake API has no plan to keep to
+
+    try:
+        results = run(args, api_url)
+    finally:
+        if fake:
+            fake.stop()
+    if fake:
+        results["requests"] = dict(fake.hits)
+
+    if args.output:
+        with open(args.output, "w") as o:
+            json.dump(results, o, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    __memory = results["results"].get("soak", {}).get("memory", {})
+    if __memory.get("growth_kb_per_cycle", 0) > args.max_growth:
+        sys.stderr.write(f"soak memory grew {__memory['growth_kb_per_cycle']} KB a refresh, more than {args.max_growth} KB\n")
+        sys.exit(1)
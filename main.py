@@ -2,217 +2,493 @@
 import tkinter as tk       
 from tkinter import StringVar, messagebox
 from tkinter.constants import S
-import countryinfo, datetime, pytz, requests, webbrowser
-from matplotlib.figure import Figure
-from matplotlib.widgets import Cursor
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from PIL import Image, ImageTk
-
-#======================================================| Current Weather |========================================================
-class CurrentWeather:
-    
-    _API = "YOUR_API_KEY"
+import os, queue, threading, time, weakref, webbrowser
+from weather_core import Timings, WeatherCore
+# PIL, matplotlib and numpy are slow to import, so they are imported at their first use
+# (run startup_report.py to check what is imported at startup)
+
+#====================================================| Icon Cache |====================================================
+class IconCache:
+    """Images of the app decoded and resized once, keyed by (path, size).
+    The same PhotoImage is reused by every widget and refresh which shows that image."""
+
+    def __init__(self, master : tk.Misc, timings : Timings | None = None):
+        self.__master = master
+        self.__timings = timings
+        self.__decoded = {}         # { (path, size) : PIL Image }, resized but not yet given to Tk
+        self.__photos = {}          # { (path, size) : PhotoImage }
+        self.__lock = threading.Lock()
+
+    def get(self, path : str, size : tuple[int, int]) -> "ImageTk.PhotoImage":
+        """Get PhotoImage of image at path resized to size, decoded at first use only"""
+
+        from PIL import ImageTk
+
+        __key = (path, tuple(size))
+        __photo = self.__photos.get(__key)
+        if __photo is None:
+            __start = time.perf_counter()
+            with self.__lock:
+                __image = self.__decoded.pop(__key, None)
+            if __image is None:     # not preloaded yet
+                __image = self.__decode(__key)
+            __photo = self.__photos[__key] = ImageTk.PhotoImage(__image, master=self.__master)
+            if self.__timings is not None:
+                self.__timings.add("icon load", __start)
+        return __photo
+
+    def preload(self, keys : list[tuple[str, tuple[int, int]]]) -> None:
+        """Decode and resize images of keys [(path, size), ...] in a background thread.
+        PhotoImages are still made on Tk main loop, by get()."""
+
+        def decode_all():
+            for key in keys:
+                if key in self.__photos:
+                    continue
+                __image = self.__decode(key)
+                with self.__lock:
+                    self.__decoded.setdefault(key, __image)
+
+        threading.Thread(target=decode_all, name="icon-preload", daemon=True).start()
+
+    @staticmethod
+    def __decode(key : tuple[str, tuple[int, int]]) -> "Image.Image":
+        from PIL import Image
+
+        __path, __size = key
+        with Image.open(__path) as image:
+            return image.resize(__size)
+
+
+#====================================================| Scheduler |====================================================
+class Scheduler:
+    """All timers of the app, each with a name. Scheduling a name again cancels its pending after() call,
+    so at most one instance of every job is waiting at a time.
+    Jobs can be held (pause()) while their work can't be seen, and run again by resume()."""
+
+    def __init__(self, root : tk.Misc):
+        self.__root = root
+        self.__jobs = {}        # { name : (after id, due time, interval, func) }
+        self.__held = {}        # { name : (due time, interval, func) } of held jobs
+        self.__holding = set()  # names of jobs held till resume()
+
+    def once(self, name : str, delay : int, func) -> None:
+        """Run func after delay milli seconds, replacing pending job of same name"""
+
+        self.__schedule(name, delay, func, None)
+
+    def every(self, name : str, interval : int, func, delay : int | None = None) -> None:
+        """Run func every interval milli seconds, first time after delay (default interval),
+        replacing pending job of same name"""
+
+        self.__schedule(name, interval if delay is None else delay, func, interval)
+
+    def cancel(self, name : str) -> None:
+        """Cancel pending job of name, if any"""
+
+        self.__held.pop(name, None)
+        __job = self.__jobs.pop(name, None)
+        if __job is not None:
+            self.__root.after_cancel(__job[0])
+
+    def cancel_all(self) -> None:
+        """Cancel every pending job"""
+
+        for name in list(self.__jobs) + list(self.__held):
+            self.cancel(name)
+
+    def pause(self, names) -> None:
+        """Hold jobs of names: their pending after() calls are cancelled, so Tk doesn't wake up for them,
+        and jobs of those names scheduled while held wait too, till resume()"""
+
+        self.__holding.update(names)
+        for name in names:
+            __job = self.__jobs.pop(name, None)
+            if __job is not None:
+                self.__root.after_cancel(__job[0])
+                self.__held[name] = __job[1:]
+
+    def resume(self) -> list[str]:
+        """Schedule held jobs again at their due time. A job which came due while held runs at once,
+        and only once however many of its runs were missed.
+        return:
+            names of jobs which were held"""
 
-    with open("./assets/unit.txt") as u:
-        _unit = u.read()
-    
-    _UNITS = {  "C" : ["Celsius", "metric"],
-            "F" : ["Fahreneit", "imperial"],
-        }
+        __held, self.__held = self.__held, {}
+        self.__holding.clear()
+        __now = time.monotonic()
+        for name, (due, interval, func) in __held.items():
+            self.__schedule(name, max(0, round((due - __now) * 1000)), func, interval)
+        return list(__held)
 
-    def get_weather(self, city : str) -> int:
-        """Get current weather from Current Weather Data API and other details of provided city"""
+    def active(self) -> dict[str, tuple[float, int | None]]:
+        """Pending jobs, for debugging
+        return:
+            { name : (seconds until next run, interval in milli seconds or None) }"""
 
-        self.__city = city
-        try:
-            self.__current = requests.get(f"https://api.openweathermap.org/data/2.5/weather?q={self.__city}\
-&appid={self._API}&units={self._UNITS[self._unit][1]}", timeout=15)
+        __now = time.monotonic()
+        return {name : (round(due - __now, 3), interval) for name, (_, due, interval, _) in self.__jobs.items()}
 
-        except requests.exceptions.ConnectionError:     # No Internet
-            return 1
-        except requests.Timeout:                        # response time out
-            return 2
-        else:
-            # converting current weather in json format
-            self.__current_json = self.__current.json()
+    def __repr__(self) -> str:
+        return f"Scheduler({self.active()})"
+
+    def __schedule(self, name : str, delay : int, func, interval : int | None) -> None:
+        self.cancel(name)
+        if name in self.__holding:
+            self.__held[name] = (time.monotonic() + delay / 1000, interval, func)
+            return
+        __after_id = self.__root.after(delay, self.__run, name, func, interval)
+        self.__jobs[name] = (__after_id, time.monotonic() + delay / 1000, interval, func)
+
+    def __run(self, name : str, func, interval : int | None) -> None:
+        del self.__jobs[name]
+        if interval is not None:    # next run is scheduled first, so an error in func doesn't stop the job
+            self.__schedule(name, interval, func, interval)
+        func()
+
+
+def window_hidden(event : tk.Event) -> bool:
+    """True if Map / Unmap / Visibility event tells its window is minimized, withdrawn or fully covered"""
+
+    if event.type==tk.EventType.Visibility:
+        return event.state=="VisibilityFullyObscured"
+    return event.type==tk.EventType.Unmap
+
+
+#====================================================| Background Fetch Engine |====================================================
+class FetchEngine:
+    """Runs blocking API calls on worker threads, so Tk main loop never waits for the network.
+    Results are handed back through a thread-safe queue which is polled on Tk main loop by the scheduler."""
+
+    def __init__(self, scheduler : Scheduler, root : tk.Misc, poll : int = 50, workers : int = 1):
+        self.__scheduler = scheduler
+        self.__root = root
+        self.__poll = poll          # milli seconds between checking for finished jobs
+        self.__jobs = queue.Queue()
+        self.__results = queue.Queue()
+        self.__pending = 0
+
+        self.__workers = [threading.Thread(target=self.__run, name=f"weather-fetch-{i}", daemon=True) for i in range(workers)]
+        for worker in self.__workers:
+            worker.start()
+
+    @property
+    def busy(self) -> bool:
+        """True while any submitted job is still waiting for its callback"""
+        return self.__pending > 0
+
+    def submit(self, func, *args, callback, error=None) -> None:
+        """Run func(*args) on the worker thread, then call callback(result) on Tk main loop.
+        If func raises, error(exception) is called instead (default: Tk reports it)."""
+
+        self.__pending += 1
+        self.__jobs.put((func, args, callback, error))
+        if (self.__pending == 1):
+            self.__scheduler.once("fetch", self.__poll, self.__check)
+
+    def stop(self) -> None:
+        """Stop worker threads after the jobs already submitted"""
+
+        for _ in self.__workers:
+            self.__jobs.put(None)
+
+    def __run(self) -> None:
+        """Worker thread, runs jobs one after another"""
+
+        while True:
+            __job = self.__jobs.get()
+            if __job is None:
+                return
+            func, args, callback, error = __job
             try:
-                self._lat = self.__current_json["coord"]["lat"]               # Latitude
-                self._lon = self.__current_json["coord"]["lon"]               # Longitude
-                return 0
-            except KeyError:        # City name is not present
-                return 3
-
-    #----------------------------| Current Temperature |----------------------------
-    def current_weather(self) -> tuple[int | float | str]:
-        """Fetch following details from current weather
-        return:
-            (temp, temp_name, temp_des, humidity)
-            temp        -> temperature
-            feels       -> feels like
-            temp_name   -> name of temperature
-            temp_des    -> description of temperature
-            humditiy    -> humidity
-            visibility  -> visibility"""
-
-        __temp = self.__current_json["main"]["temp"]                     # according to units
-        __feels = self.__current_json["main"]["feels_like"]              # according to units
-        __temp_name = self.__current_json["weather"][0]["main"]          # group of weather
-        __temp_des = self.__current_json["weather"][0]["description"]    # group of weather
-        __humidity = self.__current_json["main"]["humidity"]             # percent %
-        __visible = self.__current_json["visibility"]                    # meters
-
-        return (__temp, __feels, __temp_name, __temp_des, __humidity, __visible)
-
-
-    #----------------------------| Location of City |----------------------------
-    def location_details(self) -> tuple[float | str]:
-        """Fetch information of user's provided location
-        return:
-            lat                 -> Latitude
-            lon                 -> Longitude
-            city                -> City name (official)
-            con_code            -> Country code
-            country_name        -> Country name
-            region              -> Region of country
-            time_zone           -> Time Zone
-            zone_name           -> name of Time Zone"""
+                self.__results.put((callback, error, func(*args), None))
+            except Exception as e:
+                self.__results.put((callback, error, None, e))
 
-        __city_name = self.__current_json["name"]                    # City name
-        __con_code = self.__current_json["sys"]["country"]           # Country code
-        __country_name = pytz.country_names[__con_code]                 # Country name
+    def __check(self) -> None:
+        """Hand finished jobs back to their callbacks, keep polling while jobs are pending"""
 
-        __country_info = countryinfo.CountryInfo(__country_name).info()
-        __region = __country_info["region"]                             # Region name
+        done = []
+        while True:
+            try:
+                done.append(self.__results.get_nowait())
+            except queue.Empty:
+                break
 
-        self.__zone_name = pytz.country_timezones[__con_code][0]        # Time zone name
-        # self.__time_zone = self.__country_info["timezones"][0][3:]                      # Time zone
-        __time_zone = datetime.datetime.now(tz=pytz.timezone(self.__zone_name)).strftime("%z")
+        self.__pending -= len(done)
+        if self.__pending:
+            self.__scheduler.once("fetch", self.__poll, self.__check)
 
-        return (self._lat, self._lon, __city_name, __con_code, __country_name, __region, __time_zone, self.__zone_name)
+        for callback, error, result, exception in done:
+            if exception is None:
+                callback(result)
+            elif error is not None:
+                error(exception)
+            else:
+                self.__root.report_callback_exception(type(exception), exception, exception.__traceback__)
 
 
-    #----------------------------| Time of City |----------------------------
-    def current_time(self) -> tuple[str]:
-        """Fetch current time and current day of user's location
-        return:
-            current_time    -> Current Time
-            current_Day:   -> Current Day"""
+#====================================================| Graph Tooltip |====================================================
+class GraphTooltip:
+    """Temperature annotation and cursor line of a graph, moved without drawing the whole graph again.
+    The graph without them is cached after every full draw, then only these two artists are blitted over it.
+    Mouse is snapped to the nearest point by bisecting midpoints of points, which are computed once per update.
+    The tooltip follows the mouse at most once a frame, as job `name` of jobs, and a click pins it to a point."""
 
-        # current time in HH : MM : SS  AM/PM 12-hr format
-        __current_time = datetime.datetime.now(pytz.timezone(self.location_details()[-1])).strftime("%I:%M %p")
-        __current_day = datetime.datetime.now(pytz.timezone(self.location_details()[-1])).strftime("%a, %d %b' %y")
-        return (__current_time, __current_day)
+    FRAME = 16          # milli seconds between two redraws of tooltip while mouse moves
 
+    def __init__(self, canvas : "FigureCanvasTkAgg", axes : "Axes", annotation : "Annotation", jobs : Scheduler, name : str):
+        import numpy as np
 
-#====================================================| 7-days Weather Forecast |====================================================
-class WeekForecast(CurrentWeather):
+        self.__jobs = jobs
+        self.__name = name
+        self.__canvas = canvas
+        self.__axes = axes
+        self.__annot = annotation
+        self.__line = axes.axvline(0, color="r", linewidth=1, visible=False, animated=True)
+        self.__annot.set_animated(True)
 
-    def get_forecast(self, city : str) -> int:
-        """Fetch forecast from One Call API and other details of provided city
-        first verify the location from get_weather() method of CurrentWeather class."""
+        self.__background = None        # graph without tooltip, from last full draw
+        self.__x = self.__y = self.__edges = np.empty(0)
+        self.__labels = []
+        self.__pinned = None            # index of clicked point
+        self.__shown = None             # index of point shown now
+        self.__pending = None           # index of point waiting for next frame
+        self.__waiting = False          # redraw of next frame is scheduled
+        self.__last = 0.0               # time of last redraw
 
-        __exit_status = super().get_weather(city)
-        if (__exit_status == 0):
-            # Getting 7 day forecast from open weather API, of user's provided location's latitude & longitude
-            self.__forecast = requests.get(f"https://api.openweathermap.org/data/2.5/onecall?lat={self._lat}&lon={self._lon}\
-&appid={self._API}&units={self._UNITS[self._unit][1]}&exclude=minutely", timeout=15)
+        canvas.mpl_connect("draw_event", self.__on_draw)
+        canvas.mpl_connect("button_press_event", self.__on_click)
+        canvas.mpl_connect("motion_notify_event", self.__on_motion)
+        canvas.mpl_connect("axes_leave_event", self.__on_leave)
 
-            # converting 7-day forecast into json format
-            self._seven_days_weather = self.__forecast.json()
-            return 0
-        else:
-            return __exit_status
-
-    #--------------------------| Current Day Temperature |--------------------------
-    def current_day_temps(self) -> dict[str : float]:
-        """--------------------------| Current Day Temperature |--------------------------
-        Fetch day, date and time of current day (24-hours - 3hr diff)
-        -> returns a dictionary of time as key and temperature as value
-        -> { time : day }
-        return:
-        ->     current_day_temp    -> Temperature of 24-hours of 3 hour difference """
+    def set_points(self, x : "np.ndarray", y : "np.ndarray", labels : list[str]) -> None:
+        """Points of graph and text shown at every point, shown from next draw of graph"""
 
-        __current_day_temp = {}
-        for __i, __hours in enumerate(self._seven_days_weather["hourly"]):
-            if (__i > 24):  break
-            if (__i%3==0):
-                __day = datetime.datetime.fromtimestamp(__hours["dt"]).strftime("%d %B").split()
-                __day[1] = __day[1][:3]
-                __time = datetime.datetime.fromtimestamp(__hours["dt"]).strftime("%I:%M %p")
-                __date = f"{__day[0]} {__day[1]}\n{__time}"
+        import numpy as np
 
-                __temp = __hours["temp"]
+        self.__x = np.asarray(x, dtype=float)
+        self.__y = np.asarray(y, dtype=float)
+        self.__edges = (self.__x[1:] + self.__x[:-1]) / 2
+        self.__labels = labels
+        if (self.__shown is not None) and (self.__shown >= len(self.__x)):
+            self.__shown = self.__pinned = None
+        self.__place(self.__shown)
 
-                __current_day_temp[__date] = __temp
+    def nearest(self, xdata : float) -> int:
+        """Index of point nearest to xdata"""
 
-        return __current_day_temp
+        import numpy as np
 
-    #------------------------------------Sunrise-and-Sunset----------------------------------------
-    def current_sun_time(self) -> tuple[str]:
-        """Get sunrise and sunset time of current day
-        return:
-            sunrise     -> Sunrise
-            sunset      -> Sunset"""
+        return int(np.searchsorted(self.__edges, xdata))
 
-        __sunrise = datetime.datetime.fromtimestamp(self._seven_days_weather["daily"][0]["sunrise"]).strftime("%I:%M %p")
-        __sunset = datetime.datetime.fromtimestamp(self._seven_days_weather["daily"][0]["sunset"]).strftime("%I:%M %p")
-        return (__sunrise, __sunset)
+    def show(self, index : int | None) -> None:
+        """Show tooltip at point of index, or hide it if None"""
 
-    #-----------------------------------Moonrise-and-Moonset---------------------------------------
-    def current_moon_time(self) -> tuple[str]:
-        """Get moonrise and moonset time of current day
-        return:
-            moonrise    -> Moonrise
-            moonset     -> Moonset"""
+        if index==self.__shown:
+            return
+        self.__shown = index
+        self.__place(index)
+        self.__blit()
+
+    def __place(self, index : int | None) -> None:
+        if index is None:
+            self.__line.set_visible(False)
+            self.__annot.set_visible(False)
+            return
+        self.__line.set_xdata([self.__x[index], self.__x[index]])
+        self.__annot.xy = (self.__x[index], self.__y[index])
+        self.__annot.set_text(self.__labels[index])
+        self.__line.set_visible(True)
+        self.__annot.set_visible(True)
+
+    def __draw_artists(self) -> None:
+        if self.__shown is not None:
+            self.__axes.draw_artist(self.__line)
+            self.__axes.draw_artist(self.__annot)
+
+    def __blit(self) -> None:
+        self.__last = time.perf_counter()
+        if self.__background is None:       # not drawn yet, tooltip is drawn with first draw
+            return
+        self.__canvas.restore_region(self.__background)
+        self.__draw_artists()
+        self.__canvas.blit(self.__axes.figure.bbox)
 
-        __moonrise = datetime.datetime.fromtimestamp(self._seven_days_weather["daily"][0]["moonrise"]).strftime("%I:%M %p")
-        __moonset = datetime.datetime.fromtimestamp(self._seven_days_weather["daily"][0]["moonset"]).strftime("%I:%M %p")
-        return (__moonrise, __moonset)
+    def __on_draw(self, event) -> None:
+        """Full draw of graph, cache it and draw tooltip over it"""
 
-    #---------------------------------Current-Day-Min-Max-Temperature------------------------------
-    def today_min_max_temp(self) -> tuple[float]:
-        """Get minimum and maximum temperature of current day
-        return:
-            min_temp    -> Minimum temperature
-            max_temp    -> Maximum temperature"""
+        self.__background = self.__canvas.copy_from_bbox(self.__axes.figure.bbox)
+        self.__draw_artists()
 
-        __min_temp = self._seven_days_weather["daily"][0]["temp"]["min"]
-        __max_temp = self._seven_days_weather["daily"][0]["temp"]["max"]
-        return (__min_temp, __max_temp)
+    def __on_click(self, event) -> None:
+        if (event.inaxes is self.__axes) and len(self.__x):
+            self.__pinned = self.nearest(event.xdata)
+            self.show(self.__pinned)
 
-    #---------------------------------------7-Day-Forecast-----------------------------------------
-    def Seven_days_forecast(self) -> list[dict[str, int | float | str]]:
-        """
-        Get information of next 7 days each day info is stored in a dictionary manner
-        { "Date" : date,        "Temp" : temp,         "Day:" : day_temp, 
-         "Night:" : night_temp, "Name" : weather_name, "Description" : weather_des}
-        return:
-            days                -> list of 7-day forecast"""
+    def __on_motion(self, event) -> None:
+        if (event.inaxes is not self.__axes) or not len(self.__x):
+            return
+        self.__pending = self.nearest(event.xdata)
+        __wait = self.FRAME - (time.perf_counter() - self.__last) * 1000
+        if __wait <= 0:
+            self.__flush()
+        elif not self.__waiting:        # show last position of mouse in next frame
+            self.__waiting = True
+            self.__jobs.once(self.__name, int(__wait) + 1, self.__flush)
+
+    def cancel(self) -> None:
+        """Drop redraw waiting for next frame, when graph is hidden"""
+
+        self.__jobs.cancel(self.__name)
+        self.__waiting = False
+        self.__pending = None
+
+    def __flush(self) -> None:
+        self.__waiting = False
+        if self.__pending is not None:
+            __index, self.__pending = self.__pending, None
+            self.show(__index)
+
+    def __on_leave(self, event) -> None:
+        self.__pending = None
+        self.show(self.__pinned)
+
+
+#====================================================| Dashboard |====================================================
+class Dashboard(tk.Toplevel):
+    """Compact tiles of current weather of many cities at once (./assets/dashboard.txt, one city per line).
+    Cities are fetched at the same time by a few workers, each call waits for the rate limit of API host,
+    and refreshes are staggered over the refresh interval, so all cities never hit the API at the same time."""
+
+    COLUMNS = 6
+    WORKERS = 6
+    REFRESH = 300000            # milli seconds between refreshes of a city
+    IMAGE_SIZE = (56, 56)
+    ERRORS = {1 : "No Internet", 2 : "Not responding", 3 : "City not found"}
+    hidden = False
+
+    def __init__(self, app : "WeatherApp", cities : list[str]):
+        super().__init__(app, bg="cyan")
+        self.title(f"Weather Dashboard ({len(cities)} cities)")
+        self.wm_iconbitmap(app.icon)
+        self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.app = app
+        self.jobs = Scheduler(self)
+        self.fetcher = FetchEngine(self.jobs, self, workers=self.WORKERS)
+        self.fetching = set()
+        # own cache and share of API calls, kept by the app while dashboard is closed
+        if app.dashboard_client is None:
+            app.dashboard_client = WeatherCore.background_client(len(cities), pool_size=self.WORKERS)
+        app.dashboard_client.cache.maxsize = 2 * len(cities)
+        # { city : (WeatherCore of city, widgets of tile) }
+        self.tiles = {city : (WeatherCore(app.weather.unit, app.dashboard_client), self.make_tile(i, city))
+                      for i, city in enumerate(cities)}
+
+        for i, city in enumerate(cities):
+            self.fetch(city)
+            # i-th city refreshes i/n of the interval later than the first one
+            self.jobs.every(f"refresh {city}", self.REFRESH, lambda city=city: self.fetch(city),
+                            delay=self.REFRESH + self.REFRESH * i // len(cities))
+
+        # refreshes are held while dashboard is minimized or covered
+        for sequence in ("<Map>", "<Unmap>", "<Visibility>"):
+            self.bind(sequence, self.visibility_changed, add="+")
+
+    def make_tile(self, index : int, city : str) -> dict[str, tk.Widget]:
+        """Make empty tile of city in the grid of tiles"""
+
+        __frame = tk.Frame(self, bg="cyan", bd=1, relief="solid", width=190, height=150)
+        __frame.grid(row=index // self.COLUMNS, column=index % self.COLUMNS, padx=4, pady=4)
+        __frame.grid_propagate(False)
+        __frame.columnconfigure(0, weight=1)
+
+        __tile = {"Frame" : __frame,
+                  "City" : tk.Label(__frame, text=city.title(), font=("Tahoma", 12, "bold"), bg="cyan"),
+                  "Image" : tk.Label(__frame, bg="cyan"),
+                  "Temp" : tk.Label(__frame, text="Loading...", font=("Tahoma", 14, "bold"), bg="cyan"),
+                  "Name" : tk.Label(__frame, font=("Tahoma", 10), bg="cyan"),
+                  "Status" : tk.Label(__frame, font=("Tahoma", 9, "italic"), bg="cyan")}
+        __tile["City"].grid(row=0, column=0, columnspan=2, sticky="we")
+        __tile["Image"].grid(row=1, column=0, rowspan=2)
+        __tile["Temp"].grid(row=1, column=1, sticky="w")
+        __tile["Name"].grid(row=2, column=1, sticky="w")
+        __tile["Status"].grid(row=3, column=0, columnspan=2, sticky="we")
+        return __tile
+
+    def fetch(self, city : str) -> None:
+        """Fetch weather of city in background, unless it is still being fetched"""
+
+        if city in self.fetching:
+            return
+        self.fetching.add(city)
+        __core = self.tiles[city][0]
+        self.fetcher.submit(__core.fetch_forecast, city, callback=lambda result: self.show(city, result),
+        error=lambda e: self.show(city, (e, None, None)))
+
+    def show(self, city : str, result : tuple[int | Exception, dict | None, dict | None]) -> None:
+        """Show fetched weather in tile of city, keep old weather if fetch failed"""
+
+        self.fetching.discard(city)
+        __core, __tile = self.tiles[city]
+        __exit_code, __current_json, __forecast_json = result
+        if __exit_code == 0:
+            __exit_code = __core.set_forecast(__current_json, __forecast_json)
+        if __exit_code != 0:
+            __tile["Status"].configure(text=self.ERRORS.get(__exit_code, "Error, retrying later"))
+            return
 
-        __week_temps = []
-        for __day in self._seven_days_weather["daily"][1:]:
+        __core.unit = self.app.weather.unit
+        __details = __core.current_weather_details()
+        __bg = __details["bg color"]
 
-            __date = datetime.datetime.fromtimestamp(__day["dt"]).strftime("%d %b' %y")
-            __temp = round(__day["temp"]["day"], 2)
-            __day_temp = round(__day["temp"]["day"], 2)
-            __night_temp = round(__day["temp"]["night"], 2)
-            __weather_name = __day["weather"][0]["main"]
-            __weather_des = __day["weather"][0]["description"]
+        for widget in __tile.values():
+            widget.configure(bg=__bg)
+        __tile["City"].configure(text=f'{__details["City"]}, {__details["Country"]}')
+        __tile["Image"].configure(image=self.app.icons.get(__details["Image"], self.IMAGE_SIZE))
+        __tile["Temp"].configure(text=f'{__details["Temp"]}°{__core.unit.lower()}')
+        __tile["Name"].configure(text=f'{__details["Name"]}\n{__details["Min"]}° / {__details["Max"]}°')
+        __tile["Status"].configure(text=f'Updated {__details["Time"].lower()}')
 
-            __day_set = {"Date" : __date, "Temp" : __temp, "Day:" : __day_temp,
-            "Night:" : __night_temp, "Name" : __weather_name, "Description" : __weather_des}
-            
-            __week_temps.append(__day_set)
-        
-        return __week_temps
+    def visibility_changed(self, event : tk.Event) -> None:
+        """Hold refreshes of cities while dashboard is hidden, cities due meanwhile are fetched once it is shown"""
+
+        if (event.widget is not self) or (window_hidden(event)==self.hidden):
+            return
+        self.hidden = window_hidden(event)
+        if self.hidden:
+            self.jobs.pause([f"refresh {city}" for city in self.tiles])
+        else:
+            self.jobs.resume()
+
+    def close(self) -> None:
+        self.jobs.cancel_all()
+        self.fetcher.stop()
+        self.app.dashboard = None
+        self.destroy()
 
 
 #====================================================| Initializes Tkinter Window |====================================================
-class WeatherApp(tk.Tk, WeekForecast):
+class WeatherApp(tk.Tk):
 
     start = True
     first_time = True
+    # graphs are made at first weather shown in expand view, normal view can't show them
+    graphs = False
     state = "active"
+    dashboard = None
+    dashboard_client = None
+    # city of shown weather, None till any weather is shown
+    weather_city = None
+    # jobs held while window is minimized or covered, see visibility_changed()
+    hidden = False
+    hidden_jobs = ("refresh", "clock", "timings", "retry")
+    # a location in settings which timed out is verified again this many times, 10 seconds apart
+    VERIFY_RETRIES = 2
+    # WEATHER_TIMINGS=1 prints timings of every stage after each search and refresh
+    print_timings = bool(os.environ.get("WEATHER_TIMINGS"))
     with  open("./assets/location.txt") as l:
         default_city = l.read()
 
@@ -220,45 +496,6 @@ class WeatherApp(tk.Tk, WeekForecast):
         default_view = v.read()
     view = default_view
 
-    # images names : [weather name, weather description]
-    weather_images = {
-        "./assets/sunny.png" : ["Clear", "clear sky"],      # 01d, 01n
-
-        "./assets/clear_sky.png" : ["Clouds", "few clouds"],      # 02d, 02n
-
-        "./assets/cloudy.png" : ["Clouds", "scattered clouds", "broken clouds", "overcast clouds"],      # 03d, 03n, 04d, 04n
-
-        "./assets/foggy.png" : ["Mist", "Smoke", "smoke", "Haze", "haze", "Fog", "mist", "fog"],     # 50d, 50n
-
-        "./assets/snow.png" : ["Snow", "freezing rain", "light snow", "Heavy snow", "Steet", "Light shower sleet",
-        "Shower sleet", "Light rain and snow", "Rain and snow", "Light shower snow", "Shower snow", "Heavy shower snow", "rain and snow"],    # 13d, 13n
-
-        "./assets/windy.png" : ["Dust", "sand/ dust whirls", "Sand", "sand", "dust", "Ash", "Squall", "squalls", "Tornado", "tornado"],     # 50d, 50n
-
-        "./assets/rainy.png" : ["Drizzle", "light intensity drizzle", "drizzle", "heavy intensity drizzle",
-        "light intensity drizzle rain", "drizzle rain", "heavy intensity drizzle rain", "shower rain and drizzle",
-        "heavy shower rain and drizzle", "shower drizzle", "Rain", "light rain", "moderate rain", "heavy intensity rain",
-        "very heavy rain", "extreme rain", "light intensity shower rain", "shower rain", "heavy intensity shower rain", "ragged shower rain"],     # 09d, 09n, 10d, 10n
-
-        "./assets/thunderstorm.png" : ["Thunderstorm", "thunderstorm with light rain", "thunderstorm with rain",
-        "thunderstorm with heavy rain", "light thunderstorm", "thunderstorm", "thunderstorm", "heavy thunderstorm",
-        "ragged thunderstorm", "thunderstorm with light drizzle", "thunderstorm with drizzle", "thunderstorm with heavy drizzle"]      # 11d, 11n
-    }
-    
-    # Images name :   ( [ (Current ipadx, ipday Image frame)      (Week ipadx day frame, pady image frame)  ],
-    #                   [ (current image width, height),           (week image width, height)               ],
-    #                   [ Day Color header/current/week weather/extras, inner/current/week graph            ],
-    #                   [ Night Color header/current/week weather/extras, inner/current/week graph          ]   )
-    images_config = {   "./assets/sunny.png"        : ( [(10,  0), ( 9,  0)],  [(160, 160), ( 85,  80)], ["#F5B041", "#FFE082"], ["#55555D", "#929297"] ),
-                        "./assets/clear_sky.png"    : ( [(10,  0), (10,  0)],  [(160, 120), ( 80,  80)], ["#03A9F4", "#81D4FA"], ["#21618C", "#2980B9"] ),
-                        "./assets/cloudy.png"       : ( [(15,  5), ( 8,  5)],  [(130, 130), ( 90,  70)], ["#308DA5", "#87ceeb"], ["#308DA5", "#87ceeb"] ),
-                        "./assets/foggy.png"        : ( [( 5, 10), (10,  5)],  [(170, 110), (110,  70)], ["#48C9B0", "#A3E4D7"], ["#E3915C", "#EDBB99"] ),
-                        "./assets/snow.png"         : ( [(15,  5), (13,  0)],  [(160, 140), ( 90,  80)], ["#00BCD4", "#80DEEA"], ["#00BCD4", "#80DEEA"] ),
-                        "./assets/windy.png"        : ( [( 0,  5), (10,  0)],  [(160, 145), (100,  80)], ["#34495E", "#AEB6BF"], ["#34495E", "#AEB6BF"] ),
-                        "./assets/rainy.png"        : ( [(15,  0), ( 8,  0)],  [(160, 150), ( 80,  80)], ["#1976D2", "#64B5F6"], ["#1976D2", "#64B5F6"] ),
-                        "./assets/thunderstorm.png" : ( [( 0,  0), ( 0,  1)],  [(160, 150), (100,  80)], ["#2980B9", "#7FB3D5"], ["#2980B9", "#7FB3D5"] )
-                      }
-
     def __init__(self):
         super().__init__()
         self.title("Weather App")
@@ -278,125 +515,219 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.maxsize(width=self.width, height=self.height)
         self.resizable(False, False)
 
+        self.weather = WeatherCore()
+        # hourly forecast is only for graph of current day, shown in expand view
+        self.weather.fetch_hourly = (self.view=="expand")
+        self.jobs = Scheduler(self)
+        self.icons = IconCache(self, self.weather.timings)
+        # current weather (day / night) and week forecast images of every weather, decoded in background
+        self.icons.preload([(path.replace("/assets/", f"/assets/{time}/"), size)
+                            for path, config in self.weather.images_config.items() for time in ("day", "night") for size in config[1]])
+        self.fetcher = FetchEngine(self.jobs, self)
+        self.searching = False      # a search is being fetched
+        # number of refresh being fetched, None if none or if a search superseded it (see temp_update())
+        self.updating = None
+        self.refreshes = 0
+        # fetch_hourly when weather being fetched was asked for, see hourly_missing()
+        self.hourly_asked = False
+        self.stale = False
+        # refreshes in a row which brought nothing new, they space out next ones (see WeatherCore.next_refresh())
+        self.unchanged = 0
+        self.timings_label = None
+        # colors of search bar till first weather is shown
+        self.CW = {"bg color" : "cyan", "light color" : "cyan"}
+        # { widget : { (layout, option) : value } } last rendered by render()
+        self.rendered = weakref.WeakKeyDictionary()
         self.Search_Frame()
+        # refresh and clock are held while minimized or covered, and catch up as soon as window is shown again
+        for sequence in ("<Map>", "<Unmap>", "<Visibility>"):
+            self.bind(sequence, self.visibility_changed, add="+")
+        self.show_cached(self.default_city)
         self.Search_Weather()
 
 
     def Search_Frame(self) -> None:
         """--------------------------| Search Frame |--------------------------
         Search frame includes, search entry, search, view, info, settings buttons
-        Layout of search frame changes according to view button.
+        Layout of search frame changes according to view button: a search bar is made for each view,
+        the other one at first switch, and switch_layout swaps them (see show_search_bar()).
         """
 
-        self.Sframe = tk.Frame(self, bg="cyan")
+        # entry text, shared by search bars of both views
+        self.city = tk.StringVar()
+        self.search_bars = {}
+        self.shown_bar = None
+        self.show_search_bar(self.view)
+
+        self.change_button_state()
+
+        self.city_entry.insert(0, self.default_city)
+        #--------------------| Bindings |--------------------
+        try:        # In Some systems it throws ERROR, maybe / not bind
+            self.bind_all("</>", lambda e: (self.city_entry.focus(), self.city_entry.select_range(0, tk.END),
+            self.city_entry.configure(bg=self.CW["light color"])))
+        except tk.TclError:
+            pass
+
+        self.bind_all("<Control-s>", lambda e: self.search.invoke())
+        self.bind_all("<Control-S>", lambda e: self.search.invoke())
+        self.bind_all("<Control-i>", lambda e: self.settings_button.invoke())
+        self.bind_all("<Control-I>", lambda e: self.settings_button.invoke())
+        self.bind_all("<Control-v>", lambda e: self.view_button.invoke())
+        self.bind_all("<Control-V>", lambda e: self.view_button.invoke())
+        self.bind_all("<F9>", lambda e: self.info())
+        self.bind_all("<F10>", self.toggle_timings)
+        self.bind_all("<Control-d>", self.open_dashboard)
+        self.bind_all("<Control-D>", self.open_dashboard)
+
+        self.temp = tk.Label(self, text="Loading...", font=("Tahoma", 18, "bold"), justify="center", bg="cyan")
+        self.temp.pack(side="left", fill="both", ipadx=self.width//2)
+        self.update()
+
+
+    def make_search_bar(self, view : str) -> dict[str, tk.Widget | None]:
+        """Make search bar of view (normal / expand), with its images in their sizes, not packed.
+        return:
+            { attribute name : widget }, open_weather is None in normal view"""
+
+        __bg = self.CW["bg color"]
+        __frame = tk.Frame(self, bg=__bg)
         #===============================| Normal |=====================================
-        if self.view=="normal":
+        if view=="normal":
             #----------| Search Area Frame |----------
-
-            self.sep_1st = tk.Label(self.Sframe, bg="cyan")
-            self.sep_1st.grid(row=0, column=0, ipadx=110)
+            __sep_1st = tk.Label(__frame, bg=__bg)
+            __sep_1st.grid(row=0, column=0, ipadx=110)
 
             #--------------------| Entry Field |--------------------
-            self.city = tk.StringVar()
-            self.city_entry = tk.Entry(self.Sframe, text=self.city, font=("Tahoma", 16, "bold"),
-            bd=2, relief="flat", width=15, justify="center", bg="cyan")
-            self.city_entry.grid(row=0, column=1, sticky="NE", ipady=3)
+            __entry = tk.Entry(__frame, text=self.city, font=("Tahoma", 16, "bold"),
+            bd=2, relief="flat", width=15, justify="center", bg=__bg)
+            __entry.grid(row=0, column=1, sticky="NE", ipady=3)
 
             #--------------------| Search Button |--------------------
-            self.search_img = ImageTk.PhotoImage(Image.open("./assets/search.png").resize((30, 31)))
-            self.search = tk.Button(self.Sframe, image=self.search_img, bg="cyan",
+            __search = tk.Button(__frame, image=self.icons.get("./assets/search.png", (30, 31)), bg=__bg,
             relief="flat", overrelief="solid", command=self.Search_Weather)
-            self.search.grid(row=0, column=2)
+            __search.grid(row=0, column=2)
 
-            self.sep_2nd = tk.Label(self.Sframe, bg="cyan")
-            self.sep_2nd.grid(row=0, column=3, ipadx=50)
+            __sep_2nd = tk.Label(__frame, bg=__bg)
+            __sep_2nd.grid(row=0, column=3, ipadx=50)
 
             #----------| ▼ Expand / ▲ Normal View Button |----------
-            self.view_img = ImageTk.PhotoImage(Image.open("./assets/downarrowhead.png").resize((20, 20)))
-            self.view_button = tk.Button(self.Sframe, image=self.view_img, relief="flat", overrelief="solid",
-            bg="cyan", command=self.switch_layout)
-            self.view_button.grid(row=0, column=4, ipadx=5, ipady=5)
+            __view = tk.Button(__frame, image=self.icons.get("./assets/downarrowhead.png", (20, 20)), relief="flat",
+            overrelief="solid", bg=__bg, command=self.switch_layout)
+            __view.grid(row=0, column=4, ipadx=5, ipady=5)
 
             #--------------------| Info Button |--------------------
-            self.info_img = ImageTk.PhotoImage(Image.open("./assets/info.png").resize((30, 30)))
-            self.info_button = tk.Button(self.Sframe, image=self.info_img, relief="flat", overrelief="solid",
-            bg="cyan", command=self.info)
-            self.info_button.grid(row=0, column=5, padx=10, ipady=0)
+            __info = tk.Button(__frame, image=self.icons.get("./assets/info.png", (30, 30)), relief="flat",
+            overrelief="solid", bg=__bg, command=self.info)
+            __info.grid(row=0, column=5, padx=10, ipady=0)
 
             #--------------------| Settings Button |--------------------
-            self.settings_img = ImageTk.PhotoImage(Image.open("./assets/settings.png").resize((25, 26)))
-            self.settings_button = tk.Button(self.Sframe, image=self.settings_img, relief="flat",
-            overrelief="solid", bg="cyan", command=self.settings)
-            self.settings_button.grid(row=0, column=6, ipadx=2, ipady=2)
-            self.Sframe.pack(anchor="n", side="top", fill="x", ipady=1)
+            __settings = tk.Button(__frame, image=self.icons.get("./assets/settings.png", (25, 26)), relief="flat",
+            overrelief="solid", bg=__bg, command=self.settings)
+            __settings.grid(row=0, column=6, ipadx=2, ipady=2)
+            __open_weather = None
 
         else:   #===============================| Expand |=====================================
             #----------| Search Area Frame |----------
-            self.sep_1st = tk.Label(self.Sframe, bg="cyan")
-            self.sep_1st.grid(row=0, column=0, ipadx=360)
+            __sep_1st = tk.Label(__frame, bg=__bg)
+            __sep_1st.grid(row=0, column=0, ipadx=360)
 
             #--------------------| Entry Field |--------------------
-            self.city = tk.StringVar()
-            self.city_entry = tk.Entry(self.Sframe, text=self.city, font=("Tahoma", 18, "bold"),
-            bd=2, relief="flat", width=20, justify="center", bg="cyan")
-            self.city_entry.grid(row=0, column=1, sticky="NE", ipady=5)
+            __entry = tk.Entry(__frame, text=self.city, font=("Tahoma", 18, "bold"),
+            bd=2, relief="flat", width=20, justify="center", bg=__bg)
+            __entry.grid(row=0, column=1, sticky="NE", ipady=5)
 
             #--------------------| Search Button |--------------------
-            self.search_img = ImageTk.PhotoImage(Image.open("./assets/search.png").resize((38, 38)))
-            self.search = tk.Button(self.Sframe, image=self.search_img, relief="flat",
-            overrelief="solid", command=self.Search_Weather)
-            self.search.grid(row=0, column=2)
+            __search = tk.Button(__frame, image=self.icons.get("./assets/search.png", (38, 38)), bg=__bg,
+            relief="flat", overrelief="solid", command=self.Search_Weather)
+            __search.grid(row=0, column=2)
 
-            self.sep_2nd = tk.Label(self.Sframe, bg="cyan")
-            self.sep_2nd.grid(row=0, column=3, ipadx=180)
+            __sep_2nd = tk.Label(__frame, bg=__bg)
+            __sep_2nd.grid(row=0, column=3, ipadx=180)
 
             #----------| ▼ Expand / ▲ Normal View Button |----------
-            self.view_img = ImageTk.PhotoImage(Image.open("./assets/uparrowhead.png").resize((26, 26)))
-            self.view_button = tk.Button(self.Sframe, image=self.view_img, bg="cyan",
+            __view = tk.Button(__frame, image=self.icons.get("./assets/uparrowhead.png", (26, 26)), bg=__bg,
             relief="flat", overrelief="solid", command=self.switch_layout)
-            self.view_button.grid(row=0, column=4, ipadx=5, ipady=6)
+            __view.grid(row=0, column=4, ipadx=5, ipady=6)
 
             #--------------------| Info Button |--------------------
-            self.info_img = ImageTk.PhotoImage(Image.open("./assets/info.png").resize((36, 36)))
-            self.info_button = tk.Button(self.Sframe, image=self.info_img, bg="cyan",
+            __info = tk.Button(__frame, image=self.icons.get("./assets/info.png", (36, 36)), bg=__bg,
             relief="flat", overrelief="solid", command=self.info)
-            self.info_button.grid(row=0, column=5, ipady=1, padx=18)
+            __info.grid(row=0, column=5, ipady=1, padx=18)
 
             #--------------------| Settings Button |--------------------
-            self.settings_img = ImageTk.PhotoImage(Image.open("./assets/settings.png").resize((30, 30)))
-            self.settings_button = tk.Button(self.Sframe, image=self.settings_img, bg="cyan",
+            __settings = tk.Button(__frame, image=self.icons.get("./assets/settings.png", (30, 30)), bg=__bg,
             relief="flat", overrelief="solid", command=self.settings)
-            self.settings_button.grid(row=0, column=6, ipadx=2, ipady=4)
+            __settings.grid(row=0, column=6, ipadx=2, ipady=4)
 
             #--------------------| Open Weather App Link |--------------------
-            self.open_WImg = ImageTk.PhotoImage(Image.open("./assets/open_weather_logo.png").resize((100, 38)))
-            self.open_weather = tk.Button(self.Sframe, image=self.open_WImg, bg="cyan",
-            relief="flat", overrelief="solid", command=self.open_weather_link)
-            self.open_weather.grid(row=0, column=7, ipadx=5, padx=10)
-            self.Sframe.pack(anchor="n", side="top", fill="x", ipady=2)
+            __open_weather = tk.Button(__frame, image=self.icons.get("./assets/open_weather_logo.png", (100, 38)),
+            bg=__bg, relief="flat", overrelief="solid", command=self.open_weather_link)
+            __open_weather.grid(row=0, column=7, ipadx=5, padx=10)
 
-        self.change_button_state()
+        #--------------------| Refreshing status |--------------------
+        __refresh = tk.Label(__frame, text="Refreshing...", font=("Tahoma", 12, "italic"), bg=__bg)
 
-        self.city_entry.insert(0, self.default_city)
         #--------------------| Bindings |--------------------
-        self.city_entry.bind("<KeyRelease>", lambda e: self.city.set(self.city.get().upper()))
-        self.city_entry.bind("<Return>", self.Search_Weather)
-        self.search.bind("<Return>", self.Search_Weather)
-        try:        # In Some systems it throws ERROR, maybe / not bind
-            self.bind_all("</>", lambda e: (self.city_entry.focus(), self.city_entry.select_range(0, tk.END)))
-        except tk.TclError:
-            pass
-        self.bind_all("<Control-s>", lambda e: self.search.invoke())
-        self.bind_all("<Control-S>", lambda e: self.search.invoke())
-        self.bind_all("<Control-i>", lambda e: self.settings_button.invoke())
-        self.bind_all("<Control-I>", lambda e: self.settings_button.invoke())
-        self.bind_all("<Control-v>", lambda e: self.view_button.invoke())
-        self.bind_all("<Control-V>", lambda e: self.view_button.invoke())
-        self.bind_all("<F9>", lambda e: self.info())
+        __entry.bind("<KeyRelease>", lambda e: self.city.set(self.city.get().upper()))
+        __entry.bind("<Return>", self.Search_Weather)
+        __search.bind("<Return>", self.Search_Weather)
+        # bound once, colors of current weather are read from self.CW when mouse comes
+        __entry.bind("<Enter>", lambda e: __entry.configure(relief="solid", bg=self.CW["light color"]))
+        __entry.bind("<Leave>", lambda e: __entry.configure(relief="flat", bg=self.CW["bg color"]))
+        __entry.bind("<FocusOut>", lambda e: __entry.configure(bg=self.CW["bg color"]))
+        for button in (__search, __view, __info, __settings, __open_weather):
+            if button is not None:
+                self.bind_hover(button)
+
+        return {"Sframe" : __frame, "sep_1st" : __sep_1st, "city_entry" : __entry, "search" : __search,
+                "sep_2nd" : __sep_2nd, "view_button" : __view, "info_button" : __info,
+                "settings_button" : __settings, "open_weather" : __open_weather, "refresh_label" : __refresh}
+
+
+    def show_search_bar(self, view : str) -> None:
+        """Show search bar of view in place of shown one. Each bar is made at its first use and kept,
+        so a switch packs the other frame, with no widget or image made and nothing re-gridded."""
+
+        __bar = self.search_bars.get(view)
+        if __bar is None:
+            __bar = self.search_bars[view] = self.make_search_bar(view)
+
+        __old = self.shown_bar
+        if __old is None:
+            __bar["Sframe"].pack(anchor="n", side="top", fill="x", ipady=2 if view=="expand" else 1)
+        else:
+            __focused = (self.focus_get() is __old["city_entry"])
+            __refreshing = bool(__old["refresh_label"].place_info())
+            __bar["Sframe"].pack(anchor="n", side="top", fill="x", ipady=2 if view=="expand" else 1, before=__old["Sframe"])
+            __old["Sframe"].pack_forget()
+            __old["refresh_label"].place_forget()
+
+        self.shown_bar = __bar
+        for name, widget in __bar.items():
+            setattr(self, name, widget)
+
+        if __old is not None:
+            self.search_bar_colors()
+            self.refreshing(__refreshing)
+            if __focused:
+                self.city_entry.focus()
+
+
+    def search_bar_colors(self) -> None:
+        """Colors of current weather in shown search bar"""
+
+        self.render(self.Sframe, bg=self.CW["bg color"])
+        self.render(self.sep_1st, bg=self.CW["bg color"])
+        self.render(self.city_entry, bg=self.CW["bg color"])
+        self.render(self.search, bg=self.CW["bg color"], activebackground=self.CW["light color"])
+        self.render(self.sep_2nd, bg=self.CW["bg color"])
+        self.render(self.view_button, bg=self.CW["bg color"], activebackground=self.CW["light color"])
+        self.render(self.info_button, bg=self.CW["bg color"], activebackground=self.CW["light color"])
+        self.render(self.settings_button, bg=self.CW["bg color"], activebackground=self.CW["light color"])
+        if self.open_weather is not None:
+            self.render(self.open_weather, bg=self.CW["bg color"], activebackground=self.CW["light color"])
 
-        self.temp = tk.Label(self, text="Loading...", font=("Tahoma", 18, "bold"), justify="center", bg="cyan")
-        self.temp.pack(side="left", fill="both", ipadx=self.width//2)
-        self.update()
 
     def Weather_Frames(self) -> None:
         """Make weather main frames with separators in the window and return them:
@@ -427,57 +758,13 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.update()
 
 
-    def current_weather_details(self) -> dict[str, int | float | str]:
-        """--------------------------| Current Weather Details |--------------------------
-        It will make a Dictionary which holds, all values required in current temperature details.
-        Image path, Image pady, Frame ipadx, Image size, bg color."""
-        current_temp, current_feels, current_temp_name, current_temp_des, current_humid, current_visibility = self.current_weather()
-
-        today_min, today_max = self.today_min_max_temp()
-        current_time, current_date = self.current_time()
-
-        _, _, current_city, _, current_country, current_region, current_time_zone, _ = self.location_details()
-
-        current_sunrise, current_sunset = self.current_sun_time()
-        current_moonrise, current_moonset = self.current_moon_time()
-
-        for i in self.weather_images:
-            if (current_temp_name in self.weather_images[i]) and (current_temp_des in self.weather_images[i]):
-                current_image = i
-
-                break
-        raw_path = current_image.split("/")
-        
-        # If Time comes b/w sunrise and sunset
-        if datetime.datetime.strptime(current_sunrise, "%I:%M %p")\
-            <= datetime.datetime.strptime(current_time, "%I:%M %p") <= datetime.datetime.strptime(current_sunset, "%I:%M %p"):
-            raw_path.insert(2, "day")       # add day image
-            bg_img = self.images_config[current_image][2][0]
-            fg_img = self.images_config[current_image][2][1]
-        else:   # else add night image
-            raw_path.insert(2, "night")
-            bg_img = self.images_config[current_image][3][0]
-            fg_img = self.images_config[current_image][3][1]
-
-        current_exact_image = '/'.join(raw_path)
-
-        current_details = { "Image" : current_exact_image, "bg color" : bg_img,
-        "light color" : fg_img, "Image size" : self.images_config[current_image][1][0],
-        "ipadx" : self.images_config[current_image][0][0][0], "ipady" : self.images_config[current_image][0][0][1],
-        "Temp" : current_temp, "Feels" : current_feels, "Name" : current_temp_name,
-        "Humidity" : current_humid, "Visibility" : current_visibility, "Min" : today_min, "Max" : today_max,
-        "Time" : current_time, "Date" : current_date, "City" : current_city, "Country" : current_country,
-        "Region" : current_region, "Time zone" : current_time_zone, "Sunrise" : current_sunrise,
-        "Sunset" : current_sunset, "Moonrise" : current_moonrise, "Moonset" : current_moonset }
-        return current_details
-
     def CW_Frame(self) -> None:
         """--------------------------| Current Weather Frame |--------------------------
         Make Current Weather Frame which includes:
         -> If Normal view   -> current weather image, weather, time, timezone, location, date, min, max, humidity
         -> If Detailed view -> all of Normal view"""
         self.temp.destroy()
-        self.CW = self.current_weather_details()
+        self.CW = self.weather.current_weather_details()
         self.Sframe.configure(bg=self.CW["bg color"])
         self.sep_1st.configure(bg=self.CW["bg color"])
         self.sep_2nd.configure(bg=self.CW["bg color"])
@@ -494,7 +781,7 @@ class WeatherApp(tk.Tk, WeekForecast):
         labelanchor="s", relief="flat", bg=self.CW["bg color"])
 
         #-----| Image |-----
-        self.CImg = ImageTk.PhotoImage(Image.open(self.CW["Image"]).resize(self.CW["Image size"]))
+        self.CImg = self.icons.get(self.CW["Image"], self.CW["Image size"])
         self.cw_img = tk.Label(master=self.cw_img_frame, image=self.CImg, bg=self.CW["bg color"])
         self.cw_img.pack()
 
@@ -504,12 +791,12 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.cwd_frame = tk.Frame(self.CW_main, bg=self.CW["bg color"])
         #-----| Temperature |-----
         if (self.CW["Temp"] < 0) and (len(str(self.CW["Temp"]))==5):
-            self.ctemp = f' -{str(self.CW["Temp"])[1:]}°{self._unit.lower()}'
+            self.ctemp = f' -{str(self.CW["Temp"])[1:]}°{self.weather.unit.lower()}'
 
         elif len(str(self.CW["Temp"]))==4:
-            self.ctemp = f' {str(self.CW["Temp"])}°{self._unit.lower()}'
+            self.ctemp = f' {str(self.CW["Temp"])}°{self.weather.unit.lower()}'
 
-        else:   self.ctemp = f' {str(self.CW["Temp"])}°{self._unit.lower()}'
+        else:   self.ctemp = f' {str(self.CW["Temp"])}°{self.weather.unit.lower()}'
 
         self.CTemp = tk.Label(self.cwd_frame, text=self.ctemp, font=("Tahoma", 60), bg=self.CW["bg color"])
         self.CTemp.grid(row=0, column=0, rowspan=3, sticky="se")
@@ -523,17 +810,17 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.CDate.grid(row=1, column=3, rowspan=2, sticky="n")
 
         #-----| Feel Like |-----
-        self.Cfeels = tk.Label(self.cwd_frame, text=f"Feels like:{self.CW['Feels']:>9}°{self._unit.lower()}",
+        self.Cfeels = tk.Label(self.cwd_frame, text=f"Feels like:{self.CW['Feels']:>9}°{self.weather.unit.lower()}",
         font=("Tahoma", 18), bg=self.CW["bg color"])
         self.Cfeels.grid(row=3, column=0, columnspan=2, sticky="nswe")
 
         #-----| Minimum |-----
-        self.CMin = tk.Label(self.cwd_frame, text=f"Min:\t{self.CW['Min']:>8}°{self._unit.lower()}",
+        self.CMin = tk.Label(self.cwd_frame, text=f"Min:\t{self.CW['Min']:>8}°{self.weather.unit.lower()}",
         font=("Tahoma", 18), bg=self.CW["bg color"])
         self.CMin.grid(row=4, column=0, columnspan=2, sticky="nswe")
 
         #-----| Maximum |-----
-        self.CMax = tk.Label(self.cwd_frame, text=f"Max:\t{self.CW['Max']:>8}°{self._unit.lower()}",
+        self.CMax = tk.Label(self.cwd_frame, text=f"Max:\t{self.CW['Max']:>8}°{self.weather.unit.lower()}",
         font=("Tahoma", 18), bg=self.CW["bg color"])
         self.CMax.grid(row=5, column=0, columnspan=2, sticky="nswe")
 
@@ -572,7 +859,7 @@ class WeatherApp(tk.Tk, WeekForecast):
         #--------------------| Sunrise |--------------------
         self.CSR = tk.Label(self.CW_more, text="  Sunrise", font=("Tahoma", 16), bg=self.CW["bg color"], justify="left")
         self.CSR.grid(row=0, column=0, sticky="ne")
-        self.CSR_img = ImageTk.PhotoImage(Image.open("./assets/sunrise.png").resize((30, 30)))
+        self.CSR_img = self.icons.get("./assets/sunrise.png", (30, 30))
         self.CSR_logo = tk.Label(self.CW_more, image=self.CSR_img, bg=self.CW["bg color"])
         self.CSR_logo.grid(row=0, column=1, sticky="nw")
         self.CSR_time = tk.Label(self.CW_more, text=f'{self.CW["Sunrise"].lower():>12}', font=("Tahoma", 16),
@@ -582,7 +869,7 @@ class WeatherApp(tk.Tk, WeekForecast):
         #--------------------| Sunset |--------------------
         self.CSS = tk.Label(self.CW_more, text="\tSunset", font=("Tahoma", 16), bg=self.CW["bg color"])
         self.CSS.grid(row=0, column=3, sticky="ne")
-        self.CSS_img = ImageTk.PhotoImage(Image.open("./assets/sunset.png").resize((35, 25)))
+        self.CSS_img = self.icons.get("./assets/sunset.png", (35, 25))
         self.CSS_logo = tk.Label(self.CW_more, image=self.CSS_img, bg=self.CW["bg color"])
         self.CSS_logo.grid(row=0, column=4, sticky="s")
         self.CSS_time = tk.Label(self.CW_more, text=f'{self.CW["Sunset"].lower():>12}', font=("Tahoma", 16),
@@ -592,7 +879,7 @@ class WeatherApp(tk.Tk, WeekForecast):
         #--------------------| Moonrise |--------------------
         self.CMR = tk.Label(self.CW_more, text="Moonrise", font=("Tahoma", 16), bg=self.CW["bg color"], justify="left")
         self.CMR.grid(row=1, column=0, sticky="ne")
-        self.CMR_img = ImageTk.PhotoImage(Image.open("./assets/moonrise.png").resize((30, 30)))
+        self.CMR_img = self.icons.get("./assets/moonrise.png", (30, 30))
         self.CMR_logo = tk.Label(self.CW_more, image=self.CMR_img, bg=self.CW["bg color"])
         self.CMR_logo.grid(row=1, column=1, sticky="nw")
         self.CMR_time = tk.Label(self.CW_more, text=f'{self.CW["Moonrise"].lower():>12}', font=("Tahoma", 16),
@@ -602,7 +889,7 @@ class WeatherApp(tk.Tk, WeekForecast):
         #--------------------| Moonset |--------------------
         self.CMS = tk.Label(self.CW_more, text="Moonset", font=("Tahoma", 16), bg=self.CW["bg color"], justify="left")
         self.CMS.grid(row=1, column=3, sticky="ne")
-        self.CMS_img = ImageTk.PhotoImage(Image.open("./assets/moonset.png").resize((35, 25)))
+        self.CMS_img = self.icons.get("./assets/moonset.png", (35, 25))
         self.CMS_logo = tk.Label(self.CW_more, image=self.CMS_img, bg=self.CW["bg color"])
         self.CMS_logo.grid(row=1, column=4, sticky="sw")
         self.CMS_time = tk.Label(self.CW_more, text=f'{self.CW["Moonset"].lower():>12}', font=("Tahoma", 16),
@@ -612,7 +899,7 @@ class WeatherApp(tk.Tk, WeekForecast):
         #--------------------| Humidity |--------------------
         self.CHumid = tk.Label(self.CW_more, text="Humidity", font=("Tahoma", 16), bg=self.CW["bg color"], justify="left")
         self.CHumid.grid(row=2, column=0, sticky="ne")
-        self.CHumid_img = ImageTk.PhotoImage(Image.open("./assets/humidity.png").resize((35, 25)))
+        self.CHumid_img = self.icons.get("./assets/humidity.png", (35, 25))
         self.CHumidity_logo = tk.Label(self.CW_more, image=self.CHumid_img, bg=self.CW["bg color"])
         self.CHumidity_logo.grid(row=2, column=1, sticky="nw")
         self.CHumid_mark = tk.Label(self.CW_more, text=f'{self.CW["Humidity"]:>6}%', font=("Tahoma", 16),
@@ -622,7 +909,7 @@ class WeatherApp(tk.Tk, WeekForecast):
         #--------------------| Weather Type Detail |--------------------
         self.CVisible = tk.Label(self.CW_more, text="Visibility", font=("Tahoma", 16), bg=self.CW["bg color"], justify="left")
         self.CVisible.grid(row=2, column=3, sticky="ne")
-        self.CVisible_img = ImageTk.PhotoImage(Image.open("./assets/visibility.png").resize((35, 25)))
+        self.CVisible_img = self.icons.get("./assets/visibility.png", (35, 25))
         self.CVisible_logo = tk.Label(self.CW_more, image=self.CVisible_img, bg=self.CW["bg color"])
         self.CVisible_logo.grid(row=2, column=4, sticky="sw")
         self.CVisible_mark = tk.Label(self.CW_more, text=f'{self.CW["Visibility"]/1000:>7} km',
@@ -634,102 +921,101 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.update()
 
 
-    def CW_show_temp(self, event) -> None:
-        """---------------------| Shows the Current selected point temp in graph |---------------------
-        It will call upon when mouse button is clicked on temperature line graph"""
-
-        Ccoord = []
-        Ccoord.append((event.xdata, event.ydata))
-        Cx = event.xdata
-        Cy = event.ydata
-        
-        # Setting the temperature based on axis
-        self.cw_annot.xy = (Cx, Cy)
-        try:
-            self.cw_annot.set_text(f"{self.temps[int(Cx)]}°{self._unit.lower()}")
-            self.cw_annot.set_visible(True)
-            self.cw_canvas.draw()
-        except TypeError:       # If mouse axis out of plotted area
-            pass
-
-    
     def CW_graph(self) -> None:
         """--------------------------| Current Day Temp Graph |--------------------------
-        Display the graph of current day, well-labelled"""
+        Make the graph of current day once, well-labelled.
+        Its values and colors are set by CW_graph_update() on every refresh."""
+
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
         #---------------------| Figure area for Graph |---------------------
         self.cw_fig = Figure(figsize=(7, 4.15), dpi=100, facecolor=self.CW["light color"], tight_layout={'h_pad' : 3, 'w_pad' : 0})
 
-        #---------------------| Data which display in Graph |---------------------
-        current_day_temp = self.current_day_temps()
-        self.hours = [h for h in current_day_temp.keys()]
-        self.temps = [t for t in current_day_temp.values()]
-
         #---------------------| Plotting Line Graph |---------------------
         self.cw_graph = self.cw_fig.add_subplot(111)
-        self.cw_graph.plot(self.hours, self.temps)
-        self.cw_graph.plot(self.hours, self.temps, color="black", linestyle="-", linewidth=3, marker="o", markersize=9, markerfacecolor=self.CW["bg color"])
+        self.cw_lines = self.cw_graph.plot([], [])
+        self.cw_lines += self.cw_graph.plot([], [], color="black", linestyle="-", linewidth=3, marker="o", markersize=9, markerfacecolor=self.CW["bg color"])
         self.cw_graph.set_title(label="Temperature from now to next 24 hours", fontdict={"fontfamily" : "Tahoma", "fontsize" : 16})
         self.cw_graph.set_facecolor(self.CW["light color"])
         self.cw_graph.spines["right"].set_visible(False)
         self.cw_graph.spines["top"].set_visible(False)
         self.cw_graph.spines["left"].set_visible(False)
 
-        #---------------------| Labels and ticks on X-axis |---------------------
-        self.x_ticks = ['\n'.join(i.split('\n')[1].split(' ')).lower() for i in self.hours]
-        self.cw_graph.set_xticks(self.hours)
-        self.cw_graph.set_xticklabels(labels=self.x_ticks, fontfamily="Tahoma", fontsize=11)
+        #---------------------| Label on X-axis |---------------------
         self.cw_graph.set_xlabel(xlabel="Time", fontfamily="Tahoma", fontsize=14)
 
         #---------------------| Label and no ticks on Y-axis |---------------------
         self.cw_graph.set_yticks([])
         
-        #---------------------| Cursor which spanes the axis when mouse moves over |---------------------
-        Cursor(ax=self.cw_graph, horizOn=False, vertOn=False, useblit=True, color = "r", linewidth = 1)
-
-        #---------------------| Annotated box on which clicked area temp. display |---------------------
-        self.cw_annot = self.cw_graph.annotate(text="", xy=(self.x_ticks[0], 0), xytext=(10, 20),
+        #---------------------| Annotated box of temp. of point under mouse or clicked |---------------------
+        self.cw_annot = self.cw_graph.annotate(text="", xy=(0, 0), xytext=(10, 20),
             textcoords="offset points", arrowprops={"arrowstyle" : "fancy"}, annotation_clip=True,
             bbox={"boxstyle" : "round, pad=0.5", "fc" : self.CW["light color"], "ec" : "black", "lw" : 2}, size=10 )
         self.cw_annot.set_visible(True)
 
         #---------------------| Canvas to place the Graph Figure |---------------------
+        self.cw_drawn = None
         self.cw_canvas = FigureCanvasTkAgg(self.cw_fig, master=self.current_stats)
-        self.cw_canvas.mpl_connect('button_press_event', self.CW_show_temp)
-        self.cw_canvas.draw()
+        # cursor line and temperature of point under mouse / clicked
+        self.cw_tooltip = GraphTooltip(self.cw_canvas, self.cw_graph, self.cw_annot, self.jobs, "cw_tooltip")
         self.cw_canvas.get_tk_widget().grid(row=2, column=0, sticky="nswe")
+        self.CW_graph_update()
+
+
+    def CW_graph_update(self) -> None:
+        """--------------------------| Update Current Day Temp Graph |--------------------------
+        Set new temperatures, ticks and colors in existing graph of current day and redraw it when idle."""
+
+        import numpy as np
+
+        #---------------------| Data which display in Graph |---------------------
+        self.hours, self.x_ticks, self.temps = self.weather.current_day_series()
+        hours_x = np.arange(len(self.temps))
+
+        # nothing to redraw if temperatures, ticks and colors are same as last drawn
+        __drawn = (tuple(self.x_ticks), self.temps.tobytes(), self.CW["bg color"], self.CW["light color"])
+        if __drawn==self.cw_drawn:
+            return
+        self.cw_drawn = __drawn
+
+        for line in self.cw_lines:
+            line.set_data(hours_x, self.temps)
+        self.cw_lines[-1].set_markerfacecolor(self.CW["bg color"])
+        self.cw_graph.relim(visible_only=True)
+        self.cw_graph.autoscale_view()
+
+        #---------------------| Ticks on X-axis |---------------------
+        self.cw_graph.set_xticks(hours_x)
+        self.cw_graph.set_xticklabels(labels=self.x_ticks, fontfamily="Tahoma", fontsize=11)
+        self.cw_tooltip.set_points(hours_x, self.temps, [f"{temp}°{self.weather.unit.lower()}" for temp in self.temps.tolist()])
+
+        #---------------------| Graph colors |---------------------
+        self.cw_fig.set_facecolor(self.CW["light color"])
+        self.cw_graph.set_facecolor(self.CW["light color"])
+        self.cw_annot.set_bbox({"boxstyle" : "round, pad=0.5", "fc" : self.CW["light color"], "ec" : "black", "lw" : 2})
+        self.cw_canvas.draw_idle()
 
     
-    def week_forecast_details(self) -> list[dict[str, int | float | str]]:
-        """--------------------------| Week Weather Forecast Details |--------------------------
-        It will make a list of dictionaries which holds, all values in seven_days_forecast() return dict
-        as well as some extra things:
-        Image path, Image pady, Frame ipadx, Image size, bg color"""
-
-        week_forecast = self.Seven_days_forecast()
-        raw_Wdetails = []
-        for i, day in enumerate(week_forecast):
-
-            #-----| Getting image according to weather |-----
-            for image, group in self.weather_images.items():
-                if (day["Name"] and day["Description"] in group):
-                    raw_path = image.split('/')
-                    img_path = "./" + raw_path[1] + "/day/" + raw_path[-1]
-                    break
-
-            Ipady = self.images_config[image][0][1][1]
-            Fipadx = self.images_config[image][0][1][0]
-            size = self.images_config[image][1][1]
-            color = self.CW["bg color"]
-
-            # storing all required details in a dict format
-            details = {**day, "Image" : img_path, "Image pady" : Ipady, "Frame ipadx" : Fipadx, "Image size" : size, "bg color" : color}
-            if not i:
-                details["Date"] = "Tomorrow"
-            
-            raw_Wdetails.append(details)
+    def update_graphs(self) -> None:
+        """Make both graphs at first use, then update them, only while expand view shows them
+        and once hourly forecast is fetched for graph of current day."""
 
-        return raw_Wdetails
+        if (self.view!="expand") or not self.weather.has_hourly():
+            return
+
+        if not self.graphs:
+            self.graphs = True
+            with self.weather.timings.timed("CW_graph"):
+                self.CW_graph()
+            with self.weather.timings.timed("WF_graph"):
+                self.WF_graph()
+            return
+
+        with self.weather.timings.timed("CW_graph_update"):
+            self.CW_graph_update()
+        with self.weather.timings.timed("WF_graph_update"):
+            self.WF_graph_update()
 
 
     def WF_Frame(self) -> None:
@@ -739,7 +1025,7 @@ class WeatherApp(tk.Tk, WeekForecast):
         -> Each Subframe will display the Date, Temperature, Day, night temp"""
 
         #----------| Week Weather Forecast Frame |----------
-        self.WF_details = self.week_forecast_details()
+        self.WF_details = self.weather.week_forecast_details(self.CW["bg color"])
         self.week_Forecast = tk.Frame(self.W_WForecast, bg=self.WF_details[0]["bg color"], pady=27)
 
         #============================| Tomorrow Frame |============================
@@ -749,20 +1035,20 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.TDate.pack(side="top", fill="x")
 
         #----------| Tomorrow Weather |----------
-        self.TWeather = tk.LabelFrame(self.Tomorrow, text=f'{int(self.WF_details[0]["Temp"]):>3}°{self._unit.lower()}\n{self.WF_details[0]["Name"]}',
+        self.TWeather = tk.LabelFrame(self.Tomorrow, text=f'{int(self.WF_details[0]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF_details[0]["Name"]}',
         font=("Tahoma", 18), labelanchor="s", relief="flat", bg=self.WF_details[0]["bg color"])
-        self.Timg = ImageTk.PhotoImage(Image.open(self.WF_details[0]["Image"]).resize(self.WF_details[0]["Image size"]))
+        self.Timg = self.icons.get(self.WF_details[0]["Image"], self.WF_details[0]["Image size"])
         self.TW_image = tk.Label(self.TWeather, image=self.Timg, bg=self.WF_details[0]["bg color"])
         self.TW_image.pack(side="top", fill="both", pady=self.WF_details[0]["Image pady"])
         self.TWeather.pack(side="top", fill="x", pady=20)
 
         #----------| Tomorrow Day Temp|----------
-        self.TDay = tk.Label(self.Tomorrow, text=f" {'Day:':<9}{int(self.WF_details[0]['Day:']):>3}°{self._unit.lower()}",
+        self.TDay = tk.Label(self.Tomorrow, text=f" {'Day:':<9}{int(self.WF_details[0]['Day:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[0]["bg color"])
         self.TDay.pack(side="top", fill="x")
 
         #----------| Tomorrow Night Temp |----------
-        self.TNight = tk.Label(self.Tomorrow, text=f" {'Night:':<9}{int(self.WF_details[0]['Night:']):>3}°{self._unit.lower()}",
+        self.TNight = tk.Label(self.Tomorrow, text=f" {'Night:':<9}{int(self.WF_details[0]['Night:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[0]["bg color"])
         self.TNight.pack(side="top", fill="x")
         self.Tomorrow.grid(row=0, column=0, sticky="nswe", ipadx=self.WF_details[0]["Frame ipadx"], ipady=5)
@@ -774,20 +1060,20 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.D2Date.pack(side="top", fill="x")
 
         #----------| Day2 Weather |----------
-        self.D2weather = tk.LabelFrame(self.Day2, text=f'{int(self.WF_details[1]["Temp"]):>3}°{self._unit.lower()}\n{self.WF_details[1]["Name"]}',
+        self.D2weather = tk.LabelFrame(self.Day2, text=f'{int(self.WF_details[1]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF_details[1]["Name"]}',
         font=("Tahoma", 18), labelanchor="s", relief="flat", bg=self.WF_details[1]["bg color"])
-        self.D2img = ImageTk.PhotoImage(Image.open(self.WF_details[1]["Image"]).resize(self.WF_details[1]["Image size"]))
+        self.D2img = self.icons.get(self.WF_details[1]["Image"], self.WF_details[1]["Image size"])
         self.D2w_image = tk.Label(self.D2weather, image=self.D2img, bg=self.WF_details[1]["bg color"])
         self.D2w_image.pack(side="top", fill="both", pady=self.WF_details[1]["Image pady"])
         self.D2weather.pack(side="top", fill="x", pady=20)
 
         #----------| Day2 Day Temp|----------
-        self.D2day = tk.Label(self.Day2, text=f" {'Day:':<9}{int(self.WF_details[1]['Day:']):>3}°{self._unit.lower()}",
+        self.D2day = tk.Label(self.Day2, text=f" {'Day:':<9}{int(self.WF_details[1]['Day:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[1]["bg color"])
         self.D2day.pack(side="top", fill="x")
 
         #----------| Day2 Night Temp |----------
-        self.D2night = tk.Label(self.Day2, text=f" {'Night:':<9}{int(self.WF_details[1]['Night:']):>3}°{self._unit.lower()}",
+        self.D2night = tk.Label(self.Day2, text=f" {'Night:':<9}{int(self.WF_details[1]['Night:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[1]["bg color"])
         self.D2night.pack(side="top", fill="x")
         self.Day2.grid(row=0, column=1, sticky="nswe", ipadx=self.WF_details[1]["Frame ipadx"])
@@ -799,20 +1085,20 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.D3Date.pack(side="top", fill="x")
 
         #----------| Day3 Weather |----------
-        self.D3weather = tk.LabelFrame(self.Day3, text=f'{int(self.WF_details[2]["Temp"]):>3}°{self._unit.lower()}\n{self.WF_details[2]["Name"]}',
+        self.D3weather = tk.LabelFrame(self.Day3, text=f'{int(self.WF_details[2]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF_details[2]["Name"]}',
         font=("Tahoma", 18), labelanchor="s", relief="flat", bg=self.WF_details[2]["bg color"])
-        self.D3img = ImageTk.PhotoImage(Image.open(self.WF_details[2]["Image"]).resize(self.WF_details[2]["Image size"]))
+        self.D3img = self.icons.get(self.WF_details[2]["Image"], self.WF_details[2]["Image size"])
         self.D3w_image = tk.Label(self.D3weather, image=self.D3img, bg=self.WF_details[2]["bg color"])
         self.D3w_image.pack(side="top", fill="both", pady=self.WF_details[2]["Image pady"])
         self.D3weather.pack(side="top", fill="x", pady=20)
 
         #----------| Day3 Day Temp|----------
-        self.D3day = tk.Label(self.Day3, text=f" {'Day:':<9}{int(self.WF_details[2]['Day:']):>3}°{self._unit.lower()}",
+        self.D3day = tk.Label(self.Day3, text=f" {'Day:':<9}{int(self.WF_details[2]['Day:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[2]["bg color"])
         self.D3day.pack(side="top", fill="x")
 
         #----------| Day3 Night Temp |----------
-        self.D3night = tk.Label(self.Day3, text=f" {'Night:':<9}{int(self.WF_details[2]['Night:']):>3}°{self._unit.lower()}",
+        self.D3night = tk.Label(self.Day3, text=f" {'Night:':<9}{int(self.WF_details[2]['Night:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[2]["bg color"])
         self.D3night.pack(side="top", fill="x")
         self.Day3.grid(row=0, column=2, sticky="nswe", ipadx=self.WF_details[2]["Frame ipadx"])
@@ -824,20 +1110,20 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.D4Date.pack(side="top", fill="x")
 
         #----------| Day4 Weather |----------
-        self.D4weather = tk.LabelFrame(self.Day4, text=f'{int(self.WF_details[3]["Temp"]):>3}°{self._unit.lower()}\n{self.WF_details[3]["Name"]}',
+        self.D4weather = tk.LabelFrame(self.Day4, text=f'{int(self.WF_details[3]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF_details[3]["Name"]}',
         font=("Tahoma", 18), labelanchor="s", relief="flat", bg=self.WF_details[3]["bg color"])
-        self.D4img = ImageTk.PhotoImage(Image.open(self.WF_details[3]["Image"]).resize(self.WF_details[3]["Image size"]))
+        self.D4img = self.icons.get(self.WF_details[3]["Image"], self.WF_details[3]["Image size"])
         self.D4w_image = tk.Label(self.D4weather, image=self.D4img, bg=self.WF_details[3]["bg color"])
         self.D4w_image.pack(side="top", fill="both", pady=self.WF_details[3]["Image pady"])
         self.D4weather.pack(side="top", fill="x", pady=20)
 
         #----------| Day4 Day Temp|----------
-        self.D4day = tk.Label(self.Day4, text=f" {'Day:':<9}{int(self.WF_details[3]['Day:']):>3}°{self._unit.lower()}",
+        self.D4day = tk.Label(self.Day4, text=f" {'Day:':<9}{int(self.WF_details[3]['Day:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[3]["bg color"])
         self.D4day.pack(side="top", fill="x")
 
         #----------| Day4 Night Temp |----------
-        self.D4night = tk.Label(self.Day4, text=f" {'Night:':<9}{int(self.WF_details[3]['Night:']):>3}°{self._unit.lower()}",
+        self.D4night = tk.Label(self.Day4, text=f" {'Night:':<9}{int(self.WF_details[3]['Night:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[3]["bg color"])
         self.D4night.pack(side="top", fill="x")
         self.Day4.grid(row=0, column=3, sticky="nswe", ipadx=self.WF_details[3]["Frame ipadx"])
@@ -849,20 +1135,20 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.D5Date.pack(side="top", fill="x")
 
         #----------| Day5 Weather |----------
-        self.D5weather = tk.LabelFrame(self.Day5, text=f'{int(self.WF_details[4]["Temp"]):>3}°{self._unit.lower()}\n{self.WF_details[4]["Name"]}',
+        self.D5weather = tk.LabelFrame(self.Day5, text=f'{int(self.WF_details[4]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF_details[4]["Name"]}',
         font=("Tahoma", 18), labelanchor="s", relief="flat", bg=self.WF_details[4]["bg color"])
-        self.D5img = ImageTk.PhotoImage(Image.open(self.WF_details[4]["Image"]).resize(self.WF_details[4]["Image size"]))
+        self.D5img = self.icons.get(self.WF_details[4]["Image"], self.WF_details[4]["Image size"])
         self.D5w_image = tk.Label(self.D5weather, image=self.D5img, bg=self.WF_details[4]["bg color"])
         self.D5w_image.pack(side="top", fill="both", pady=self.WF_details[4]["Image pady"])
         self.D5weather.pack(side="top", fill="x", pady=20)
 
         #----------| Day5 Day Temp|----------
-        self.D5day = tk.Label(self.Day5, text=f" {'Day:':<9}{int(self.WF_details[4]['Day:']):>3}°{self._unit.lower()}",
+        self.D5day = tk.Label(self.Day5, text=f" {'Day:':<9}{int(self.WF_details[4]['Day:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[4]["bg color"])
         self.D5day.pack(side="top", fill="x")
 
         #----------| Day5 Night Temp |----------
-        self.D5night = tk.Label(self.Day5, text=f" {'Night:':<9}{int(self.WF_details[4]['Night:']):>3}°{self._unit.lower()}",
+        self.D5night = tk.Label(self.Day5, text=f" {'Night:':<9}{int(self.WF_details[4]['Night:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[4]["bg color"])
         self.D5night.pack(side="top", fill="x")
         self.Day5.grid(row=0, column=4, sticky="nswe", ipadx=self.WF_details[4]["Frame ipadx"])
@@ -874,20 +1160,20 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.D6Date.pack(side="top", fill="x")
 
         #----------| Day6 Weather |----------
-        self.D6weather = tk.LabelFrame(self.Day6, text=f'{int(self.WF_details[5]["Temp"]):>3}°{self._unit.lower()}\n{self.WF_details[5]["Name"]}',
+        self.D6weather = tk.LabelFrame(self.Day6, text=f'{int(self.WF_details[5]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF_details[5]["Name"]}',
         font=("Tahoma", 18), labelanchor="s", relief="flat", bg=self.WF_details[5]["bg color"])
-        self.D6img = ImageTk.PhotoImage(Image.open(self.WF_details[5]["Image"]).resize(self.WF_details[5]["Image size"]))
+        self.D6img = self.icons.get(self.WF_details[5]["Image"], self.WF_details[5]["Image size"])
         self.D6w_image = tk.Label(self.D6weather, image=self.D6img, bg=self.WF_details[5]["bg color"])
         self.D6w_image.pack(side="top", fill="both", pady=self.WF_details[5]["Image pady"])
         self.D6weather.pack(side="top", fill="x", pady=20)
 
         #----------| Day6 Day Temp|----------
-        self.D6day = tk.Label(self.Day6, text=f" {'Day:':<9}{int(self.WF_details[5]['Day:']):>3}°{self._unit.lower()}",
+        self.D6day = tk.Label(self.Day6, text=f" {'Day:':<9}{int(self.WF_details[5]['Day:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14),justify="center", bg=self.WF_details[5]["bg color"])
         self.D6day.pack(side="top", fill="x")
 
         #----------| Day6 Night Temp |----------
-        self.D6night = tk.Label(self.Day6, text=f" {'Night:':<9}{int(self.WF_details[5]['Night:']):>3}°{self._unit.lower()}",
+        self.D6night = tk.Label(self.Day6, text=f" {'Night:':<9}{int(self.WF_details[5]['Night:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[5]["bg color"])
         self.D6night.pack(side="top", fill="x")
         self.Day6.grid(row=0, column=5, sticky="nswe", ipadx=self.WF_details[5]["Frame ipadx"])
@@ -899,20 +1185,20 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.D7Date.pack(side="top", fill="x")
 
         #----------| Day7 Weather |----------
-        self.D7weather = tk.LabelFrame(self.Day7, text=f'{int(self.WF_details[6]["Temp"]):>3}°{self._unit.lower()}\n{self.WF_details[6]["Name"]}',
+        self.D7weather = tk.LabelFrame(self.Day7, text=f'{int(self.WF_details[6]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF_details[6]["Name"]}',
         font=("Tahoma", 18), labelanchor="s", relief="flat", bg=self.WF_details[6]["bg color"])
-        self.D7img = ImageTk.PhotoImage(Image.open(self.WF_details[6]["Image"]).resize(self.WF_details[6]["Image size"]))
+        self.D7img = self.icons.get(self.WF_details[6]["Image"], self.WF_details[6]["Image size"])
         self.D7w_image = tk.Label(self.D7weather, image=self.D7img, bg=self.WF_details[6]["bg color"])
         self.D7w_image.pack(side="top", fill="both", pady=self.WF_details[6]["Image pady"])
         self.D7weather.pack(side="top", fill="x", pady=20)
 
         #----------| Day7 Day Temp|----------
-        self.D7day = tk.Label(self.Day7, text=f" {'Day:':<9}{int(self.WF_details[6]['Day:']):>3}°{self._unit.lower()}",
+        self.D7day = tk.Label(self.Day7, text=f" {'Day:':<9}{int(self.WF_details[6]['Day:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[6]["bg color"])
         self.D7day.pack(side="top", fill="x")
 
         #----------| Day7 Night Temp |----------
-        self.D7night = tk.Label(self.Day7, text=f" {'Night:':<9}{int(self.WF_details[6]['Night:']):>3}°{self._unit.lower()}",
+        self.D7night = tk.Label(self.Day7, text=f" {'Night:':<9}{int(self.WF_details[6]['Night:']):>3}°{self.weather.unit.lower()}",
         font=("Tahoma", 14), justify="center", bg=self.WF_details[6]["bg color"])
         self.D7night.pack(side="top", fill="x")
         self.Day7.grid(row=0, column=6, sticky="nswe", ipadx=self.WF_details[6]["Frame ipadx"])
@@ -924,40 +1210,21 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.update()
 
 
-    def WF_show_temp(self, event) -> None:
-        """---------------------| Shows the week selected point temp in graph |---------------------
-        It will call upon when mouse button is clicked on temperature line graph"""
-
-        Wcoord = []
-        Wcoord.append((event.xdata, event.ydata))
-        Wx = event.xdata
-        Wy = event.ydata
-        
-        # Setting the temperature based on axis
-        self.week_annot.xy = (Wx, Wy)
-        try:
-            self.week_annot.set_text(f"{self.Temps[int(Wx)]}°{self._unit.lower()}")
-            self.week_annot.set_visible(True)
-            self.week_canvas.draw()
-        except TypeError:   # if mouse axis is out of ploted area
-            pass
-
-    
     def WF_graph(self) -> None:
         """--------------------------| Week Weather Forecast Graph |--------------------------
-        Display the graph of current day, well-labelled"""
+        Make the graph of next 7 days once, well-labelled.
+        Its values and colors are set by WF_graph_update() on every refresh."""
+
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
         #---------------------| Figure area for Graph |---------------------
         #             (width, height) (dots per inch, use less dpi)  (fg color)    (layout height, width)
         self.week_fig = Figure(figsize=(10.25, 4.15), dpi=100, facecolor=self.CW["light color"], tight_layout={'h_pad' : 3})
-        #---------------------| Data which display in Graph |---------------------
-        seven_days = self.Seven_days_forecast()
-        self.Dates = [ day["Date"] for day in seven_days]
-        self.Temps = [ day["Temp"] for day in seven_days]
 
         #---------------------| Plotting Line Graph |---------------------
         self.week_graph = self.week_fig.add_subplot(111)
-        self.week_graph.plot(self.Dates, self.Temps, color="black", linestyle="-", linewidth=3, marker="o", markersize=9, markerfacecolor=self.CW["bg color"])
+        self.week_line, = self.week_graph.plot([], [], color="black", linestyle="-", linewidth=3, marker="o", markersize=9, markerfacecolor=self.CW["bg color"])
         self.week_graph.set_title(label="Temperature of next 7 days", fontdict={"fontfamily" : "Tahoma", "fontsize": 16}, color="black")
         self.week_graph.set_facecolor(self.CW["light color"])
         self.week_graph.spines["right"].set_visible(False)
@@ -965,30 +1232,60 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.week_graph.spines["left"].set_visible(False)
         self.week_graph.spines["bottom"].set_color("black")
 
-        #---------------------| Labels and ticks on X-axis |---------------------
-        self.X_ticks = [date for date in self.Dates]
-        self.week_graph.set_xticks(self.Dates)
-        self.week_graph.set_xticklabels(labels=self.X_ticks, fontfamily="Tahoma", fontsize=12, color="black")
+        #---------------------| Label on X-axis |---------------------
         self.week_graph.set_xlabel(xlabel="Date", color="black", fontfamily="Tahoma", fontsize=14)
 
         #---------------------| Labels and ticks on Y-axis |---------------------
         self.week_graph.set_yticks([])
 
-        #---------------------| Cursor which spanes the axis when mouse moves over |---------------------
-        Cursor(ax=self.week_graph, horizOn=False, vertOn=False, useblit=True,
-                        color = "r", linewidth = 1)
-
-        #---------------------| Annotated box on which clicked area temp. display |---------------------
-        self.week_annot = self.week_graph.annotate(text="", xy=(self.X_ticks[0], 0), xytext=(10, 20),
+        #---------------------| Annotated box of temp. of point under mouse or clicked |---------------------
+        self.week_annot = self.week_graph.annotate(text="", xy=(0, 0), xytext=(10, 20),
             textcoords="offset points", arrowprops={"arrowstyle" : "fancy"}, annotation_clip=True,
             bbox={"boxstyle" : "round, pad=0.5", "fc" : self.CW["light color"], "ec" : "black", "lw" : 2}, size=10)
         self.week_annot.set_visible(True)
 
         #---------------------| Canvas to place the Graph Figure |---------------------
+        self.week_drawn = None
         self.week_canvas = FigureCanvasTkAgg(figure=self.week_fig, master=self.W_WForecast)
-        self.week_canvas.mpl_connect('button_press_event', self.WF_show_temp)
-        self.week_canvas.draw()
+        # cursor line and temperature of point under mouse / clicked
+        self.week_tooltip = GraphTooltip(self.week_canvas, self.week_graph, self.week_annot, self.jobs, "week_tooltip")
         self.week_canvas.get_tk_widget().grid(row=2, column=0, sticky="nw")
+        self.WF_graph_update()
+
+
+    def WF_graph_update(self) -> None:
+        """--------------------------| Update Week Weather Forecast Graph |--------------------------
+        Set new temperatures, ticks and colors in existing graph of next 7 days and redraw it when idle."""
+
+        import numpy as np
+
+        #---------------------| Data which display in Graph |---------------------
+        self.Dates = [ day["Date"] for day in self.weather.Seven_days_forecast()]
+        self.Temps = self.weather.week_temps()
+        dates_x = np.arange(len(self.Temps))
+
+        # nothing to redraw if temperatures, dates and colors are same as last drawn
+        __drawn = (tuple(self.Dates), self.Temps.tobytes(), self.CW["bg color"], self.CW["light color"])
+        if __drawn==self.week_drawn:
+            return
+        self.week_drawn = __drawn
+
+        self.week_line.set_data(dates_x, self.Temps)
+        self.week_line.set_markerfacecolor(self.CW["bg color"])
+        self.week_graph.relim(visible_only=True)
+        self.week_graph.autoscale_view()
+
+        #---------------------| Ticks on X-axis |---------------------
+        self.X_ticks = [date for date in self.Dates]
+        self.week_graph.set_xticks(dates_x)
+        self.week_graph.set_xticklabels(labels=self.X_ticks, fontfamily="Tahoma", fontsize=12, color="black")
+        self.week_tooltip.set_points(dates_x, self.Temps, [f"{temp}°{self.weather.unit.lower()}" for temp in self.Temps.tolist()])
+
+        #---------------------| Graph colors |---------------------
+        self.week_fig.set_facecolor(self.CW["light color"])
+        self.week_graph.set_facecolor(self.CW["light color"])
+        self.week_annot.set_bbox({"boxstyle" : "round, pad=0.5", "fc" : self.CW["light color"], "ec" : "black", "lw" : 2})
+        self.week_canvas.draw_idle()
 
 
     def info(self) -> None:
@@ -1044,7 +1341,7 @@ class WeatherApp(tk.Tk, WeekForecast):
         self.one_call_api_button.grid(row=2, column=0, sticky="w")
 
         #--------------------------| Open Weather map image button |--------------------------
-        self.OW_img = ImageTk.PhotoImage(Image.open("./assets/open_weather_logo.png").resize((100, 40)))
+        self.OW_img = self.icons.get("./assets/open_weather_logo.png", (100, 40))
         self.OW_logo = tk.Button(self.WA_details, image=self.OW_img, bg=self.CW["bg color"],
         activebackground=self.CW["bg color"], relief="flat", overrelief="solid", padx=10, command=self.open_weather_link)
         self.OW_logo.grid(row=1, column=1, rowspan=2, sticky="w")
@@ -1169,14 +1466,14 @@ and 7-day Weather Forecast with Next 24 hour Temperature Graph of 3 hour interva
         labelanchor="nw", relief="flat")
         #----------| Celsius |----------
         self.unit_var = StringVar()
-        self.unit_var.set(self._unit)
-        self.Celsius_radio = tk.Radiobutton(self.Temp_label, font=("Tahoma", 14), text=self._UNITS["C"][0],
+        self.unit_var.set(self.weather.unit)
+        self.Celsius_radio = tk.Radiobutton(self.Temp_label, font=("Tahoma", 14), text=self.weather.unit_name("C"),
         variable=self.unit_var, value="C", bg=self.CW["bg color"], activebackground=self.CW["light color"],
         selectcolor=self.CW["light color"], relief="flat", overrelief="solid")
         self.Celsius_radio.grid(row=0, column=0, sticky="ne", ipadx=5)
 
         #----------| Farheniet |----------
-        self.Fahreneit_radio = tk.Radiobutton(self.Temp_label, font=("Tahoma", 14), text=self._UNITS["F"][0],
+        self.Fahreneit_radio = tk.Radiobutton(self.Temp_label, font=("Tahoma", 14), text=self.weather.unit_name("F"),
         variable=self.unit_var, value="F", bg=self.CW["bg color"], activebackground=self.CW["light color"],
         selectcolor=self.CW["light color"], relief="flat", overrelief="solid")
         self.Fahreneit_radio.grid(row=0, column=1, sticky="nswe")
@@ -1249,286 +1546,247 @@ and 7-day Weather Forecast with Next 24 hour Temperature Graph of 3 hour interva
         self.settings_win.mainloop()
 
 
-    def update_values(self) -> None:
-        """Update all the values and colors in application according to searched city"""
+    def render(self, widget : tk.Misc, layout : str | None = None, **options) -> None:
+        """configure() widget, or its grid / pack layout, with only the options changed since it was last rendered.
+        Refreshes which bring the same weather don't make Tk redo geometry and redraw of every widget."""
 
-        self.CW = self.current_weather_details()
-        self.WF = self.week_forecast_details()
-        self.configure(bg=self.CW["bg color"])
-        #--------------------------| Search Frame values |--------------------------
-        self.Sframe.configure(bg=self.CW["bg color"])
-        self.sep_1st.configure(bg=self.CW["bg color"])
-        self.city_entry.configure(bg=self.CW["bg color"])
-        self.search.configure(bg=self.CW["bg color"], activebackground=self.CW["light color"])
-        self.sep_2nd.configure(bg=self.CW["bg color"])
-        self.view_button.configure(bg=self.CW["bg color"], activebackground=self.CW["light color"])
-        self.info_button.configure(bg=self.CW["bg color"], activebackground=self.CW["light color"])
-        self.settings_button.configure(bg=self.CW["bg color"], activebackground=self.CW["light color"])
-        
-        #--------------------------------------| Search Frame Key Bindings |--------------------------------------
-        self.city_entry.bind("<Enter>", lambda e: self.city_entry.configure(relief="solid", bg=self.CW["light color"]))
-        self.city_entry.bind("<Leave>", lambda e: self.city_entry.configure(relief="flat", bg=self.CW["bg color"]))
-        self.city_entry.bind("<FocusOut>", lambda e: self.city_entry.configure(bg=self.CW["bg color"]))
-        try:        # In Some systems it throws ERROR, maybe / not bind
-            self.bind_all("</>", lambda e: (self.city_entry.focus(), self.city_entry.select_range(0, tk.END),
-            self.city_entry.configure(bg=self.CW["light color"])))
-        except tk.TclError:
-            pass
+        __last = self.rendered.setdefault(widget, {})
+        __changed = {option : value for option, value in options.items()
+                     if ((layout, option) not in __last) or (__last[(layout, option)] != value)}
+        if not __changed:
+            return
 
-        self.search.bind("<Enter>", lambda e: self.search.configure(bg=self.CW["light color"]))
-        self.search.bind("<Leave>", lambda e: self.search.configure(bg=self.CW["bg color"]))
+        if layout is None:
+            widget.configure(**__changed)
+        else:
+            getattr(widget, f"{layout}_configure")(**__changed)
+        __last.update({(layout, option) : value for option, value in __changed.items()})
 
-        self.view_button.bind("<Enter>", lambda e: self.view_button.configure(bg=self.CW["light color"]))
-        self.view_button.bind("<Leave>", lambda e: self.view_button.configure(bg=self.CW["bg color"]))
 
-        self.info_button.bind("<Enter>", lambda e: self.info_button.configure(bg=self.CW["light color"]))
-        self.info_button.bind("<Leave>", lambda e: self.info_button.configure(bg=self.CW["bg color"]))
-        self.settings_button.bind("<Enter>", lambda e: self.settings_button.configure(bg=self.CW["light color"]))
+    def bind_hover(self, widget : tk.Widget) -> None:
+        """Light color of current weather while mouse is over widget, bound once per widget"""
 
-        self.settings_button.bind("<Leave>", lambda e: self.settings_button.configure(bg=self.CW["bg color"]))
+        widget.bind("<Enter>", lambda e: widget.configure(bg=self.CW["light color"]))
+        widget.bind("<Leave>", lambda e: widget.configure(bg=self.CW["bg color"]))
 
-        if self.view=="expand":
-            self.open_weather.configure(bg=self.CW["bg color"], activebackground=self.CW["light color"])
-            self.open_weather.bind("<Enter>", lambda e: self.open_weather.configure(bg=self.CW["light color"]))
-            self.open_weather.bind("<Leave>", lambda e: self.open_weather.configure(bg=self.CW["bg color"]))
+
+    def update_values(self) -> None:
+        """Update all the values and colors in application according to searched city,
+        only widgets whose text, color, image or layout is changed are touched (see render())."""
+
+        __start = time.perf_counter()
+        self.CW = self.weather.current_weather_details()
+        self.WF = self.weather.week_forecast_details(self.CW["bg color"])
+        self.render(self, bg=self.CW["bg color"])
+        #--------------------------| Search Frame values |--------------------------
+        self.search_bar_colors()
 
         #--------------------------| Current Weather Frame values |--------------------------
-        self.current_stats.configure(bg=self.CW["bg color"])
-        self.CWFrame.configure(bg=self.CW["bg color"])
-        self.CW_main.configure(bg=self.CW["bg color"])
+        self.render(self.current_stats, bg=self.CW["bg color"])
+        self.render(self.CWFrame, bg=self.CW["bg color"])
+        self.render(self.CW_main, bg=self.CW["bg color"])
 
-        self.cw_img_frame.configure(text=self.CW["Name"], bg=self.CW["bg color"])
-        self.CImg = ImageTk.PhotoImage(Image.open(self.CW["Image"]).resize(self.CW["Image size"]))
-        self.cw_img.configure(image=self.CImg, bg=self.CW["bg color"])
-        self.cw_img_frame.pack_configure(ipadx=self.CW["ipadx"], ipady=self.CW["ipady"])
+        self.render(self.cw_img_frame, text=self.CW["Name"], bg=self.CW["bg color"])
+        self.CImg = self.icons.get(self.CW["Image"], self.CW["Image size"])
+        self.render(self.cw_img, image=self.CImg, bg=self.CW["bg color"])
+        self.render(self.cw_img_frame, layout="pack", ipadx=self.CW["ipadx"], ipady=self.CW["ipady"])
 
-        self.cwd_frame.configure(bg=self.CW["bg color"])
+        self.render(self.cwd_frame, bg=self.CW["bg color"])
 
         if (self.CW["Temp"] < 0) and (len(str(self.CW["Temp"]))==5):
-            self.ctemp = f' -{str(self.CW["Temp"])[1:]}°{self._unit.lower()}'
+            self.ctemp = f' -{str(self.CW["Temp"])[1:]}°{self.weather.unit.lower()}'
 
         elif (len(str(self.CW["Temp"]))==4):
-            self.ctemp = f' {str(self.CW["Temp"])}°{self._unit.lower()}'
+            self.ctemp = f' {str(self.CW["Temp"])}°{self.weather.unit.lower()}'
 
-        else:   self.ctemp = f' {str(self.CW["Temp"])}°{self._unit.lower()}'
+        else:   self.ctemp = f' {str(self.CW["Temp"])}°{self.weather.unit.lower()}'
 
-        self.CTemp.configure(text=self.ctemp, bg=self.CW["bg color"])
-        self.CTime.configure(text=f'{self.CW["Time"]:^11}', bg=self.CW["bg color"])
-        self.CDate.configure(text=f'{self.CW["Date"]:^16}', bg=self.CW["bg color"])
-        self.Cfeels.configure(text=f"Feels like:{self.CW['Feels']:>10}°{self._unit.lower()}", bg=self.CW["bg color"])
-        self.CMin.configure(text=f"Min:\t{self.CW['Min']:>10}°{self._unit.lower()}", bg=self.CW["bg color"])
-        self.CMax.configure(text=f"Max:\t{self.CW['Max']:>10}°{self._unit.lower()}", bg=self.CW["bg color"])
-        self.CTZone.configure(text=f"GMT {self.CW['Time zone'][:-2] + ':' + self.CW['Time zone'][-2:]}", bg=self.CW["bg color"])
-        self.CCity.configure(text=f'{self.CW["City"]:^20}', bg=self.CW["bg color"])
+        self.render(self.CTemp, text=self.ctemp, bg=self.CW["bg color"])
+        self.render(self.CTime, text=f'{self.CW["Time"]:^11}', bg=self.CW["bg color"])
+        self.render(self.CDate, text=f'{self.CW["Date"]:^16}', bg=self.CW["bg color"])
+        self.render(self.Cfeels, text=f"Feels like:{self.CW['Feels']:>10}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+        self.render(self.CMin, text=f"Min:\t{self.CW['Min']:>10}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+        self.render(self.CMax, text=f"Max:\t{self.CW['Max']:>10}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+        self.render(self.CTZone, text=f"GMT {self.CW['Time zone'][:-2] + ':' + self.CW['Time zone'][-2:]}", bg=self.CW["bg color"])
+        self.render(self.CCity, text=f'{self.CW["City"]:^20}', bg=self.CW["bg color"])
 
         if (" " in self.CW["Country"]) or (len(self.CW["Country"]) >= 10):
             self.con = self.CW["Country"]
         else:
             self.con = self.CW["Country"] + ", " + self.CW["Region"]
-        self.CCon.configure(text=f"{self.con:^20}", bg=self.CW["bg color"])
+        self.render(self.CCon, text=f"{self.con:^20}", bg=self.CW["bg color"])
 
-        self.CW_more.configure(bg=self.CW["bg color"])
+        self.render(self.CW_more, bg=self.CW["bg color"])
 
-        self.CSR.configure(bg=self.CW["bg color"])
-        self.CSR_logo.configure(bg=self.CW["bg color"])
-        self.CSR_time.configure(text=f'{self.CW["Sunrise"].lower():>12}', bg=self.CW["bg color"])
+        self.render(self.CSR, bg=self.CW["bg color"])
+        self.render(self.CSR_logo, bg=self.CW["bg color"])
+        self.render(self.CSR_time, text=f'{self.CW["Sunrise"].lower():>12}', bg=self.CW["bg color"])
 
-        self.CSS.configure(bg=self.CW["bg color"])
-        self.CSS_logo.configure(bg=self.CW["bg color"])
-        self.CSS_time.configure(text=f'{self.CW["Sunset"].lower():>12}', bg=self.CW["bg color"])
+        self.render(self.CSS, bg=self.CW["bg color"])
+        self.render(self.CSS_logo, bg=self.CW["bg color"])
+        self.render(self.CSS_time, text=f'{self.CW["Sunset"].lower():>12}', bg=self.CW["bg color"])
 
-        self.CMR.configure(bg=self.CW["bg color"])
-        self.CMR_logo.configure(bg=self.CW["bg color"])
-        self.CMR_time.configure(text=f'{self.CW["Moonrise"].lower():>12}', bg=self.CW["bg color"])
+        self.render(self.CMR, bg=self.CW["bg color"])
+        self.render(self.CMR_logo, bg=self.CW["bg color"])
+        self.render(self.CMR_time, text=f'{self.CW["Moonrise"].lower():>12}', bg=self.CW["bg color"])
 
-        self.CMS.configure(bg=self.CW["bg color"])
-        self.CMS_logo.configure(bg=self.CW["bg color"])
-        self.CMS_time.configure(text=f'{self.CW["Moonset"].lower():>12}', bg=self.CW["bg color"])
+        self.render(self.CMS, bg=self.CW["bg color"])
+        self.render(self.CMS_logo, bg=self.CW["bg color"])
+        self.render(self.CMS_time, text=f'{self.CW["Moonset"].lower():>12}', bg=self.CW["bg color"])
 
-        self.CHumid.configure(bg=self.CW["bg color"])
-        self.CHumidity_logo.configure(bg=self.CW["bg color"])
-        self.CHumid_mark.configure(text=f'{self.CW["Humidity"]:>6}%', bg=self.CW["bg color"])
+        self.render(self.CHumid, bg=self.CW["bg color"])
+        self.render(self.CHumidity_logo, bg=self.CW["bg color"])
+        self.render(self.CHumid_mark, text=f'{self.CW["Humidity"]:>6}%', bg=self.CW["bg color"])
 
-        self.CVisible.configure(bg=self.CW["bg color"])
-        self.CVisible_logo.configure(bg=self.CW["bg color"])
-        self.CVisible_mark.configure(text=f'{self.CW["Visibility"]//1000:>7} km', bg=self.CW["bg color"])
+        self.render(self.CVisible, bg=self.CW["bg color"])
+        self.render(self.CVisible_logo, bg=self.CW["bg color"])
+        self.render(self.CVisible_mark, text=f'{self.CW["Visibility"]//1000:>7} km', bg=self.CW["bg color"])
 
         #--------------------------| Week Forecast Frame values |--------------------------
-        self.W_WForecast.configure(bg=self.CW["bg color"])
-        self.Tomorrow.configure(bg=self.CW["bg color"])
-        self.Tomorrow.grid_configure(ipadx=self.WF[0]["Frame ipadx"])
-        self.TDate.configure(bg=self.CW["bg color"])
-        self.TWeather.configure(text=f'{int(self.WF[0]["Temp"]):>3}°{self._unit.lower()}\n{self.WF[0]["Name"]}',bg=self.CW["bg color"])
-        self.Timg = ImageTk.PhotoImage(Image.open(self.WF[0]["Image"]).resize(self.WF[0]["Image size"]))
-        self.TW_image.configure(image=self.Timg, bg=self.CW["bg color"])
-        self.TW_image.pack_configure(pady=self.WF[0]["Image pady"])
-        self.TDay.configure(text=f" {'Day:':<9}{int(self.WF[0]['Day:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-        self.TNight.configure(text=f" {'Night:':<9}{int(self.WF[0]['Night:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-
-        self.Day2.configure(bg=self.CW["bg color"])
-        self.Day2.grid_configure(ipadx=self.WF[1]["Frame ipadx"])
-        self.D2Date.configure(bg=self.CW["bg color"])
-        self.D2weather.configure(text=f'{int(self.WF[1]["Temp"]):>3}°{self._unit.lower()}\n{self.WF[1]["Name"]}', bg=self.CW["bg color"])
-        self.D2img = ImageTk.PhotoImage(Image.open(self.WF[1]["Image"]).resize(self.WF[1]["Image size"]))
-        self.D2w_image.configure(image=self.D2img, bg=self.CW["bg color"])
-        self.D2w_image.pack_configure(pady=self.WF[1]["Image pady"])
-        self.D2day.configure(text=f" {'Day:':<9}{int(self.WF[1]['Day:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-        self.D2night.configure(text=f" {'Night:':<9}{int(self.WF[1]['Night:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-
-        self.Day3.configure(bg=self.CW["bg color"])
-        self.Day3.grid_configure(ipadx=self.WF[2]["Frame ipadx"])
-        self.D3Date.configure(bg=self.CW["bg color"])
-        self.D3weather.configure(text=f'{int(self.WF[2]["Temp"]):>3}°{self._unit.lower()}\n{self.WF[2]["Name"]}', bg=self.CW["bg color"])
-        self.D3img = ImageTk.PhotoImage(Image.open(self.WF[2]["Image"]).resize(self.WF[2]["Image size"]))
-        self.D3w_image.configure(image=self.D3img, bg=self.CW["bg color"])
-        self.D3w_image.pack_configure(pady=self.WF[2]["Image pady"])
-        self.D3day.configure(text=f" {'Day:':<9}{int(self.WF[2]['Day:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-        self.D3night.configure(text=f" {'Night:':<9}{int(self.WF[2]['Night:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-
-        self.Day4.configure(bg=self.CW["bg color"])
-        self.Day4.grid_configure(ipadx=self.WF[3]["Frame ipadx"])
-        self.D4Date.configure(bg=self.CW["bg color"])
-        self.D4weather.configure(text=f'{int(self.WF[3]["Temp"]):>3}°{self._unit.lower()}\n{self.WF[3]["Name"]}', bg=self.CW["bg color"])
-        self.D4img = ImageTk.PhotoImage(Image.open(self.WF[3]["Image"]).resize(self.WF[3]["Image size"]))
-        self.D4w_image.configure(image=self.D4img, bg=self.CW["bg color"])
-        self.D4w_image.pack_configure(pady=self.WF[3]["Image pady"])
-        self.D4day.configure(text=f" {'Day:':<9}{int(self.WF[3]['Day:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-        self.D4night.configure(text=f" {'Night:':<9}{int(self.WF[3]['Night:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-
-        self.Day5.configure(bg=self.CW["bg color"])
-        self.Day5.grid_configure(ipadx=self.WF[4]["Frame ipadx"])
-        self.D5Date.configure(bg=self.CW["bg color"])
-        self.D5weather.configure(text=f'{int(self.WF[4]["Temp"]):>3}°{self._unit.lower()}\n{self.WF[4]["Name"]}', bg=self.CW["bg color"])
-        self.D5img = ImageTk.PhotoImage(Image.open(self.WF[4]["Image"]).resize(self.WF[4]["Image size"]))
-        self.D5w_image.configure(image=self.D5img, bg=self.CW["bg color"])
-        self.D5w_image.pack_configure(pady=self.WF[4]["Image pady"])
-        self.D5day.configure(text=f" {'Day:':<9}{int(self.WF[4]['Day:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-        self.D5night.configure(text=f" {'Night:':<9}{int(self.WF[4]['Night:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-
-        self.Day6.configure(bg=self.CW["bg color"])
-        self.Day6.grid_configure(ipadx=self.WF[1]["Frame ipadx"])
-        self.D6Date.configure(bg=self.CW["bg color"])
-        self.D6weather.configure(text=f'{int(self.WF[5]["Temp"]):>3}°{self._unit.lower()}\n{self.WF[5]["Name"]}', bg=self.CW["bg color"])
-        self.D6img = ImageTk.PhotoImage(Image.open(self.WF[5]["Image"]).resize(self.WF[5]["Image size"]))
-        self.D6w_image.configure(image=self.D6img, bg=self.CW["bg color"])
-        self.D6w_image.pack_configure(pady=self.WF[5]["Image pady"])
-        self.D6day.configure(text=f" {'Day:':<9}{int(self.WF[5]['Day:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-        self.D6night.configure(text=f" {'Night:':<9}{int(self.WF[5]['Night:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-
-        self.Day7.configure(bg=self.CW["bg color"])
-        self.Day7.grid_configure(ipadx=self.WF[1]["Frame ipadx"])
-        self.D7Date.configure(bg=self.CW["bg color"])
-        self.D7weather.configure(text=f'{int(self.WF[6]["Temp"]):>3}°{self._unit.lower()}\n{self.WF[6]["Name"]}', bg=self.CW["bg color"])
-        self.D7img = ImageTk.PhotoImage(Image.open(self.WF[6]["Image"]).resize(self.WF[6]["Image size"]))
-        self.D7w_image.configure(image=self.D7img, bg=self.CW["bg color"])
-        self.D7w_image.pack_configure(pady=self.WF[6]["Image pady"])
-        self.D7day.configure(text=f" {'Day:':<9}{int(self.WF[6]['Day:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-        self.D7night.configure(text=f" {'Night:':<9}{int(self.WF[6]['Night:']):>3}°{self._unit.lower()}", bg=self.CW["bg color"])
-        self.week_Forecast.configure(bg=self.CW["bg color"])
-
-        #--------------------------| Current Weather graph colors |--------------------------
-        self.CW_graph()
-        self.WF_graph()
-        self.cw_fig.set_facecolor(self.CW["light color"])
-        self.cw_graph.set_facecolor(self.CW["light color"])
-        self.cw_annot.set_bbox({"boxstyle" : "round, pad=0.5", "fc" : self.CW["light color"], "ec" : "black", "lw" : 2})
-
-        #--------------------------| Week Forecast graph colors |--------------------------
-        self.week_fig.set_facecolor(self.CW["light color"])
-        self.week_graph.set_facecolor(self.CW["light color"])
-        self.week_annot.set_bbox({"boxstyle" : "round, pad=0.5", "fc" : self.CW["light color"], "ec" : "black", "lw" : 2})
+        self.render(self.W_WForecast, bg=self.CW["bg color"])
+        self.render(self.Tomorrow, bg=self.CW["bg color"])
+        self.render(self.Tomorrow, layout="grid", ipadx=self.WF[0]["Frame ipadx"])
+        self.render(self.TDate, bg=self.CW["bg color"])
+        self.render(self.TWeather, text=f'{int(self.WF[0]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF[0]["Name"]}',bg=self.CW["bg color"])
+        self.Timg = self.icons.get(self.WF[0]["Image"], self.WF[0]["Image size"])
+        self.render(self.TW_image, image=self.Timg, bg=self.CW["bg color"])
+        self.render(self.TW_image, layout="pack", pady=self.WF[0]["Image pady"])
+        self.render(self.TDay, text=f" {'Day:':<9}{int(self.WF[0]['Day:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+        self.render(self.TNight, text=f" {'Night:':<9}{int(self.WF[0]['Night:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+
+        self.render(self.Day2, bg=self.CW["bg color"])
+        self.render(self.Day2, layout="grid", ipadx=self.WF[1]["Frame ipadx"])
+        self.render(self.D2Date, bg=self.CW["bg color"])
+        self.render(self.D2weather, text=f'{int(self.WF[1]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF[1]["Name"]}', bg=self.CW["bg color"])
+        self.D2img = self.icons.get(self.WF[1]["Image"], self.WF[1]["Image size"])
+        self.render(self.D2w_image, image=self.D2img, bg=self.CW["bg color"])
+        self.render(self.D2w_image, layout="pack", pady=self.WF[1]["Image pady"])
+        self.render(self.D2day, text=f" {'Day:':<9}{int(self.WF[1]['Day:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+        self.render(self.D2night, text=f" {'Night:':<9}{int(self.WF[1]['Night:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+
+        self.render(self.Day3, bg=self.CW["bg color"])
+        self.render(self.Day3, layout="grid", ipadx=self.WF[2]["Frame ipadx"])
+        self.render(self.D3Date, bg=self.CW["bg color"])
+        self.render(self.D3weather, text=f'{int(self.WF[2]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF[2]["Name"]}', bg=self.CW["bg color"])
+        self.D3img = self.icons.get(self.WF[2]["Image"], self.WF[2]["Image size"])
+        self.render(self.D3w_image, image=self.D3img, bg=self.CW["bg color"])
+        self.render(self.D3w_image, layout="pack", pady=self.WF[2]["Image pady"])
+        self.render(self.D3day, text=f" {'Day:':<9}{int(self.WF[2]['Day:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+        self.render(self.D3night, text=f" {'Night:':<9}{int(self.WF[2]['Night:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+
+        self.render(self.Day4, bg=self.CW["bg color"])
+        self.render(self.Day4, layout="grid", ipadx=self.WF[3]["Frame ipadx"])
+        self.render(self.D4Date, bg=self.CW["bg color"])
+        self.render(self.D4weather, text=f'{int(self.WF[3]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF[3]["Name"]}', bg=self.CW["bg color"])
+        self.D4img = self.icons.get(self.WF[3]["Image"], self.WF[3]["Image size"])
+        self.render(self.D4w_image, image=self.D4img, bg=self.CW["bg color"])
+        self.render(self.D4w_image, layout="pack", pady=self.WF[3]["Image pady"])
+        self.render(self.D4day, text=f" {'Day:':<9}{int(self.WF[3]['Day:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+        self.render(self.D4night, text=f" {'Night:':<9}{int(self.WF[3]['Night:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+
+        self.render(self.Day5, bg=self.CW["bg color"])
+        self.render(self.Day5, layout="grid", ipadx=self.WF[4]["Frame ipadx"])
+        self.render(self.D5Date, bg=self.CW["bg color"])
+        self.render(self.D5weather, text=f'{int(self.WF[4]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF[4]["Name"]}', bg=self.CW["bg color"])
+        self.D5img = self.icons.get(self.WF[4]["Image"], self.WF[4]["Image size"])
+        self.render(self.D5w_image, image=self.D5img, bg=self.CW["bg color"])
+        self.render(self.D5w_image, layout="pack", pady=self.WF[4]["Image pady"])
+        self.render(self.D5day, text=f" {'Day:':<9}{int(self.WF[4]['Day:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+        self.render(self.D5night, text=f" {'Night:':<9}{int(self.WF[4]['Night:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+
+        self.render(self.Day6, bg=self.CW["bg color"])
+        self.render(self.Day6, layout="grid", ipadx=self.WF[1]["Frame ipadx"])
+        self.render(self.D6Date, bg=self.CW["bg color"])
+        self.render(self.D6weather, text=f'{int(self.WF[5]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF[5]["Name"]}', bg=self.CW["bg color"])
+        self.D6img = self.icons.get(self.WF[5]["Image"], self.WF[5]["Image size"])
+        self.render(self.D6w_image, image=self.D6img, bg=self.CW["bg color"])
+        self.render(self.D6w_image, layout="pack", pady=self.WF[5]["Image pady"])
+        self.render(self.D6day, text=f" {'Day:':<9}{int(self.WF[5]['Day:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+        self.render(self.D6night, text=f" {'Night:':<9}{int(self.WF[5]['Night:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+
+        self.render(self.Day7, bg=self.CW["bg color"])
+        self.render(self.Day7, layout="grid", ipadx=self.WF[1]["Frame ipadx"])
+        self.render(self.D7Date, bg=self.CW["bg color"])
+        self.render(self.D7weather, text=f'{int(self.WF[6]["Temp"]):>3}°{self.weather.unit.lower()}\n{self.WF[6]["Name"]}', bg=self.CW["bg color"])
+        self.D7img = self.icons.get(self.WF[6]["Image"], self.WF[6]["Image size"])
+        self.render(self.D7w_image, image=self.D7img, bg=self.CW["bg color"])
+        self.render(self.D7w_image, layout="pack", pady=self.WF[6]["Image pady"])
+        self.render(self.D7day, text=f" {'Day:':<9}{int(self.WF[6]['Day:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+        self.render(self.D7night, text=f" {'Night:':<9}{int(self.WF[6]['Night:']):>3}°{self.weather.unit.lower()}", bg=self.CW["bg color"])
+        self.render(self.week_Forecast, bg=self.CW["bg color"])
+
+        #--------------------------| Graphs values and colors |--------------------------
+        self.update_graphs()
         self.focus()
 
         #--------------------------------------| Settings colors |--------------------------------------
         try:
             self.settings_win.focus()
-            self.settings_win.configure(bg=self.CW["bg color"])
-            self.setting_label.configure(bg=self.CW["bg color"])
+            self.render(self.settings_win, bg=self.CW["bg color"])
+            self.render(self.setting_label, bg=self.CW["bg color"])
 
-            self.new_loc_label.configure(bg=self.CW["bg color"])
-            self.new_loc_entry.configure(bg=self.CW["light color"])
-            self.new_loc_verify.configure(bg=self.CW["bg color"], activebackground=self.CW["light color"])
+            self.render(self.new_loc_label, bg=self.CW["bg color"])
+            self.render(self.new_loc_entry, bg=self.CW["light color"])
+            self.render(self.new_loc_verify, bg=self.CW["bg color"], activebackground=self.CW["light color"])
 
-            self.Temp_label.configure(bg=self.CW["bg color"])
-            self.Celsius_radio.configure(bg=self.CW["bg color"], activebackground=self.CW["light color"],
+            self.render(self.Temp_label, bg=self.CW["bg color"])
+            self.render(self.Celsius_radio, bg=self.CW["bg color"], activebackground=self.CW["light color"],
             selectcolor=self.CW["light color"])
-            self.Fahreneit_radio.configure(bg=self.CW["bg color"], activebackground=self.CW["light color"],
+            self.render(self.Fahreneit_radio, bg=self.CW["bg color"], activebackground=self.CW["light color"],
             selectcolor=self.CW["light color"])
 
-            self.set_view_label.configure(bg=self.CW["bg color"])
-            self.normal_view.configure(bg=self.CW["bg color"], activebackground=self.CW["light color"],
+            self.render(self.set_view_label, bg=self.CW["bg color"])
+            self.render(self.normal_view, bg=self.CW["bg color"], activebackground=self.CW["light color"],
             selectcolor=self.CW["light color"])
-            self.expand_view.configure(bg=self.CW["bg color"], activebackground=self.CW["light color"],
+            self.render(self.expand_view, bg=self.CW["bg color"], activebackground=self.CW["light color"],
             selectcolor=self.CW["light color"])
 
-            self.buttons_frame.configure(bg=self.CW["bg color"])
-            self.apply_button.configure(bg=self.CW["bg color"], activebackground=self.CW["light color"])
-            self.reset_button.configure(bg=self.CW["bg color"], activebackground=self.CW["light color"])
-
-            #--------------------------------------| Settings Key Bindings |--------------------------------------
-            self.new_loc_verify.bind("<Enter>", lambda e: self.new_loc_verify.configure(bg=self.CW["light color"]))
-            self.new_loc_verify.bind("<Leave>", lambda e: self.new_loc_verify.configure(bg=self.CW["bg color"]))
-
-            self.Celsius_radio.bind("<Enter>", lambda e: self.Celsius_radio.configure(bg=self.CW["light color"]))
-            self.Celsius_radio.bind("<Leave>", lambda e: self.Celsius_radio.configure(bg=self.CW["bg color"]))
-
-            self.Fahreneit_radio.bind("<Enter>", lambda e: self.Fahreneit_radio.configure(bg=self.CW["light color"]))
-            self.Fahreneit_radio.bind("<Leave>", lambda e: self.Fahreneit_radio.configure(bg=self.CW["bg color"]))
-
-            self.normal_view.bind("<Enter>", lambda e: self.normal_view.configure(bg=self.CW["light color"]))
-            self.normal_view.bind("<Leave>", lambda e: self.normal_view.configure(bg=self.CW["bg color"]))
-
-            self.expand_view.bind("<Enter>", lambda e: self.expand_view.configure(bg=self.CW["light color"]))
-            self.expand_view.bind("<Leave>", lambda e: self.expand_view.configure(bg=self.CW["bg color"]))
+            self.render(self.buttons_frame, bg=self.CW["bg color"])
+            self.render(self.apply_button, bg=self.CW["bg color"], activebackground=self.CW["light color"])
+            self.render(self.reset_button, bg=self.CW["bg color"], activebackground=self.CW["light color"])
 
-            self.apply_button.bind("<Enter>", lambda e: self.apply_button.configure(bg=self.CW["light color"]))
-            self.apply_button.bind("<Leave>", lambda e: self.apply_button.configure(bg=self.CW["bg color"]))
-
-            self.reset_button.bind("<Enter>", lambda e: self.reset_button.configure(bg=self.CW["light color"]))
-            self.reset_button.bind("<Leave>", lambda e: self.reset_button.configure(bg=self.CW["bg color"]))
         except (AttributeError, tk.TclError):
             pass
 
         #--------------------------------------| Info Window |--------------------------------------
         try:
             self.info_win.focus()
-            self.info_win.configure(bg=self.CW["bg color"])
-            self.info.configure(bg=self.CW["bg color"])
-
-            self.dev_detail.configure(bg=self.CW["bg color"])
-            self.dev_github.configure(bg=self.CW["bg color"], activebackground=self.CW["bg color"],)
-
-            self.WA_details.configure(bg=self.CW["bg color"])
-            self.wa_start.configure(bg=self.CW["bg color"])
-            self.current_api_button.configure(bg=self.CW["bg color"], activebackground=self.CW["bg color"],)
-            self.one_call_api_button.configure(bg=self.CW["bg color"], activebackground=self.CW["bg color"],)
-            self.OW_logo.configure(bg=self.CW["bg color"])
-            self.wa_extra.configure(bg=self.CW["bg color"])
-
-            self.Shortcut_keys.configure(bg=self.CW["bg color"])
-            self.info_label.configure(bg=self.CW["bg color"])
-            self.info_key.configure(bg=self.CW["light color"])
+            self.render(self.info_win, bg=self.CW["bg color"])
+            self.render(self.info, bg=self.CW["bg color"])
+
+            self.render(self.dev_detail, bg=self.CW["bg color"])
+            self.render(self.dev_github, bg=self.CW["bg color"], activebackground=self.CW["bg color"],)
+
+            self.render(self.WA_details, bg=self.CW["bg color"])
+            self.render(self.wa_start, bg=self.CW["bg color"])
+            self.render(self.current_api_button, bg=self.CW["bg color"], activebackground=self.CW["bg color"],)
+            self.render(self.one_call_api_button, bg=self.CW["bg color"], activebackground=self.CW["bg color"],)
+            self.render(self.OW_logo, bg=self.CW["bg color"])
+            self.render(self.wa_extra, bg=self.CW["bg color"])
+
+            self.render(self.Shortcut_keys, bg=self.CW["bg color"])
+            self.render(self.info_label, bg=self.CW["bg color"])
+            self.render(self.info_key, bg=self.CW["light color"])
       
-            self.layout_label.configure(bg=self.CW["bg color"])
-            self.layout_key.configure(bg=self.CW["light color"])
+            self.render(self.layout_label, bg=self.CW["bg color"])
+            self.render(self.layout_key, bg=self.CW["light color"])
 
-            self.search_label.configure(bg=self.CW["bg color"])
-            self.search_key.configure(bg=self.CW["light color"])
+            self.render(self.search_label, bg=self.CW["bg color"])
+            self.render(self.search_key, bg=self.CW["light color"])
 
-            self.settings_label.configure(bg=self.CW["bg color"])
-            self.settings_key.configure(bg=self.CW["light color"])
+            self.render(self.settings_label, bg=self.CW["bg color"])
+            self.render(self.settings_key, bg=self.CW["light color"])
 
-            self.OW_logo.bind("<Enter>", lambda e: self.OW_logo.configure(bg=self.CW["light color"]))
-            self.OW_logo.bind("<Leave>", lambda e: self.OW_logo.configure(bg=self.CW["bg color"]))
         except (AttributeError, tk.TclError):
             pass
 
+        self.weather.timings.add("update_values", __start)
 
     def Search_Weather(self, event=None) -> None:
         """--------------------------| Search Weather |--------------------------
         Search the weather upon clicking Enter key or clicking search button.
         If application started first time, then search weather of default city.
-        Display weather and graph, if wrong city name, then show a message."""
+        Weather is fetched in background and shown by show_weather()."""
 
         self.city.set(self.city.get().upper())
         self.Search_city = self.city.get().strip()
@@ -1537,28 +1795,53 @@ and 7-day Weather Forecast with Next 24 hour Temperature Graph of 3 hour interva
             self.city.set("")
             return
         
-        self.exit_code = self.get_forecast(self.Search_city)
+        if self.searching:      # previous search is still being fetched
+            return
+
+        self.searching = True
+        self.updating = None        # refresh still being fetched is superseded, its older weather is ignored
+        self.refreshing(True)
+        city = self.Search_city
+        self.fetch_start = time.perf_counter()
+        self.hourly_asked = self.weather.fetch_hourly
+        self.fetcher.submit(self.weather.fetch_forecast, city, callback=lambda result: self.show_weather(city, result),
+        error=lambda e: self.show_weather(city, (e, None, None)))
+
+
+    def show_weather(self, city : str, result : tuple[int | Exception, dict | None, dict | None]) -> None:
+        """--------------------------| Show Weather |--------------------------
+        Called on Tk main loop, when fetch_forecast() of searched city is finished in background.
+        Display weather and graph, if wrong city name, then show a message.
+        If search failed, weather shown before is still refreshed."""
+
+        self.searching = False
+        self.refreshing(False)
+        self.exit_code, current_json, forecast_json = result
         if self.exit_code==0:
+            self.exit_code = self.weather.set_forecast(current_json, forecast_json)
+
+        if (self.exit_code!=0) and (self.weather_city is not None):
+            # a refresh in flight was superseded by this search, or came due meanwhile
+            self.jobs.once("refresh", self.weather.next_refresh(self.unchanged), self.temp_update)
+
+        if isinstance(self.exit_code, Exception):   # Any unknwon exception while fetching
+            messagebox.showerror(title="Unkown Error: Weather App",message=f"An Unkown Error occurred!\nPlease search the weather again,\
+or click 'OK'.\nPlease report this error to the developer with the screenshot attached.\n\nError:\n{self.exit_code}")
+
+        elif self.exit_code==0:
+            self.weather_city = city
+            self.stale = False
+            self.weather.save_forecast(city, current_json, forecast_json)
+            # 1st refresh when OpenWeatherMap is expected to have newer weather,
+            # at once if view was switched to expand while weather without hourly forecast was fetched
+            self.unchanged = 0
+            self.jobs.once("refresh", 0 if self.hourly_missing() else self.weather.next_refresh(), self.temp_update)
             try:
-                if self.start:
-                    self.start = False
-                    self.Weather_Frames()
-                    self.CW_Frame()
-                    self.WF_Frame()
-                    self.CW_graph()
-                    self.WF_graph()
-
-                self.update_values()
+                self.render_weather()
+                self.weather.timings.add("search to paint", self.fetch_start)
+                self.log_timings()
 
-                if self.state=="disabled":
-                    self.change_button_state()
-
-                self.after(1000, lambda : self.date_time_update())
-                # 1st time values update after 5 min
-                self.after(300000, lambda : self.temp_update())
-
-                if self.view=="normal":
-                    self.side_sep.configure(bg=self.Sframe.cget("bg"))
+                self.jobs.once("clock", 0, self.date_time_update)
             except tk.TclError:
                 pass        # Sometimes, while updating weather, date_time_update() or temp_update() throw TclError due to no time or weather found.
             except Exception as e:  # Any unknwon exception
@@ -1573,16 +1856,67 @@ or click 'OK'.\nPlease report this error to the developer with the screenshot at
             retry = messagebox.askretrycancel(title="Error: 2 Weather App",
             message="The Website (openweather) is taking too much to respond.\nPress Retry to retry after 10 seconds.\nThank you.")
             if retry:
-                self.after(10000, self.Search_Weather)
+                self.jobs.once("retry", 10000, self.Search_Weather)
 
         elif self.exit_code==3:
-            messagebox.showerror(title="Error: 3 Weather App", message=f"Invalid City Name: '{self.Search_city}'!\
+            messagebox.showerror(title="Error: 3 Weather App", message=f"Invalid City Name: '{city}'!\
 \nMaybe,\n• You have entered wrong City name, or\n• City name is not present in list of openweather.org")
             self.city.set("")
 
         return
 
 
+    def render_weather(self) -> None:
+        """Make weather frames at first time, then update all values of current forecast."""
+
+        if self.start:
+            self.start = False
+            self.Weather_Frames()
+            self.CW_Frame()
+            self.WF_Frame()
+
+        self.update_values()
+
+        if self.state=="disabled":
+            self.change_button_state()
+
+        if self.view=="normal":
+            self.side_sep.configure(bg=self.Sframe.cget("bg"))
+
+        # saved weather is shown until fresh weather is fetched
+        self.title("Weather App (saved data, refreshing...)" if self.stale else "Weather App")
+
+
+    def show_cached(self, city : str) -> None:
+        """Show weather of city saved at last run, at once, marked stale until it is revalidated."""
+
+        if not self.weather.load_forecast(city):
+            return
+
+        self.weather_city = city
+        self.stale = True
+        try:
+            self.render_weather()
+            self.jobs.once("clock", 0, self.date_time_update)
+        except Exception:       # saved weather can't be shown, wait for fresh weather
+            pass
+
+
+    def refreshing(self, status : bool) -> None:
+        """Show or hide the refreshing state in search bar, while weather is fetched in background."""
+
+        try:
+            if status:
+                self.refresh_label.configure(bg=self.Sframe.cget("bg"))
+                self.refresh_label.place(relx=0, x=10, rely=0.5, anchor="w")
+                self.city_entry.configure(cursor="watch")
+            else:
+                self.refresh_label.place_forget()
+                self.city_entry.configure(cursor="xterm")
+        except tk.TclError:
+            pass
+
+
     def change_button_state(self) -> None:
         """Change the state of buttons in search bar, after weather updates, the state changed to normal."""
         try:
@@ -1607,7 +1941,7 @@ or click 'OK'.\nPlease report this error to the developer with the screenshot at
     def switch_layout(self) -> None:
         """--------------------------| Switch layout at button pressed |--------------------------
         If layout is small (normal) then, switches to large (expand) & vice-versa.
-        Also change the configuration of search bar."""
+        Search bar of the other view is swapped in, graphs and weather frames are kept as they are."""
 
         if self.view=="normal":
             #---------------| Switch from Normal to Expand |---------------
@@ -1615,36 +1949,17 @@ or click 'OK'.\nPlease report this error to the developer with the screenshot at
             self.width = 1730
             self.height = 800
             self.geometry(f"{self.width}x{self.height}+{self.winfo_screenwidth()//20}+100")
+            self.show_search_bar(self.view)
 
-            self.Sframe.pack_configure(ipady=2)
-            self.sep_1st.grid_configure(ipadx=360)
-            self.city_entry.configure(font=("Tahoma", 18, "bold"), bd=2, width=20)
-            self.city_entry.grid_configure(ipady=5)
-
-            self.search_img = ImageTk.PhotoImage(Image.open("./assets/search.png").resize((38, 38)))
-            self.search.configure(image=self.search_img)
-
-            self.sep_2nd.grid_configure(ipadx=180)
-            self.view_img = ImageTk.PhotoImage(Image.open("./assets/uparrowhead.png").resize((26, 26)))
-            self.view_button.configure(image=self.view_img)
-            self.view_button.grid_configure(ipady=6)
-
-            self.info_img = ImageTk.PhotoImage(Image.open("./assets/info.png").resize((36, 36)))
-            self.info_button.configure(image=self.info_img)
-            self.info_button.grid_configure(ipady=1, padx=18)
-
-            self.settings_img = ImageTk.PhotoImage(Image.open("./assets/settings.png").resize((30, 30)))
-            self.settings_button.configure(image=self.settings_img)
-            self.settings_button.grid_configure(ipadx=2, ipady=4)
-
-            self.open_WImg = ImageTk.PhotoImage(Image.open("./assets/open_weather_logo.png").resize((100, 38)))
-            self.open_weather = tk.Button(self.Sframe, image=self.open_WImg, bg=self.CW["bg color"], 
-            relief="flat", overrelief="solid", command=self.open_weather_link)
-            self.open_weather.grid(row=0, column=7, ipadx=5, padx=10)
-            self.open_weather.bind("<Enter>", lambda e: self.open_weather.configure(bg=self.CW["light color"]))
-            self.open_weather.bind("<Leave>", lambda e: self.open_weather.configure(bg=self.CW["bg color"]))
+            # graphs of shown weather, hourly forecast is fetched first if it wasn't while in normal view
+            # (or once weather being fetched now is shown, see hourly_missing())
+            self.weather.fetch_hourly = True
+            if self.weather.has_hourly():
+                self.update_graphs()
+            else:
+                self.temp_update()
 
-            # removing timezone, changing separator color in normal
+            # adding timezone, changing separator color in expand
             self.CTZone.grid(row=3, column=3, sticky="nswe")
             self.CCity.grid(row=4, column=3, sticky="nswe")
             self.CCon.grid(row=5, column=3, sticky="nswe")
@@ -1656,34 +1971,14 @@ or click 'OK'.\nPlease report this error to the developer with the screenshot at
             self.width = 700
             self.height = 260
             self.geometry(f"{self.width}x{self.height}+{self.winfo_screenwidth()//3}+50")
+            self.show_search_bar(self.view)
+            # graphs are hidden, so they are not updated and hourly forecast is not fetched
+            self.weather.fetch_hourly = False
+            if self.graphs:
+                self.cw_tooltip.cancel()
+                self.week_tooltip.cancel()
 
-            self.Sframe.pack_configure(ipady=1)
-            self.sep_1st.grid_configure(ipadx=110)
-            self.city_entry.configure(font=("Tahoma", 16, "bold"), bd=2, width=15)
-            self.city_entry.grid_configure(ipady=3)
-
-            self.search_img = ImageTk.PhotoImage(Image.open("./assets/search.png").resize((30, 31)))
-            self.search.configure(image=self.search_img)
-
-            self.sep_2nd.grid_configure(ipadx=50)
-            self.view_img = ImageTk.PhotoImage(Image.open("./assets/downarrowhead.png").resize((20, 20)))
-            self.view_button.configure(image=self.view_img)
-            self.view_button.grid_configure(ipady=5)
-
-            self.info_img = ImageTk.PhotoImage(Image.open("./assets/info.png").resize((30, 30)))
-            self.info_button.configure(image=self.info_img)
-            self.info_button.grid_configure(padx=10, ipady=0)
-
-            self.settings_img = ImageTk.PhotoImage(Image.open("./assets/settings.png").resize((25, 26)))
-            self.settings_button.configure(image=self.settings_img)
-            self.settings_button.grid_configure(ipadx=2, ipady=2)
-            
-            try:
-                self.open_weather.destroy()
-            except AttributeError:
-                pass
-
-            # Adding timezone, changing separator color in expand
+            # removing timezone, changing separator color in normal
             self.CTZone.grid_forget()
             self.CCity.grid(row=3, column=3, sticky="nswe")
             self.CCon.grid(row=4, column=3, sticky="nswe")
@@ -1694,25 +1989,144 @@ or click 'OK'.\nPlease report this error to the developer with the screenshot at
         self.update()
 
 
+
     def date_time_update(self) -> None:
-        """Updates the time and date after 0.5(half) second."""
+        """Updates the time and date, then waits till the minute changes in city's time zone.
+        Labels are only changed if their text is changed, and not at all while window is minimized."""
         try:
-            self.new_time = datetime.datetime.now(pytz.timezone(self.location_details()[-1])).strftime("%I:%M %p")
-            self.new_date = datetime.datetime.now(pytz.timezone(self.location_details()[-1])).strftime("%a, %d %b' %y")
+            if self.wm_state()!="iconic":
+                self.new_time, self.new_date = self.weather.current_time()
 
-            self.CTime.configure(text=f'{self.new_time:^11}')
-            self.CDate.configure(text=f'{self.new_date:^16}')
-            
-            self.after(500, self.date_time_update)
+                self.render(self.CTime, text=f'{self.new_time:^11}')
+                self.render(self.CDate, text=f'{self.new_date:^16}')
+
+            self.jobs.once("clock", self.weather.next_minute(), self.date_time_update)
         except KeyError:    # If wrong city entered but time is moving accordingly
             pass
 
 
-    def temp_update(self) -> None:
-        """Updates all the values after 5 minuters."""
+    def visibility_changed(self, event : tk.Event) -> None:
+        """--------------------------| Power Saving |--------------------------
+        While window is minimized or fully covered, refresh, clock and timings overlay are held,
+        so neither the network nor the CPU wakes up for them. When it is shown again, held jobs which
+        came due run at once, and weather is refreshed at once (from the cache if it is still fresh)."""
 
-        self.update_values()
-        self.after(300000, self.temp_update)
+        if (event.widget is not self) or (window_hidden(event)==self.hidden):
+            return
+
+        self.hidden = window_hidden(event)
+        if self.hidden:
+            self.jobs.pause(self.hidden_jobs)
+        elif "refresh" in self.jobs.resume():
+            self.jobs.once("refresh", 0, lambda: self.temp_update(revalidate=False))
+
+
+    def temp_update(self, revalidate : bool = True) -> None:
+        """Fetch weather of shown city again in background and updates all the values.
+        The API is asked even if weather was fetched recently (conditionally, if it gave ETag / Last-Modified),
+        unless revalidate is False, then weather still fresh in cache is used."""
+
+        if self.searching:          # refreshed after the search, whether it is found or not
+            self.jobs.once("refresh", self.weather.next_refresh(self.unchanged), self.temp_update)
+            return
+        if self.updating is not None:       # previous refresh is still being fetched
+            return
+
+        self.refreshes += 1
+        self.updating = refresh = self.refreshes
+        self.refreshing(True)
+        self.fetch_start = time.perf_counter()
+        self.hourly_asked = self.weather.fetch_hourly
+        self.fetcher.submit(self.weather.fetch_forecast, self.weather_city, revalidate,
+        callback=lambda result: self.refresh_values(result, refresh, revalidate),
+        error=lambda e: self.refresh_values((e, None, None), refresh, revalidate))
+
+
+    def refresh_values(self, result : tuple[int | Exception, dict | None, dict | None], refresh : int,
+                       revalidate : bool = True) -> None:
+        """Called on Tk main loop when background refresh is finished,
+        keep showing old values if refresh failed or brought nothing new.
+        Next refresh is scheduled when newer weather is expected, only a refresh answered by the API
+        (revalidate, not served from cache) which brought nothing new spaces out next ones.
+        Result of a refresh superseded by a search is ignored, the search shows newer weather and schedules next refresh."""
+
+        if refresh != self.updating:
+            return
+
+        self.updating = None
+        self.refreshing(False)
+        exit_code, current_json, forecast_json = result
+        if (exit_code == 0) and self.weather.same_forecast(current_json, forecast_json):
+            # OpenWeatherMap has no newer weather yet, nothing to update
+            if revalidate:      # weather still fresh in cache tells nothing about the API
+                self.unchanged += 1
+            self.weather.timings.add("refresh unchanged", self.fetch_start)
+        elif (exit_code == 0) and (self.weather.set_forecast(current_json, forecast_json) == 0):
+            self.unchanged = 0
+            self.weather.save_forecast(self.weather_city, current_json, forecast_json)
+            try:
+                self.update_values()
+                self.weather.timings.add("refresh to paint", self.fetch_start)
+                self.log_timings()
+            except tk.TclError:
+                pass
+        # else failed (no network, time out): tried again without backing off,
+        # an API which didn't answer tells nothing about when newer weather comes
+
+        self.jobs.once("refresh", 0 if self.hourly_missing() else self.weather.next_refresh(self.unchanged), self.temp_update)
+
+
+    def hourly_missing(self) -> bool:
+        """True if graphs need hourly forecast which the weather just fetched didn't ask for,
+        as view was switched to expand while it was being fetched"""
+
+        return self.weather.fetch_hourly and not (self.hourly_asked or self.weather.has_hourly())
+
+
+    def open_dashboard(self, event=None) -> None:
+        """--------------------------| Dashboard |--------------------------
+        Open weather of every city in ./assets/dashboard.txt in a dashboard window (Ctrl+D),
+        or bring it to front if it is already open."""
+
+        if self.dashboard is not None:
+            self.dashboard.lift()
+            return
+
+        with open("./assets/dashboard.txt") as d:
+            cities = [city.strip().upper() for city in d.read().splitlines() if city.strip()]
+        if cities:
+            self.dashboard = Dashboard(self, list(dict.fromkeys(cities)))
+
+
+    def toggle_timings(self, event=None) -> str:
+        """--------------------------| Timings Overlay |--------------------------
+        Show or hide p50 / p95 of every stage of searches and refreshes (F10), updated every second."""
+
+        if self.timings_label is not None:
+            self.jobs.cancel("timings")
+            self.timings_label.destroy()
+            self.timings_label = None
+        else:
+            self.timings_label = tk.Label(self, font=("Courier New", 9), justify="left", anchor="w", bg="black", fg="#00FF00")
+            self.timings_label.place(relx=0, rely=1, anchor="sw")
+            self.jobs.every("timings", 1000, self.show_timings, delay=0)
+        return "break"
+
+
+    def show_timings(self) -> None:
+        """Update timings overlay, kept above weather frames"""
+
+        __report = self.weather.timings.report()
+        if self.timings_label.cget("text")!=__report:
+            self.timings_label.configure(text=__report)
+        self.timings_label.lift()
+
+
+    def log_timings(self) -> None:
+        """Print timings of every stage, if WEATHER_TIMINGS is set"""
+
+        if self.print_timings:
+            print(self.weather.timings.report(), end="\n\n", flush=True)
 
     
     def github_link(self) -> None:
@@ -1745,9 +2159,8 @@ or click 'OK'.\nPlease report this error to the developer with the screenshot at
 
     def location_verify(self) -> None:
         """--------------------| Check New Location |--------------------
-        Search entered location in settings and check whether the location is correct or not."""
+        Search entered location in settings in background and check whether the location is correct or not."""
 
-        confirm = False
         self.search_new_loc = self.new_loc_entry.get().strip()
         if (not self.search_new_loc.isalpha()) and not ((" " in self.search_new_loc) or ("-" in self.search_new_loc) or ("'" in self.search_new_loc)):
             messagebox.showerror(title="Invalid City Name", message="Please Enter Alphabetic Characters Only!")
@@ -1755,23 +2168,54 @@ or click 'OK'.\nPlease report this error to the developer with the screenshot at
             self.settings_win.focus()
             return
 
+        self.verify_attempts = 0
+        self.fetch_location()
+
+
+    def fetch_location(self) -> None:
+        """Fetch location entered in settings in background, shown by location_verified()"""
+
+        try:
+            self.new_loc_verify.configure(text="Verifying...", state="disabled")
+        except tk.TclError:     # settings window is closed
+            return
+        self.fetcher.submit(self.weather.fetch_weather, self.search_new_loc, callback=self.location_verified,
+        error=lambda e: self.location_verified((e, None)))
+
+
+    def location_verified(self, result : tuple[int | Exception, dict | None]) -> None:
+        """Called on Tk main loop when location entered in settings is fetched in background.
+        If it timed out, it is fetched again after 10 seconds, at most VERIFY_RETRIES times."""
+
+        confirm = False
+        exit_code, new_loc_json = result
         try:
-            new_loc_req = requests.get(f"https://api.openweathermap.org/data/2.5/weather?q={self.search_new_loc}\
-&appid={self._API}&units={self._UNITS[self._unit][1]}", timeout=15)
+            self.new_loc_verify.configure(text="Verify", state="normal")
+        except tk.TclError:     # settings window is closed
+            return
+
+        if isinstance(exit_code, Exception):   # Any unknwon exception while fetching
+            messagebox.showerror(title="Unkown Error: Weather App",message=f"An Unkown Error occurred!\nPlease verify the location again,\
+or click 'OK'.\nPlease report this error to the developer with the screenshot attached.\n\nError:\n{exit_code}")
+            self.new_loc.set(self.default_city)
 
-        except requests.exceptions.ConnectionError:     # No Internet
+        elif exit_code==1:     # No Internet
             messagebox.showerror(title="Error: 1 Weather App", message="No Internet Connection found!\
                 \nPlease connect to the Internet to search weather.")
             self.new_loc.set(self.default_city)
 
-        except requests.Timeout:                        # response time out
+        elif (exit_code==2) and (self.verify_attempts < self.VERIFY_RETRIES):    # response time out, retry
+            self.verify_attempts += 1
+            self.new_loc_verify.configure(text=f"Retrying ({self.verify_attempts})...", state="disabled")
+            self.jobs.once("verify", 10000, self.fetch_location)
+            return
+
+        elif exit_code==2:   # response time out, even after retries
             messagebox.showinfo(title="Error: 2 Weather App",
             message="The Website (openweather) is taking too much to respond.\nPlease try again later.\nThank you.")
-            self.after(10000, self.Search_Weather)
             self.new_loc.set(self.default_city)
 
         else:
-            new_loc_json = new_loc_req.json()
             try:        # Fetching temp to check for correct location
                 new_loc_json["main"]["temp"]
                 confirm = True
@@ -1804,8 +2248,11 @@ or click 'OK'.\nPlease report this error to the developer with the screenshot at
         with open("./assets/unit.txt", "w+") as u:
             u.write(self.unit_var.get())
             u.seek(0)
-            self._unit = u.read()
-            self.Search_Weather()
+            self.weather.unit = u.read()
+
+        # weather is kept in Celsius, so only show it again in new unit
+        if not self.start:
+            self.update_values()
 
         with open("./assets/view.txt", "w+") as v:
             v.write(self.new_view.get())
@@ -1830,8 +2277,12 @@ or click 'OK'.\nPlease report this error to the developer with the screenshot at
             self.unit_var.set("C")
             u.write(self.unit_var.get())
             u.seek(0)
-            self._unit = u.read()
-        
+            self.weather.unit = u.read()
+
+        # weather is kept in Celsius, so only show it again in Celsius
+        if not self.start:
+            self.update_values()
+
         with open("./assets/view.txt", "w+") as v:
             self.new_view.set("normal")
             v.write(self.new_view.get())
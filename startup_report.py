@@ -0,0 +1,111 @@
+#----------------------------| Startup Import Report |----------------------------
+"""Report what starting the app costs.
+
+Runs `python -X importtime -c "import main"` in a fresh interpreter, prints the
+slowest modules by cumulative time and exits with 1 if one of the heavy modules
+(that main.py imports at first use) got imported at startup.
+
+Then, if there is a display, makes WeatherApp() in another fresh interpreter and
+times it till its first idle (window drawn), with the heavy modules imported by
+then, and exits with 1 if that took more than the budget (milli seconds).
+
+usage: python startup_report.py [top] [budget]
+"""
+import json, os, subprocess, sys
+
+HEAVY = ("matplotlib", "PIL", "countryinfo", "requests", "numpy")
+# milli seconds from start of interpreter till first idle of the window
+FIRST_PAINT_BUDGET = 1500
+
+# run in the new interpreter: WeatherApp() till its first idle, the API is a closed port so nothing is fetched
+FIRST_PAINT = """
+import json, sys, time, tkinter
+__start = time.perf_counter()
+import main
+try:
+    app = main.WeatherApp()
+except tkinter.TclError:
+    print(json.dumps(None))
+    sys.exit(0)
+
+def painted():
+    __heavy = sorted({name.split(".")[0] for name in sys.modules} & set(main_heavy))
+    print(json.dumps({"ms" : (time.perf_counter() - __start) * 1000, "heavy" : __heavy}), flush=True)
+    app.destroy()
+
+app.after_idle(painted)
+app.mainloop()
+"""
+
+
+def import_times() -> list[tuple[int, int, str]]:
+    """Import `main` in a new interpreter and collect its import times
+
+    return:
+        [(self_us, cumulative_us, module), ...]"""
+
+    __result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+    cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+
+    __times = []
+    for __line in __result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not __line.startswith("import time:"):
+            continue
+        __fields = __line[len("import time:"):].split("|")
+        if len(__fields) != 3 or not __fields[0].strip().isdigit():
+            continue                # header line
+        __times.append((int(__fields[0]), int(__fields[1]), __fields[2].strip()))
+
+    if __result.returncode != 0:
+        sys.stderr.write(__result.stderr.splitlines()[-1] + "\n" if __result.stderr else "import main failed\n")
+        sys.exit(2)
+    return __times
+
+
+def first_paint() -> dict | None:
+    """Make WeatherApp() in a new interpreter and time it till its first idle
+    return:
+        { "ms" : milli seconds, "heavy" : [heavy modules imported by then] }, None if there is no display"""
+
+    __env = {**os.environ, "WEATHER_API_URL" : "http://127.0.0.1:9/data/2.5"}
+    __result = subprocess.run([sys.executable, "-c", f"main_heavy = {HEAVY!r}\n{FIRST_PAINT}"],
+    cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, env=__env, timeout=60)
+
+    if __result.returncode != 0 or not __result.stdout.strip():
+        sys.stderr.write(__result.stderr.splitlines()[-1] + "\n" if __result.stderr else "WeatherApp() failed\n")
+        sys.exit(2)
+    return json.loads(__result.stdout.splitlines()[0])
+
+
+def main(top : int = 15, budget : float = FIRST_PAINT_BUDGET) -> int:
+    __times = import_times()
+    __total = sum(__self for __self, _, _ in __times)
+    print(f"import main: {__total / 1000:.1f} ms, {len(__times)} modules\n")
+
+    print(f"{'cumulative':>12}  {'self':>10}  module")
+    for __self, __cumulative, __name in sorted(__times, key=lambda t: t[1], reverse=True)[:top]:
+        print(f"{__cumulative / 1000:>10.1f}ms  {__self / 1000:>8.1f}ms  {__name}")
+
+    __status = 0
+    __eager = sorted({__name.split(".")[0] for _, _, __name in __times} & set(HEAVY))
+    if __eager:
+        print(f"\nimported at startup: {', '.join(__eager)}")
+        __status = 1
+    else:
+        print(f"\nnot imported at startup: {', '.join(HEAVY)}")
+
+    __paint = first_paint()
+    if __paint is None:
+        print("first paint: skipped, no display")
+        return __status
+    print(f"first paint: {__paint['ms']:.1f} ms (budget {budget:.0f} ms), "
+          f"imported by then: {', '.join(__paint['heavy']) or 'none of ' + ', '.join(HEAVY)}")
+    if __paint["ms"] > budget:
+        __status = 1
+    return __status
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 15,
+                  float(sys.argv[2]) if len(sys.argv) > 2 else FIRST_PAINT_BUDGET))
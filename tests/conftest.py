@@ -0,0 +1,30 @@
+"""Shared setup of the tests: the app folder and benchmarks/ (fake OpenWeatherMap API) are importable."""
+import os, sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+
+@pytest.fixture(scope="session")
+def main_module():
+    """main.py, imported from the app folder as it reads ./assets while its classes are made"""
+
+    __cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        import main
+    finally:
+        os.chdir(__cwd)
+    return main
+
+
+@pytest.fixture(scope="session")
+def fake_owm():
+    """Fake OpenWeatherMap API on localhost, for the whole test session"""
+
+    from fake_owm import FakeOWM
+
+    with FakeOWM() as fake:
+        yield fake
@@ -0,0 +1,68 @@
+"""RateLimiter token buckets, and the share of API calls kept for searches of the window."""
+import pytest
+import weather_core
+from weather_core import RateLimiter, WeatherCore
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake time.monotonic() and time.sleep() of weather_core, sleeping moves the clock
+    return:
+        [now], moved by clock[0] += seconds"""
+
+    __now = [1000.0]
+
+    def sleep(seconds):
+        __now[0] += seconds
+
+    monkeypatch.setattr(weather_core.time, "monotonic", lambda: __now[0])
+    monkeypatch.setattr(weather_core.time, "sleep", sleep)
+    return __now
+
+
+def test_burst_then_waits_for_rate(clock):
+    limiter = RateLimiter(rate=2, burst=3)
+    assert [limiter.wait("api") for _ in range(3)] == [0, 0, 0]
+    assert limiter.wait("api") == pytest.approx(0.5)
+    assert limiter.wait("api") == pytest.approx(0.5)       # reserved the token after the one slept for
+
+
+def test_tokens_refill_over_time(clock):
+    limiter = RateLimiter(rate=2, burst=3)
+    for _ in range(3):
+        limiter.wait("api")
+    clock[0] += 1                                          # 2 tokens back
+    assert [limiter.wait("api") for _ in range(2)] == [0, 0]
+    assert limiter.wait("api") == pytest.approx(0.5)
+
+
+def test_refill_is_capped_at_burst(clock):
+    limiter = RateLimiter(rate=2, burst=3)
+    limiter.wait("api")
+    clock[0] += 3600
+    assert [limiter.wait("api") for _ in range(3)] == [0, 0, 0]
+    assert limiter.wait("api") > 0
+
+
+def test_hosts_have_separate_buckets(clock):
+    limiter = RateLimiter(rate=1, burst=1)
+    assert limiter.wait("a") == 0
+    assert limiter.wait("b") == 0
+    assert limiter.wait("a") == pytest.approx(1)
+
+
+def test_background_share_does_not_starve_searches(clock, monkeypatch):
+    monkeypatch.setattr(WeatherCore, "_RATE_LIMIT", 60.0)
+    monkeypatch.setattr(WeatherCore, "_SEARCH_RATE", 12.0)
+    monkeypatch.setattr(WeatherCore._client, "limiter", RateLimiter(WeatherCore._SEARCH_RATE / 60))
+    background = WeatherCore.background_client(cities=8)
+
+    assert background.limiter is not WeatherCore._client.limiter
+    assert background.limiter.rate + WeatherCore._client.limiter.rate == pytest.approx(1)      # 60 calls a minute in all
+
+    __start = clock[0]
+    __waited = sum(background.limiter.wait(background.host) for _ in range(60))
+    assert __waited > 0                                    # dashboard ran out of its share...
+    assert clock[0] - __start == pytest.approx(__waited)
+    searches = [WeatherCore._client.limiter.wait(WeatherCore._client.host) for _ in range(WeatherCore._client.limiter.burst)]
+    assert searches == [0] * len(searches)                 # ...searches of the window still go at once
@@ -0,0 +1,108 @@
+"""Wait till next refresh: WeekForecast.next_refresh() and its backoff kept by WeatherApp.refresh_values()."""
+import types
+import pytest
+import weather_core
+from fake_owm import onecall_payload, weather_payload
+from weather_core import WeatherCore
+
+NOW = 1_700_000_000
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    monkeypatch.setattr(weather_core.time, "time", lambda: NOW)
+
+
+def core_at(dt : int) -> WeatherCore:
+    """WeatherCore showing weather calculated by the API at dt"""
+
+    weather = WeatherCore("C")
+    weather.set_forecast(weather_payload("London", dt=dt), onecall_payload(51.5, -0.12, dt=dt))
+    return weather
+
+
+#----------------------------| next_refresh() |----------------------------
+def test_waits_till_newer_weather_is_expected():
+    assert core_at(NOW - 300).next_refresh() == 300_000
+
+
+def test_wait_is_clamped_at_least():
+    assert core_at(NOW - 550).next_refresh() == 120_000
+
+
+def test_wait_is_clamped_at_most():
+    assert core_at(NOW + 1000).next_refresh() == 900_000
+
+
+def test_stale_weather_is_asked_again_soon():
+    assert core_at(NOW - 3600).next_refresh() == 120_000
+
+
+@pytest.mark.parametrize("unchanged, wait", [(1, 240_000), (2, 480_000), (3, 900_000), (10, 900_000)])
+def test_wait_doubles_after_unchanged_answers(unchanged, wait):
+    assert core_at(NOW - 300).next_refresh(unchanged) == wait
+
+
+#----------------------------| refresh_values() |----------------------------
+class Jobs:
+    def __init__(self):
+        self.scheduled = {}
+
+    def once(self, name, delay, func):
+        self.scheduled[name] = delay
+
+
+@pytest.fixture
+def app(main_module, monkeypatch):
+    """Stand-in of WeatherApp with a refresh running, showing stale weather of London"""
+
+    __app = types.SimpleNamespace(updating=1, unchanged=0, fetch_start=0.0, weather_city="London", jobs=Jobs(),
+                                  weather=core_at(NOW - 3600), painted=0)
+    __app.refreshing = lambda running: None
+    __app.hourly_missing = lambda: False
+    __app.update_values = lambda: setattr(__app, "painted", __app.painted + 1)
+    __app.log_timings = lambda: None
+    __app.temp_update = lambda: None
+    monkeypatch.setattr(__app.weather, "save_forecast", lambda *args: None)
+    __app.refresh = lambda result, revalidate=True: main_module.WeatherApp.refresh_values(__app, result, 1, revalidate)
+    return __app
+
+
+def same_answer():
+    return (0, weather_payload("London", dt=NOW - 3600), onecall_payload(51.5, -0.12, dt=NOW - 3600))
+
+
+def test_unchanged_answer_backs_off(app):
+    app.refresh(same_answer())
+    assert app.unchanged == 1
+    assert app.jobs.scheduled["refresh"] == 240_000
+    assert app.painted == 0
+
+
+def test_cached_answer_does_not_back_off(app):
+    app.refresh(same_answer(), revalidate=False)
+    assert app.unchanged == 0
+    assert app.jobs.scheduled["refresh"] == 120_000
+
+
+@pytest.mark.parametrize("exit_code", [1, 2])
+def test_network_error_does_not_back_off(app, exit_code):
+    app.unchanged = 2
+    app.refresh((exit_code, None, None))
+    assert app.unchanged == 2
+    assert app.jobs.scheduled["refresh"] == 480_000
+    assert app.updating is None
+
+
+def test_newer_answer_resets_backoff(app):
+    app.unchanged = 3
+    app.refresh((0, weather_payload("London", dt=NOW - 60), onecall_payload(51.5, -0.12, dt=NOW - 60)))
+    assert app.unchanged == 0
+    assert app.painted == 1
+    assert app.jobs.scheduled["refresh"] == 540_000
+
+
+def test_superseded_refresh_is_ignored(app, main_module):
+    main_module.WeatherApp.refresh_values(app, (1, None, None), 0)
+    assert app.updating == 1
+    assert app.jobs.scheduled == {}
@@ -0,0 +1,108 @@
+"""ResponseCache expiry, LRU eviction and validators, and APIClient.get_json() conditional requests."""
+import json, time
+import pytest
+import weather_core
+from weather_core import APIClient, ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake time.monotonic() of weather_core, moved by clock[0] += seconds"""
+
+    __now = [1000.0]
+    monkeypatch.setattr(weather_core.time, "monotonic", lambda: __now[0])
+    return __now
+
+
+def test_payload_expires_after_ttl(clock):
+    cache = ResponseCache(ttl=600)
+    cache.put(("weather", ()), {"dt" : 1})
+    clock[0] += 599
+    assert cache.get(("weather", ())) == {"dt" : 1}
+    clock[0] += 2
+    assert cache.get(("weather", ())) is None
+
+
+def test_ttl_of_put_overrides_default(clock):
+    cache = ResponseCache(ttl=600)
+    cache.put("a", {}, ttl=10)
+    clock[0] += 11
+    assert cache.get("a") is None
+
+
+def test_least_recently_used_is_evicted(clock):
+    cache = ResponseCache(maxsize=2)
+    cache.put("a", {"a" : 1})
+    cache.put("b", {"b" : 1})
+    cache.get("a")                  # b is now least recently used
+    cache.put("c", {"c" : 1})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"a" : 1}
+    assert cache.get("c") == {"c" : 1}
+
+
+def test_validators_are_kept_after_expiry(clock):
+    cache = ResponseCache(ttl=1)
+    cache.put("a", {"a" : 1}, etag='"abc"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+    cache.put("b", {"b" : 1})
+    clock[0] += 5
+    assert cache.get("a") is None
+    assert cache.validators("a") == ({"a" : 1}, '"abc"', "Mon, 01 Jan 2024 00:00:00 GMT")
+    assert cache.validators("b") is None        # nothing to revalidate with
+    assert cache.validators("c") is None
+
+
+def test_clear_removes_everything(clock):
+    cache = ResponseCache()
+    cache.put("a", {}, etag='"a"')
+    cache.clear()
+    assert cache.get("a") is None and cache.validators("a") is None
+
+
+#----------------------------| APIClient against fake API |----------------------------
+@pytest.fixture
+def fixed_api(tmp_path):
+    """Fake API always answering the same payload, so its ETag doesn't change"""
+
+    from fake_owm import FakeOWM, weather_payload
+
+    with open(tmp_path / "weather.json", "w") as f:
+        json.dump(weather_payload("London"), f)
+    with FakeOWM(fixtures=str(tmp_path)) as fake:
+        yield fake
+
+
+def test_fresh_payload_is_served_from_cache(fixed_api):
+    client = APIClient("test", cache=ResponseCache(ttl=600), base_url=fixed_api.url)
+    first = client.get_json("weather", q="London")
+    assert client.get_json("weather", q="London") == first
+    assert fixed_api.hits["weather"] == 1
+
+
+def test_revalidation_answered_by_304_keeps_payload(fixed_api):
+    cache = ResponseCache(ttl=0.05)
+    client = APIClient("test", cache=cache, base_url=fixed_api.url)
+    first = client.get_json("weather", q="London")
+    time.sleep(0.1)                 # expired, asked again with If-None-Match
+
+    assert client.get_json("weather", q="London") is first      # cached payload itself, not a decoded 200
+    assert fixed_api.hits["weather"] == 2
+    # 304 made the cached payload fresh again, with the same ETag
+    __key = ("weather", (("q", "London"),))
+    assert cache.get(__key) == first
+    assert cache.validators(__key)[1].startswith('"')
+
+
+def test_revalidate_asks_api_even_if_fresh(fixed_api):
+    client = APIClient("test", cache=ResponseCache(ttl=600), base_url=fixed_api.url)
+    client.get_json("weather", q="London")
+    client.get_json("weather", revalidate=True, q="London")
+    assert fixed_api.hits["weather"] == 2
+
+
+def test_error_payload_is_not_cached(fake_owm):
+    cache = ResponseCache()
+    client = APIClient("test", cache=cache, base_url=fake_owm.url)
+    assert client.get_json("weather", q="Atlantis")["cod"] == "404"
+    assert cache.validators(("weather", (("q", "Atlantis"),))) is None
+    assert cache.get(("weather", (("q", "Atlantis"),))) is None
@@ -0,0 +1,198 @@
+"""Scheduler of main.py and the frame job of GraphTooltip, on a fake Tk root whose after() calls are run by hand."""
+import itertools
+import pytest
+
+
+class FakeRoot:
+    """after() / after_cancel() of a Tk widget, pending calls are run by run()"""
+
+    def __init__(self):
+        self.pending = {}           # { after id : (delay, func, args) }
+        self.__ids = itertools.count()
+
+    def after(self, delay, func, *args):
+        __id = f"after#{next(self.__ids)}"
+        self.pending[__id] = (delay, func, args)
+        return __id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def delays(self) -> list[int]:
+        return sorted(delay for delay, _, _ in self.pending.values())
+
+    def run(self) -> None:
+        """Run every pending call once"""
+
+        for __id in list(self.pending):
+            if __id in self.pending:
+                _, func, args = self.pending.pop(__id)
+                func(*args)
+
+
+@pytest.fixture
+def root():
+    return FakeRoot()
+
+
+@pytest.fixture
+def jobs(main_module, root):
+    return main_module.Scheduler(root)
+
+
+@pytest.fixture
+def clock(main_module, monkeypatch):
+    """Fake time.monotonic() of main.py, moved by clock[0] += seconds"""
+
+    __now = [500.0]
+    monkeypatch.setattr(main_module.time, "monotonic", lambda: __now[0])
+    return __now
+
+
+def test_once_runs_once(jobs, root):
+    runs = []
+    jobs.once("clock", 250, lambda: runs.append(1))
+    assert root.delays() == [250]
+    root.run()
+    root.run()
+    assert runs == [1]
+    assert jobs.active() == {}
+
+
+def test_every_runs_again_after_interval(jobs, root):
+    runs = []
+    jobs.every("timings", 1000, lambda: runs.append(1), delay=0)
+    assert root.delays() == [0]
+    root.run()
+    assert root.delays() == [1000]
+    root.run()
+    assert runs == [1, 1]
+    assert jobs.active()["timings"][1] == 1000
+
+
+def test_same_name_replaces_pending_job(jobs, root):
+    runs = []
+    jobs.once("refresh", 100, lambda: runs.append("old"))
+    jobs.once("refresh", 200, lambda: runs.append("new"))
+    assert root.delays() == [200]
+    root.run()
+    assert runs == ["new"]
+
+
+def test_cancel(jobs, root):
+    jobs.once("refresh", 100, lambda: None)
+    jobs.every("timings", 100, lambda: None)
+    jobs.cancel("refresh")
+    jobs.cancel("unknown")
+    assert list(jobs.active()) == ["timings"]
+    jobs.cancel_all()
+    assert jobs.active() == {} and root.pending == {}
+
+
+def test_active_tells_time_left(jobs, clock):
+    jobs.once("refresh", 3000, lambda: None)
+    clock[0] += 1
+    assert jobs.active() == {"refresh" : (2.0, None)}
+
+
+def test_pause_holds_jobs_till_resume(jobs, root, clock):
+    runs = []
+    jobs.once("refresh", 10000, lambda: runs.append("refresh"))
+    jobs.once("fetch", 50, lambda: runs.append("fetch"))
+    jobs.pause(["refresh", "clock"])
+    assert root.delays() == [50]            # only jobs not held wake Tk up
+
+    jobs.once("clock", 1000, lambda: runs.append("clock"))      # scheduled while held, waits too
+    assert root.delays() == [50]
+    assert sorted(jobs.active()) == ["fetch"]
+
+    clock[0] += 4
+    assert sorted(jobs.resume()) == ["clock", "refresh"]
+    assert root.delays() == [0, 50, 6000]   # clock came due while held, refresh keeps its due time
+
+
+def test_resume_runs_missed_job_once(jobs, root, clock):
+    runs = []
+    jobs.every("clock", 1000, lambda: runs.append(1))
+    jobs.pause(["clock"])
+    clock[0] += 60                  # 60 runs missed
+    jobs.resume()
+    root.run()
+    assert runs == [1]
+    assert root.delays() == [1000]
+
+
+def test_job_scheduled_after_resume_is_not_held(jobs, root):
+    jobs.pause(["refresh"])
+    jobs.resume()
+    jobs.once("refresh", 100, lambda: None)
+    assert root.delays() == [100]
+
+
+def test_job_paused_by_its_own_callback_is_scheduled_once(jobs, root, clock):
+    # a repeating job whose run hides the window, and a one shot job rescheduling itself while held
+    def hide():
+        jobs.pause(["clock", "refresh"])
+        jobs.once("refresh", 300, refresh)
+
+    def refresh():
+        jobs.once("refresh", 300, refresh)
+
+    jobs.every("clock", 1000, hide)
+    root.run()
+    assert root.pending == {}
+
+    assert sorted(jobs.resume()) == ["clock", "refresh"]
+    assert root.delays() == [300, 1000]
+    jobs.resume()                   # nothing held any more
+    assert root.delays() == [300, 1000]
+
+
+@pytest.fixture
+def tooltip(main_module, jobs, monkeypatch):
+    """GraphTooltip of a 3 point graph drawn off screen, at a fake time.perf_counter() of main.py"""
+
+    pytest.importorskip("matplotlib")
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    monkeypatch.setattr(main_module.time, "perf_counter", lambda: 100.0)
+    __figure = Figure()
+    __axes = __figure.add_subplot(111, xlim=(-0.5, 2.5), ylim=(4, 8))
+    __canvas = FigureCanvasAgg(__figure)
+    __annot = __axes.annotate(text="", xy=(0, 0))
+    __tooltip = main_module.GraphTooltip(__canvas, __axes, __annot, jobs, "cw_tooltip")
+    __tooltip.set_points([0, 1, 2], [5, 6, 7], ["5°c", "6°c", "7°c"])
+    __canvas.draw()
+    return __tooltip, __canvas, __axes, __annot
+
+
+def move(canvas, axes, xdata):
+    from matplotlib.backend_bases import MouseEvent
+
+    __x, __y = axes.transData.transform((xdata, 6))
+    canvas.callbacks.process("motion_notify_event", MouseEvent("motion_notify_event", canvas, __x, __y))
+
+
+def test_tooltip_waits_for_next_frame_as_a_job(tooltip, jobs, root):
+    _, canvas, axes, annot = tooltip
+    move(canvas, axes, 0.1)             # first move is drawn at once
+    assert annot.get_text() == "5°c"
+    move(canvas, axes, 1.1)             # moves in the same frame wait for the next one...
+    move(canvas, axes, 1.9)
+    assert list(jobs.active()) == ["cw_tooltip"]
+    assert len(root.pending) == 1
+    root.run()
+    assert annot.get_text() == "7°c"    # ...which shows the last of them
+    assert jobs.active() == {}
+
+
+def test_tooltip_cancel_drops_waiting_frame(tooltip, jobs, root):
+    __tooltip, canvas, axes, annot = tooltip
+    move(canvas, axes, 0.1)
+    move(canvas, axes, 1.9)
+    __tooltip.cancel()
+    assert root.pending == {}
+    assert annot.get_text() == "5°c"
+    move(canvas, axes, 1.1)             # waits for a frame again
+    assert list(jobs.active()) == ["cw_tooltip"]
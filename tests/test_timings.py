@@ -0,0 +1,37 @@
+import random
+
+import numpy as np
+import pytest
+
+from weather_core import Timings
+
+
+@pytest.mark.parametrize("q", [0, 50, 95, 100])
+@pytest.mark.parametrize("size", [1, 2, 7, 100])
+def test_percentile_matches_numpy(size, q):
+    __times = [random.uniform(0, 500) for _ in range(size)]
+    assert Timings.percentile(__times, q) == pytest.approx(float(np.percentile(__times, q)))
+
+
+def test_summary_counts_and_last(monkeypatch):
+    monkeypatch.setattr("weather_core.time.perf_counter", lambda: 1.0)
+    __timings = Timings(size=3)
+    for __ms in (10, 30, 20, 40):
+        __timings.add("stage", 1.0 - __ms / 1000)
+
+    __count, __p50, __p95, __last = __timings.summary()["stage"]
+    assert __count == 3         # only the last 3 are kept
+    assert (__p50, __p95, __last) == pytest.approx((30, 39, 40))
+
+
+def test_timed_records_failed_stage_apart():
+    __timings = Timings()
+    with __timings.timed("GET /weather"):
+        pass
+    with pytest.raises(TimeoutError):
+        with __timings.timed("GET /weather"):
+            raise TimeoutError
+
+    __summary = __timings.summary()
+    assert __summary["GET /weather"][0] == 1
+    assert __summary["GET /weather (error)"][0] == 1
@@ -0,0 +1,116 @@
+"""Headless WeatherCore: unit conversion, forecast model, weather images and saved forecasts."""
+import numpy as np
+import pytest
+from fake_owm import onecall_payload, weather_payload
+from weather_core import Forecast, ForecastStore, WeatherCore
+
+
+#----------------------------| Temperature Unit |----------------------------
+def test_to_unit_celsius_is_rounded():
+    assert WeatherCore("C").to_unit(21.456) == 21.46
+
+
+def test_to_unit_fahrenheit():
+    weather = WeatherCore("F")
+    assert weather.to_unit(100) == 212
+    assert weather.to_unit(-40.0) == -40.0
+    assert weather.to_unit(np.float64(21.5)) == 70.7
+
+
+def test_to_unit_array():
+    converted = WeatherCore("F").to_unit(np.array([0.0, 37.0]))
+    assert isinstance(converted, np.ndarray)
+    assert converted.tolist() == [32.0, 98.6]
+
+
+def test_unit_change_converts_kept_forecast():
+    weather = WeatherCore("C")
+    weather.set_forecast(weather_payload("London"), onecall_payload(51.5, -0.12))
+    celsius = weather.week_temps()
+    weather.unit = "F"
+    assert np.allclose(weather.week_temps(), (celsius * 9 / 5 + 32).round(2))
+    assert weather.Seven_days_forecast()[0]["Temp"] == weather.week_temps()[0]
+
+
+#----------------------------| Forecast Model |----------------------------
+def test_forecast_series_are_arrays():
+    payload = onecall_payload(51.5, -0.12)
+    forecast = Forecast(payload)
+
+    assert forecast.hourly.dt.dtype == np.int64
+    assert forecast.hourly.temp.tolist() == [hour["temp"] for hour in payload["hourly"]]
+    assert forecast.hourly.pop.tolist() == [hour["pop"] for hour in payload["hourly"]]
+    # daily temperature and feels like are of day time
+    assert forecast.daily.temp.tolist() == [day["temp"]["day"] for day in payload["daily"]]
+    assert forecast.daily.feels_like.tolist() == [day["feels_like"]["day"] for day in payload["daily"]]
+    assert forecast.daily.temp_night.tolist() == [day["temp"]["night"] for day in payload["daily"]]
+    assert forecast.daily.temp_min[0] == payload["daily"][0]["temp"]["min"]
+    assert forecast.daily.temp_max[0] == payload["daily"][0]["temp"]["max"]
+
+
+def test_forecast_days_and_day_hours():
+    forecast = Forecast(onecall_payload(51.5, -0.12))
+    assert len(forecast.days) == 8
+    assert forecast.days[0].weather_id == 800 and forecast.days[0].icon == "01d"
+
+    labels, ticks = forecast.day_hours
+    assert len(labels) == len(ticks) == 9          # next 24 hours, every 3rd hour
+    assert ticks[0].endswith(("am", "pm"))
+
+
+def test_forecast_without_hourly():
+    payload = onecall_payload(51.5, -0.12)
+    del payload["hourly"]
+    weather = WeatherCore("C")
+    assert not weather.has_hourly()                 # nothing set yet
+    assert weather.set_forecast(weather_payload("London"), payload) == 0
+    assert not weather.has_hourly()
+    assert Forecast(payload).day_hours == ([], [])
+
+
+def test_set_forecast_of_unknown_city():
+    assert WeatherCore("C").set_forecast({"cod" : "404", "message" : "city not found"}, {}) == 3
+
+
+#----------------------------| Weather Images |----------------------------
+@pytest.mark.parametrize("weather_id, icon, image", [
+    (800, "01d", "./assets/sunny.png"),
+    (804, "04n", "./assets/cloudy.png"),
+    (502, "10d", "./assets/rainy.png"),
+    (762, "50d", "./assets/windy.png"),          # by id, though its icon is of fog
+    (999, "13n", "./assets/snow.png"),           # unknown id, by icon code
+    (999, "99x", "./assets/cloudy.png"),         # unknown id and icon
+])
+def test_weather_image(weather_id, icon, image):
+    path, config = WeatherCore("C").weather_image(weather_id, icon)
+    assert path == image
+    assert config is WeatherCore.images_config[image]
+
+
+#----------------------------| Saved Forecasts |----------------------------
+def test_forecast_store_round_trip(tmp_path):
+    path = str(tmp_path / "forecast_cache.json")
+    ForecastStore(path).save("london", {"dt" : 1}, {"current" : {"dt" : 1}})
+
+    assert ForecastStore(path).load("LONDON") == ({"dt" : 1}, {"current" : {"dt" : 1}})
+    assert ForecastStore(path).load("Paris") is None
+
+
+def test_forecast_store_evicts_oldest(tmp_path):
+    path = str(tmp_path / "forecast_cache.json")
+    store = ForecastStore(path, maxsize=2)
+    store.save("A", {"a" : 1}, {})
+    store.save("B", {"b" : 1}, {})
+    store.save("A", {"a" : 2}, {})          # saving again makes A the newest
+    store.save("C", {"c" : 1}, {})
+
+    reloaded = ForecastStore(path, maxsize=2)
+    assert reloaded.load("B") is None
+    assert reloaded.load("A") == ({"a" : 2}, {})
+    assert reloaded.load("C") == ({"c" : 1}, {})
+
+
+def test_forecast_store_broken_file(tmp_path):
+    path = tmp_path / "forecast_cache.json"
+    path.write_text('{"LONDON" : ')
+    assert ForecastStore(str(path)).load("LONDON") is None
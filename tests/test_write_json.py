@@ -0,0 +1,25 @@
+"""write_json() of weather_core: atomic replace, and nothing left behind when writing fails."""
+import json, os
+import pytest
+from weather_core import write_json
+
+
+def test_replaces_file(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text('{"old" : 1}')
+    assert write_json(str(path), {"new" : 1}, separators=(",", ":"))
+    assert path.read_text() == '{"new":1}'
+    assert os.listdir(tmp_path) == ["cache.json"]
+
+
+def test_failed_write_keeps_old_file(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text('{"old" : 1}')
+    with pytest.raises(TypeError):
+        write_json(str(path), {"new" : object()})
+    assert json.loads(path.read_text()) == {"old" : 1}
+    assert os.listdir(tmp_path) == ["cache.json"]       # no temp file left
+
+
+def test_missing_folder_is_not_an_error(tmp_path):
+    assert not write_json(str(tmp_path / "missing" / "cache.json"), {})
@@ -0,0 +1,1035 @@
+"""Weather data of the Weather App, without any widget.
+
+Fetching, parsing and formatting of OpenWeatherMap weather and forecast, and the image and colors
+of every weather. main.py only shows what WeatherCore returns, so the same core can run in a
+script, a server process or a benchmark without a display.
+"""
+#----------------------------| Importing Required modules |----------------------------
+import collections, concurrent.futures, contextlib, datetime, json, os, pytz, tempfile, threading, time, urllib.parse
+# countryinfo, requests and numpy are slow to import, so they are imported at their first use
+
+# settings and caches of the app, found from this file so the core can be imported from any directory
+ASSETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+
+def write_json(path : str, data, **options) -> bool:
+    """Write data to path as json (options are given to json.dump()), atomically: it is written to a temp file
+    next to path which then replaces it, so a kill mid write leaves the old file whole.
+    If the folder is read-only (or full), nothing is written and the caller keeps data in memory only.
+    return:
+        True if data is saved"""
+
+    try:
+        __fd, __temp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(__fd, "w") as f:
+            json.dump(data, f, **options)
+        os.replace(__temp, path)
+        return True
+    except OSError:
+        return False
+    finally:
+        with contextlib.suppress(OSError):      # left only if writing failed
+            os.remove(__temp)
+
+#======================================================| Timings |========================================================
+class Timings:
+    """Rolling durations of the stages of a search or refresh (network, decode, details, widgets...),
+    last `size` of every stage, to see where a slow refresh spends its time.
+    Safe to record from any thread, recording is one perf_counter() and a deque append."""
+
+    def __init__(self, size : int = 100):
+        self.__size = size
+        self.__stages = {}          # { stage : deque of milli seconds }, in order of first record
+        self.__lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def timed(self, stage : str):
+        """Record time taken by the with block as stage, or as "<stage> (error)" if it raises,
+        so a timed out request still shows where the time went"""
+
+        __start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.add(f"{stage} (error)", __start)
+            raise
+        self.add(stage, __start)
+
+    def add(self, stage : str, start : float) -> None:
+        """Record time from start (a time.perf_counter()) till now as stage"""
+
+        __ms = (time.perf_counter() - start) * 1000
+        with self.__lock:
+            if stage not in self.__stages:
+                self.__stages[stage] = collections.deque(maxlen=self.__size)
+            self.__stages[stage].append(__ms)
+
+    @staticmethod
+    def percentile(times : list[float], q : float) -> float:
+        """q-th percentile of times, interpolated between the closest two like numpy.percentile()"""
+
+        __sorted = sorted(times)
+        __rank = (len(__sorted) - 1) * q / 100
+        __low = int(__rank)
+        __high = min(__low + 1, len(__sorted) - 1)
+        return __sorted[__low] + (__sorted[__high] - __sorted[__low]) * (__rank - __low)
+
+    def summary(self) -> dict[str, tuple[int, float, float, float]]:
+        """Percentiles of every stage in milli seconds, without numpy so F10 doesn't import it
+        return:
+            { stage : (count, p50, p95, last) }"""
+
+        with self.__lock:
+            __stages = {stage : list(times) for stage, times in self.__stages.items()}
+        return {stage : (len(times), self.percentile(times, 50), self.percentile(times, 95), times[-1])
+                for stage, times in __stages.items()}
+
+    def report(self) -> str:
+        """summary() as text, one line per stage"""
+
+        __lines = [f"{'stage':<24}{'n':>4}{'p50':>9}{'p95':>9}{'last':>9} ms"]
+        for stage, (count, p50, p95, last) in self.summary().items():
+            __lines.append(f"{stage:<24}{count:>4}{p50:>9.1f}{p95:>9.1f}{last:>9.1f}")
+        return "\n".join(__lines)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__stages.clear()
+
+
+#======================================================| Location Cache |========================================================
+class LocationCache:
+    """Country name, region and time zone of every country code searched so far.
+    CountryInfo parses its whole country database and pytz looks the zone up again on every call,
+    so each country code is resolved only once and optionally saved to disk for the next start."""
+
+    def __init__(self, path : str | None = None):
+        self.__path = path
+        self.__entries = {}         # { country code : { "Country", "Region", "Zone" } }
+        self.__zones = {}           # { zone name : pytz tzinfo }
+
+        if self.__path and os.path.exists(self.__path):
+            try:
+                with open(self.__path) as c:
+                    self.__entries = json.load(c)
+            except (OSError, ValueError):       # broken cache file, resolve again
+                self.__entries = {}
+
+    def resolve(self, con_code : str) -> dict[str, str]:
+        """Get country name, region and time zone name of country code, resolve it if not cached
+        return:
+            { "Country" : country_name, "Region" : region, "Zone" : zone_name }"""
+
+        if con_code not in self.__entries:
+            import countryinfo
+            __country_name = pytz.country_names[con_code]                               # Country name
+            __region = countryinfo.CountryInfo(__country_name).info()["region"]          # Region name
+            __zone_name = pytz.country_timezones[con_code][0]                           # Time zone name
+
+            self.__entries[con_code] = {"Country" : __country_name, "Region" : __region, "Zone" : __zone_name}
+            self.save()
+        return self.__entries[con_code]
+
+    def tzinfo(self, zone_name : str) -> datetime.tzinfo:
+        """Get pytz timezone of zone name, created once per zone"""
+
+        if zone_name not in self.__zones:
+            self.__zones[zone_name] = pytz.timezone(zone_name)
+        return self.__zones[zone_name]
+
+    def save(self) -> None:
+        """Write resolved locations to disk, if a cache file is given"""
+
+        if self.__path:
+            write_json(self.__path, self.__entries)
+
+
+#======================================================| Response Cache |========================================================
+class ResponseCache:
+    """In-memory LRU cache of API payloads, each payload expires after ttl seconds (or max-age of its response).
+    OpenWeatherMap updates its data about every 10 minutes, so asking again earlier only uses up API quota.
+    Expired payloads are kept with their ETag / Last-Modified, so they can be revalidated by a conditional request."""
+
+    def __init__(self, maxsize : int = 32, ttl : float = 600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # { key : (expire time, payload, etag, last modified) }, oldest used first
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()                  # used from worker and http threads
+
+    def get(self, key : tuple) -> dict | None:
+        """Get payload of key, None if not cached or expired"""
+
+        with self.__lock:
+            __entry = self.__entries.get(key)
+            if (__entry is None) or (__entry[0] < time.monotonic()):
+                return None
+            self.__entries.move_to_end(key)
+            return __entry[1]
+
+    def validators(self, key : tuple) -> tuple[dict, str | None, str | None] | None:
+        """Payload of key, even if expired, with ETag and Last-Modified of its response
+        return:
+            (payload, etag, last_modified), None if not cached or its response had neither"""
+
+        with self.__lock:
+            __entry = self.__entries.get(key)
+            if (__entry is None) or (__entry[2] is None and __entry[3] is None):
+                return None
+            return __entry[1:]
+
+    def put(self, key : tuple, payload : dict, etag : str | None = None, last_modified : str | None = None,
+            ttl : float | None = None) -> None:
+        """Store payload of key for ttl seconds (default self.ttl), least recently used payload is removed if cache is full"""
+
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), payload, etag, last_modified)
+            self.__entries.move_to_end(key)
+            while (len(self.__entries) > self.maxsize):
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all payloads"""
+
+        with self.__lock:
+            self.__entries.clear()
+
+
+#======================================================| Forecast Store |========================================================
+class ForecastStore:
+    """Last successful current weather and One Call payloads of a few cities, saved on disk as compact json.
+    At startup the saved weather of default city is shown at once, while fresh weather is fetched in background."""
+
+    def __init__(self, path : str, maxsize : int = 5):
+        self.__path = path
+        self.maxsize = maxsize
+        try:
+            with open(self.__path) as f:
+                self.__entries = json.load(f)       # { "CITY" : { "Saved", "Current", "Forecast" } }, oldest first
+        except (OSError, ValueError):   # no cache yet or broken file
+            self.__entries = {}
+
+    def load(self, city : str) -> tuple[dict, dict] | None:
+        """Get saved (current_json, forecast_json) of city, None if not saved"""
+
+        try:
+            __entry = self.__entries[city.upper()]
+            return (__entry["Current"], __entry["Forecast"])
+        except (KeyError, TypeError):
+            return None
+
+    def save(self, city : str, current_json : dict, forecast_json : dict) -> None:
+        """Save payloads of city, oldest city is removed if store is full"""
+
+        __key = city.upper()
+        self.__entries.pop(__key, None)
+        self.__entries[__key] = {"Saved" : int(time.time()), "Current" : current_json, "Forecast" : forecast_json}
+        while (len(self.__entries) > self.maxsize):
+            del self.__entries[next(iter(self.__entries))]
+
+        write_json(self.__path, self.__entries, separators=(",", ":"))
+
+
+#======================================================| Rate Limiter |========================================================
+class RateLimiter:
+    """Token bucket of every host: up to `burst` calls at once, then `rate` calls per second.
+    A call which finds no token reserves the next one and sleeps till it is due, on its own worker thread,
+    so a batch of fetches never floods a host."""
+
+    def __init__(self, rate : float, burst : int = 10):
+        self.rate = rate
+        self.burst = burst
+        self.__buckets = {}         # { host : (tokens, time of last update) }
+        self.__lock = threading.Lock()
+
+    def wait(self, host : str) -> float:
+        """Take a token of host, sleeping till one is free
+        return:
+            seconds waited"""
+
+        with self.__lock:
+            __now = time.monotonic()
+            __tokens, __last = self.__buckets.get(host, (self.burst, __now))
+            __tokens = min(self.burst, __tokens + (__now - __last) * self.rate) - 1
+            self.__buckets[host] = (__tokens, __now)
+        __delay = -__tokens / self.rate if __tokens < 0 else 0.0
+
+        if __delay:
+            time.sleep(__delay)
+        return __delay
+
+
+#======================================================| HTTP Client |========================================================
+class APIClient:
+    """One shared requests.Session for all OpenWeatherMap calls.
+    Connections are kept alive in a bounded pool, so a refresh doesn't pay a new TLS handshake,
+    and failed connections / server errors are retried with backoff.
+    Successful payloads are kept in a ResponseCache, keyed by endpoint and query (city or coordinates, unit),
+    and asked again with If-None-Match / If-Modified-Since, so unchanged data comes back as an empty 304."""
+
+    BASE_URL = "https://api.openweathermap.org/data/2.5"
+
+    def __init__(self, api_key : str, pool_size : int = 4, retries : int = 2, backoff : float = 0.5, timeout : float = 15,
+                 cache : ResponseCache | None = None, base_url : str | None = None, timings : Timings | None = None,
+                 limiter : RateLimiter | None = None):
+        self.__api_key = api_key
+        self.timings = timings if timings is not None else Timings()
+        self.limiter = limiter
+        # WEATHER_API_URL points the app to another server, e.g. benchmarks/fake_owm.py
+        self.base_url = (base_url or os.environ.get("WEATHER_API_URL") or self.BASE_URL).rstrip("/")
+        self.host = urllib.parse.urlsplit(self.base_url).netloc
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache
+        self.__session = None           # made at first request, so requests is not imported at startup
+        self.__lock = threading.Lock()
+
+        # sends independent requests at the same time, never more than the pool can hold
+        self.__executor = concurrent.futures.ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="weather-http")
+
+    @property
+    def session(self) -> "requests.Session":
+        """Pooled session, made at first use"""
+
+        with self.__lock:
+            if self.__session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                # read timeouts are not retried, they already waited for `timeout` seconds
+                __retry = Retry(total=self.retries, connect=self.retries, read=False, status=self.retries,
+                backoff_factor=self.backoff, status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET"}), raise_on_status=False)
+                __adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, pool_block=True, max_retries=__retry)
+
+                self.__session = requests.Session()
+                self.__session.mount("https://", __adapter)
+                self.__session.mount("http://", __adapter)
+            return self.__session
+
+    def get(self, endpoint : str, headers : dict[str, str] | None = None, **params) -> "requests.Response":
+        """GET endpoint of API (e.g. "weather", "onecall") with params, api key is added automatically.
+        Waits for rate limit of API host first, if any."""
+
+        if self.limiter is not None:
+            __start = time.perf_counter()
+            if self.limiter.wait(self.host):
+                self.timings.add("rate limit wait", __start)
+        return self.session.get(f"{self.base_url}/{endpoint}", params={**params, "appid" : self.__api_key},
+        headers=headers, timeout=self.timeout)
+
+    def get_json(self, endpoint : str, revalidate : bool = False, **params) -> dict:
+        """GET endpoint of API and return its json, served from cache if asked recently.
+        revalidate asks the API even if cached payload is not expired, conditionally if its response had validators."""
+
+        __key = (endpoint, tuple(sorted(params.items())))
+        __cached = None
+        __headers = {}
+        if self.cache is not None:
+            __payload = None if revalidate else self.cache.get(__key)
+            if __payload is not None:
+                return __payload
+            __cached = self.cache.validators(__key)
+            if __cached is not None:
+                if __cached[1]:
+                    __headers["If-None-Match"] = __cached[1]
+                if __cached[2]:
+                    __headers["If-Modified-Since"] = __cached[2]
+
+        with self.timings.timed(f"GET /{endpoint}"):
+            __response = self.get(endpoint, headers=__headers or None, **params)
+        if (__response.status_code == 304) and (__cached is not None):     # not modified, cached payload is fresh again
+            self.cache.put(__key, __cached[0], __response.headers.get("ETag", __cached[1]),
+                           __response.headers.get("Last-Modified", __cached[2]), self.max_age(__response))
+            return __cached[0]
+
+        with self.timings.timed(f"decode /{endpoint}"):
+            __payload = __response.json()
+        if __response.ok and (self.cache is not None):      # error payloads (e.g. city not found) are not cached
+            self.cache.put(__key, __payload, __response.headers.get("ETag"), __response.headers.get("Last-Modified"),
+                           self.max_age(__response))
+        return __payload
+
+    def get_all_json(self, *calls : tuple[str, dict], revalidate : bool = False) -> list[dict]:
+        """get_json() several (endpoint, params) in parallel, payloads are returned in the same order.
+        If any request fails, its exception is raised."""
+
+        __futures = [self.__executor.submit(self.get_json, endpoint, revalidate, **params) for endpoint, params in calls]
+        return [future.result() for future in __futures]
+
+    @staticmethod
+    def max_age(response : "requests.Response") -> float | None:
+        """Seconds response may be cached for, by its Cache-Control header, None if it doesn't tell"""
+
+        for directive in response.headers.get("Cache-Control", "").split(","):
+            __name, _, __value = directive.strip().partition("=")
+            if (__name.lower() == "max-age") and __value.isdigit():
+                return float(__value)
+            if __name.lower() in ("no-cache", "no-store"):
+                return 0.0
+        return None
+
+
+#======================================================| Current Weather |========================================================
+class CurrentWeather:
+    
+    _API = "YOUR_API_KEY"
+
+    _UNITS = {  "C" : ["Celsius", "metric"],
+            "F" : ["Fahreneit", "imperial"],
+        }
+    # weather is always fetched in Celsius and converted to selected unit on display,
+    # so changing unit doesn't need to fetch again
+    _FETCH_UNIT = "C"
+
+    # durations of every stage of searches and refreshes
+    _timings = Timings()
+
+    # calls a minute to API, free plan of OpenWeatherMap allows 60 (WEATHER_RATE_LIMIT=0 is no limit)
+    _RATE_LIMIT = float(os.environ.get("WEATHER_RATE_LIMIT", 60))
+    # part of it kept for searches and refreshes of the window, so they never wait behind a background batch,
+    # the rest is for background batches, see background_client()
+    _SEARCH_RATE = _RATE_LIMIT / 5
+
+    # keep-alive connection pool, shared by every API call of the window
+    _client = APIClient(_API, cache=ResponseCache(maxsize=32, ttl=600), timings=_timings,
+                        limiter=RateLimiter(_SEARCH_RATE / 60) if _RATE_LIMIT else None)
+
+    # last fetched weather of a few cities, shown instantly at startup
+    _forecasts = ForecastStore(os.path.join(ASSETS, "forecast_cache.json"))
+
+    # country name, region and time zone, shared by every search
+    _locations = LocationCache(os.path.join(ASSETS, "location_cache.json"))
+
+    def __init__(self, unit : str | None = None, client : APIClient | None = None):
+        """unit is the temperature unit shown, C or F (default: the one saved in settings),
+        client makes the API calls (default: the one shared by the window, see background_client())"""
+
+        self._unit = unit or self.saved_unit()
+        if client is not None:
+            self._client = client
+
+    @classmethod
+    def background_client(cls, cities : int, pool_size : int = 4) -> APIClient:
+        """Client of a background batch of cities (e.g. dashboard), with its own cache of both payloads of every city
+        and the API calls a minute not kept for searches, so the batch neither evicts weather of the window
+        nor delays its searches"""
+
+        return APIClient(cls._API, pool_size=pool_size, cache=ResponseCache(maxsize=2 * cities, ttl=600), timings=cls._timings,
+                         limiter=RateLimiter((cls._RATE_LIMIT - cls._SEARCH_RATE) / 60) if cls._RATE_LIMIT else None)
+
+    @staticmethod
+    def saved_unit() -> str:
+        """Temperature unit saved in settings, C if none is saved"""
+
+        try:
+            with open(os.path.join(ASSETS, "unit.txt")) as u:
+                return u.read().strip() or "C"
+        except OSError:
+            return "C"
+
+    def fetch_weather(self, city : str, revalidate : bool = False) -> tuple[int, dict | None]:
+        """Fetch current weather of provided city from Current Weather Data API
+        Only does the network call, so it is safe to run on a worker thread.
+        revalidate asks the API even if weather of city was fetched recently (see APIClient.get_json()).
+        return:
+            (exit_status, current_json)"""
+
+        import requests
+        try:
+            # current weather in json format
+            __current_json = self._client.get_json("weather", revalidate, **self.weather_params(city))
+
+        except requests.exceptions.ConnectionError:     # No Internet
+            return (1, None)
+        except requests.Timeout:                        # response time out
+            return (2, None)
+        else:
+            return (0, __current_json)
+
+    def weather_params(self, city : str) -> dict[str, str]:
+        """Query of Current Weather Data API for provided city"""
+
+        return {"q" : city, "units" : self._UNITS[self._FETCH_UNIT][1]}
+
+    def set_weather(self, current_json : dict) -> int:
+        """Store current weather fetched by fetch_weather(), if city is found"""
+
+        try:
+            __lat = current_json["coord"]["lat"]               # Latitude
+            __lon = current_json["coord"]["lon"]               # Longitude
+        except KeyError:        # City name is not present
+            return 3
+
+        self.__current_json = current_json
+        self._lat, self._lon = __lat, __lon
+        self._location = None                                 # resolved on first use
+        return 0
+
+    def weather_dt(self) -> int:
+        """Time (unix seconds) at which set current weather was calculated by OpenWeatherMap"""
+
+        return self.__current_json.get("dt", 0)
+
+    def same_weather(self, current_json : dict) -> bool:
+        """True if fetched current weather is of the same place and calculation (dt) as the set one"""
+
+        try:
+            return (current_json["coord"], current_json["dt"]) == (self.__current_json["coord"], self.__current_json["dt"])
+        except (KeyError, AttributeError):
+            return False
+
+    def get_weather(self, city : str) -> int:
+        """Get current weather from Current Weather Data API and other details of provided city"""
+
+        __exit_status, __current_json = self.fetch_weather(city)
+        if (__exit_status == 0):
+            return self.set_weather(__current_json)
+        return __exit_status
+
+    #----------------------------| Current Temperature |----------------------------
+    def current_weather(self) -> tuple[int | float | str]:
+        """Fetch following details from current weather
+        return:
+            (temp, temp_name, temp_des, humidity)
+            temp        -> temperature
+            feels       -> feels like
+            temp_name   -> name of temperature
+            temp_des    -> description of temperature
+            humditiy    -> humidity
+            visibility  -> visibility"""
+
+        __temp = self.to_unit(self.__current_json["main"]["temp"])                  # according to units
+        __feels = self.to_unit(self.__current_json["main"]["feels_like"])           # according to units
+        __temp_name = self.__current_json["weather"][0]["main"]          # group of weather
+        __temp_des = self.__current_json["weather"][0]["description"]    # group of weather
+        __humidity = self.__current_json["main"]["humidity"]             # percent %
+        __visible = self.__current_json["visibility"]                    # meters
+
+        return (__temp, __feels, __temp_name, __temp_des, __humidity, __visible)
+
+    #----------------------------| Temperature Unit |----------------------------
+    def to_unit(self, celsius : "int | float | np.ndarray") -> "int | float | np.ndarray":
+        """Convert temperature (or an array of temperatures) fetched in Celsius to selected unit,
+        rounded to 2 decimals like the API does."""
+
+        if (self._unit == "F"):
+            celsius = celsius * 9 / 5 + 32
+        if isinstance(celsius, (int, float)):
+            return round(celsius, 2)
+        return celsius.round(2)
+
+    #----------------------------| Current Weather Condition |----------------------------
+    def current_condition(self) -> tuple[int, str]:
+        """Fetch OpenWeatherMap condition of current weather
+        return:
+            (weather_id, icon)
+            weather_id  -> weather condition id (e.g. 800)
+            icon        -> icon code (e.g. 01d)"""
+
+        return (self.__current_json["weather"][0]["id"], self.__current_json["weather"][0]["icon"])
+
+
+    #----------------------------| Location of City |----------------------------
+    def resolve_location(self) -> None:
+        """Get country name, region and time zone of searched city from location cache"""
+
+        if self._location is None:
+            self._location = self._locations.resolve(self.__current_json["sys"]["country"])
+            self._tz = self._locations.tzinfo(self._location["Zone"])
+
+    def location_details(self) -> tuple[float | str]:
+        """Fetch information of user's provided location
+        return:
+            lat                 -> Latitude
+            lon                 -> Longitude
+            city                -> City name (official)
+            con_code            -> Country code
+            country_name        -> Country name
+            region              -> Region of country
+            time_zone           -> Time Zone
+            zone_name           -> name of Time Zone"""
+
+        self.resolve_location()
+        __city_name = self.__current_json["name"]                    # City name
+        __con_code = self.__current_json["sys"]["country"]           # Country code
+        __country_name = self._location["Country"]                   # Country name
+        __region = self._location["Region"]                          # Region name
+        __zone_name = self._location["Zone"]                         # Time zone name
+        __time_zone = datetime.datetime.now(tz=self._tz).strftime("%z")
+
+        return (self._lat, self._lon, __city_name, __con_code, __country_name, __region, __time_zone, __zone_name)
+
+
+    #----------------------------| Time of City |----------------------------
+    def current_time(self) -> tuple[str]:
+        """Fetch current time and current day of user's location
+        return:
+            current_time    -> Current Time
+            current_Day:   -> Current Day"""
+
+        self.resolve_location()
+        # current time in HH : MM : SS  AM/PM 12-hr format
+        __now = datetime.datetime.now(self._tz)
+        __current_time = __now.strftime("%I:%M %p")
+        __current_day = __now.strftime("%a, %d %b' %y")
+        return (__current_time, __current_day)
+
+
+    #----------------------------| Next Minute of City |----------------------------
+    def next_minute(self) -> int:
+        """Milli seconds until the minute of city's clock changes"""
+
+        self.resolve_location()
+        __now = datetime.datetime.now(self._tz)
+        return (60 - __now.second) * 1000 - __now.microsecond // 1000 + 20      # +20 ms, to surely be in next minute
+
+
+#====================================================| Forecast Model |====================================================
+class ForecastSeries:
+    """Numeric fields of hourly or daily One Call forecast, each as a NumPy array (one value per hour / day).
+    Daily temperature and feels like are of day time."""
+
+    __slots__ = ("dt", "temp", "feels_like", "humidity", "pop", "wind")
+
+    def __init__(self, points : list[dict]):
+        import numpy as np
+
+        __day = lambda value: value["day"] if isinstance(value, dict) else value     # daily temps are per part of day
+
+        self.dt = np.array([point["dt"] for point in points], dtype=np.int64)
+        self.temp = np.array([__day(point["temp"]) for point in points], dtype=float)
+        self.feels_like = np.array([__day(point["feels_like"]) for point in points], dtype=float)
+        self.humidity = np.array([point["humidity"] for point in points], dtype=float)
+        self.pop = np.array([point.get("pop", 0) for point in points], dtype=float)
+        self.wind = np.array([point["wind_speed"] for point in points], dtype=float)
+
+
+class DailySeries(ForecastSeries):
+    """Daily forecast, with night, minimum and maximum temperature"""
+
+    __slots__ = ("temp_night", "temp_min", "temp_max")
+
+    def __init__(self, points : list[dict]):
+        import numpy as np
+
+        super().__init__(points)
+        self.temp_night = np.array([point["temp"]["night"] for point in points], dtype=float)
+        self.temp_min = np.array([point["temp"]["min"] for point in points], dtype=float)
+        self.temp_max = np.array([point["temp"]["max"] for point in points], dtype=float)
+
+
+class DailyForecast:
+    """Text of one day of One Call forecast"""
+
+    __slots__ = ("date", "sunrise", "sunset", "moonrise", "moonset", "name", "description", "weather_id", "icon")
+
+    def __init__(self, day : dict):
+        self.date = datetime.datetime.fromtimestamp(day["dt"]).strftime("%d %b' %y")
+        self.sunrise = datetime.datetime.fromtimestamp(day["sunrise"]).strftime("%I:%M %p")
+        self.sunset = datetime.datetime.fromtimestamp(day["sunset"]).strftime("%I:%M %p")
+        self.moonrise = datetime.datetime.fromtimestamp(day["moonrise"]).strftime("%I:%M %p")
+        self.moonset = datetime.datetime.fromtimestamp(day["moonset"]).strftime("%I:%M %p")
+        self.name = day["weather"][0]["main"]
+        self.description = day["weather"][0]["description"]
+        self.weather_id = day["weather"][0]["id"]
+        self.icon = day["weather"][0]["icon"]
+
+
+class Forecast:
+    """One Call payload parsed once per fetch, every forecast accessor reads from it"""
+
+    __slots__ = ("hourly", "daily", "days", "day_hours", "week")
+
+    # next 24 hours, every 3rd hour
+    DAY_HOURS = slice(0, 25, 3)
+
+    def __init__(self, forecast_json : dict):
+        self.hourly = ForecastSeries(forecast_json.get("hourly", []))
+        self.daily = DailySeries(forecast_json["daily"])
+        self.days = [DailyForecast(day) for day in forecast_json["daily"]]
+
+        # labels of sampled hours ["12 Nov\n03:00 PM", ...] and their x ticks ["03:00\npm", ...]
+        __hours = [datetime.datetime.fromtimestamp(dt) for dt in self.hourly.dt[self.DAY_HOURS].tolist()]
+        self.day_hours = ([f'{hour.strftime("%d")} {hour.strftime("%B")[:3]}\n{hour.strftime("%I:%M %p")}' for hour in __hours],
+                          [hour.strftime("%I:%M\n%p").lower() for hour in __hours])
+        self.week = {}          # { unit : Seven_days_forecast() }, made at first use
+
+
+#====================================================| 7-days Weather Forecast |====================================================
+class WeekForecast(CurrentWeather):
+
+    # { city : (latitude, longitude) } of every city found so far
+    _coords = {}
+    # hourly forecast is only fetched if something shows it (graph of next 24 hours)
+    fetch_hourly = False
+    # parsed One Call payload, None till a forecast is set
+    _forecast = None
+    # OpenWeatherMap calculates weather about every 10 minutes
+    DATA_PERIOD = 600
+    # least and most seconds between two refreshes, see next_refresh()
+    REFRESH_LIMITS = (120, 900)
+
+    def forecast_params(self, lat : float, lon : float) -> dict[str, str | float]:
+        """Query of One Call API for provided latitude & longitude"""
+
+        return {"lat" : lat, "lon" : lon, "units" : self._UNITS[self._FETCH_UNIT][1],
+                "exclude" : "minutely" if self.fetch_hourly else "minutely,hourly"}
+
+    def fetch_forecast(self, city : str, revalidate : bool = False) -> tuple[int, dict | None, dict | None]:
+        """Fetch current weather and forecast from One Call API of provided city
+        If city is new, first verify the location from fetch_weather() method of CurrentWeather class,
+        else its coordinates are already known and both APIs are called in parallel.
+        Only does the network calls, so it is safe to run on a worker thread.
+        revalidate asks the API even if city was fetched recently, a refresh wants the newest weather.
+        return:
+            (exit_status, current_json, forecast_json)"""
+
+        import requests
+        __coords = self._coords.get(city.upper())
+        if __coords is None:
+            #----------| New city, get coordinates from current weather first |----------
+            __exit_status, __current_json = self.fetch_weather(city, revalidate)
+            if (__exit_status != 0):
+                return (__exit_status, None, None)
+
+            try:
+                __coords = (__current_json["coord"]["lat"], __current_json["coord"]["lon"])
+            except KeyError:        # City name is not present
+                return (3, None, None)
+
+            try:
+                # Getting 7 day forecast from open weather API, of user's provided location's latitude & longitude
+                __forecast_json = self._client.get_json("onecall", revalidate, **self.forecast_params(*__coords))
+            except requests.exceptions.ConnectionError:     # No Internet
+                return (1, None, None)
+            except requests.Timeout:                        # response time out
+                return (2, None, None)
+
+        else:
+            #----------| Known city, coordinates never change so fetch both at once |----------
+            try:
+                __current_json, __forecast_json = self._client.get_all_json(("weather", self.weather_params(city)),
+                                                                            ("onecall", self.forecast_params(*__coords)),
+                                                                            revalidate=revalidate)
+            except requests.exceptions.ConnectionError:     # No Internet
+                return (1, None, None)
+            except requests.Timeout:                        # response time out
+                return (2, None, None)
+
+            if "coord" not in __current_json:               # City name is not present
+                return (3, None, None)
+
+        self._coords[city.upper()] = __coords
+        return (0, __current_json, __forecast_json)
+
+    def set_forecast(self, current_json : dict, forecast_json : dict) -> int:
+        """Store current weather and forecast fetched by fetch_forecast(), if city is found"""
+
+        __exit_status = self.set_weather(current_json)
+        if (__exit_status == 0):
+            self._seven_days_weather = forecast_json
+            with self._timings.timed("parse forecast"):
+                self._forecast = Forecast(forecast_json)
+        return __exit_status
+
+    def same_forecast(self, current_json : dict, forecast_json : dict) -> bool:
+        """True if fetched payloads are of the same place and calculation (dt) as the set ones,
+        with hourly forecast in both or neither, so they have nothing new to show"""
+
+        try:
+            return (self.same_weather(current_json)
+                    and (forecast_json["current"]["dt"] == self._seven_days_weather["current"]["dt"])
+                    and (("hourly" in forecast_json) == ("hourly" in self._seven_days_weather)))
+        except (KeyError, AttributeError):
+            return False
+
+    def next_refresh(self, unchanged : int = 0) -> int:
+        """Milli seconds till weather newer than the set one is expected, DATA_PERIOD after its dt.
+        If that time has passed, which it has after `unchanged` refreshes which brought nothing new,
+        the wait doubles from the least one. Always within REFRESH_LIMITS."""
+
+        __least, __most = self.REFRESH_LIMITS
+        __wait = self.weather_dt() + self.DATA_PERIOD - time.time()
+        if (__wait <= 0) or unchanged:
+            __wait = __least * 2 ** unchanged
+        return int(min(max(__wait, __least), __most) * 1000)
+
+    def get_forecast(self, city : str) -> int:
+        """Fetch forecast from One Call API and other details of provided city
+        first verify the location from get_weather() method of CurrentWeather class."""
+
+        __exit_status, __current_json, __forecast_json = self.fetch_forecast(city)
+        if (__exit_status == 0):
+            return self.set_forecast(__current_json, __forecast_json)
+        return __exit_status
+
+    #--------------------------| Current Day Temperature |--------------------------
+    def current_day_temps(self) -> dict[str : float]:
+        """--------------------------| Current Day Temperature |--------------------------
+        Fetch day, date and time of current day (24-hours - 3hr diff)
+        -> returns a dictionary of time as key and temperature as value
+        -> { time : day }
+        return:
+        ->     current_day_temp    -> Temperature of 24-hours of 3 hour difference """
+
+        __labels, _, __temps = self.current_day_series()
+        return dict(zip(__labels, __temps.tolist()))
+
+    def current_day_series(self) -> "tuple[list[str], list[str], np.ndarray]":
+        """Next 24 hours of 3 hour difference, for graph
+        return:
+            (labels, ticks, temps)
+            labels  -> day and time, e.g. "12 Nov\n03:00 PM"
+            ticks   -> time, e.g. "03:00\npm"
+            temps   -> array of temperatures"""
+
+        __labels, __ticks = self._forecast.day_hours
+        return (__labels, __ticks, self.to_unit(self._forecast.hourly.temp[Forecast.DAY_HOURS]))
+
+    def has_hourly(self) -> bool:
+        """True if set forecast has hourly forecast, see fetch_hourly. False if no forecast is set yet"""
+
+        return (self._forecast is not None) and (self._forecast.hourly.dt.size > 0)
+
+    #------------------------------------Sunrise-and-Sunset----------------------------------------
+    def current_sun_time(self) -> tuple[str]:
+        """Get sunrise and sunset time of current day
+        return:
+            sunrise     -> Sunrise
+            sunset      -> Sunset"""
+
+        return (self._forecast.days[0].sunrise, self._forecast.days[0].sunset)
+
+    #-----------------------------------Moonrise-and-Moonset---------------------------------------
+    def current_moon_time(self) -> tuple[str]:
+        """Get moonrise and moonset time of current day
+        return:
+            moonrise    -> Moonrise
+            moonset     -> Moonset"""
+
+        return (self._forecast.days[0].moonrise, self._forecast.days[0].moonset)
+
+    #---------------------------------Current-Day-Min-Max-Temperature------------------------------
+    def today_min_max_temp(self) -> tuple[float]:
+        """Get minimum and maximum temperature of current day
+        return:
+            min_temp    -> Minimum temperature
+            max_temp    -> Maximum temperature"""
+
+        return (self.to_unit(self._forecast.daily.temp_min[0].item()), self.to_unit(self._forecast.daily.temp_max[0].item()))
+
+    #---------------------------------------7-Day-Forecast-----------------------------------------
+    def Seven_days_forecast(self) -> list[dict[str, int | float | str]]:
+        """
+        Get information of next 7 days each day info is stored in a dictionary manner
+        { "Date" : date,        "Temp" : temp,         "Day:" : day_temp, 
+         "Night:" : night_temp, "Name" : weather_name, "Description" : weather_des,
+         "Id" : weather_id,     "Icon" : icon_code}
+        return:
+            days                -> list of 7-day forecast"""
+
+        if self._unit in self._forecast.week:
+            return self._forecast.week[self._unit]
+
+        __day_temps = self.week_temps().tolist()
+        __night_temps = self.to_unit(self._forecast.daily.temp_night[1:]).tolist()
+
+        __week_temps = []
+        for __day, __day_temp, __night_temp in zip(self._forecast.days[1:], __day_temps, __night_temps):
+            __day_set = {"Date" : __day.date, "Temp" : __day_temp, "Day:" : __day_temp,
+            "Night:" : __night_temp, "Name" : __day.name, "Description" : __day.description,
+            "Id" : __day.weather_id, "Icon" : __day.icon}
+            
+            __week_temps.append(__day_set)
+        
+        self._forecast.week[self._unit] = __week_temps
+        return __week_temps
+
+    def week_temps(self) -> "np.ndarray":
+        """Day temperature of next 7 days, for graph"""
+
+        return self.to_unit(self._forecast.daily.temp[1:])
+
+
+#====================================================| Weather Core |====================================================
+class WeatherCore(WeekForecast):
+    """Everything shown by the app, ready to display: weather, forecast, image and colors of weather.
+    Has no widgets, the Tk window only calls these methods."""
+
+    # images names : OpenWeatherMap weather condition ids (https://openweathermap.org/weather-conditions)
+    weather_images = {
+        "./assets/sunny.png" : [800],      # 01d, 01n
+
+        "./assets/clear_sky.png" : [801],      # 02d, 02n
+
+        "./assets/cloudy.png" : [802, 803, 804],      # 03d, 03n, 04d, 04n
+
+        "./assets/foggy.png" : [701, 711, 721, 741],     # 50d, 50n
+
+        "./assets/snow.png" : [511, 600, 601, 602, 611, 612, 613, 615, 616, 620, 621, 622],    # 13d, 13n
+
+        "./assets/windy.png" : [731, 751, 761, 762, 771, 781],     # 50d, 50n
+
+        "./assets/rainy.png" : [300, 301, 302, 310, 311, 312, 313, 314, 321,
+        500, 501, 502, 503, 504, 520, 521, 522, 531],     # 09d, 09n, 10d, 10n
+
+        "./assets/thunderstorm.png" : [200, 201, 202, 210, 211, 212, 221, 230, 231, 232]      # 11d, 11n
+    }
+
+    # images names : OpenWeatherMap icon codes, used if weather id is unknown
+    weather_icons = {
+        "./assets/sunny.png" : ["01d", "01n"],
+        "./assets/clear_sky.png" : ["02d", "02n"],
+        "./assets/cloudy.png" : ["03d", "03n", "04d", "04n"],
+        "./assets/rainy.png" : ["09d", "09n", "10d", "10n"],
+        "./assets/thunderstorm.png" : ["11d", "11n"],
+        "./assets/snow.png" : ["13d", "13n"],
+        "./assets/foggy.png" : ["50d", "50n"]
+    }
+    
+    # Images name :   ( [ (Current ipadx, ipday Image frame)      (Week ipadx day frame, pady image frame)  ],
+    #                   [ (current image width, height),           (week image width, height)               ],
+    #                   [ Day Color header/current/week weather/extras, inner/current/week graph            ],
+    #                   [ Night Color header/current/week weather/extras, inner/current/week graph          ]   )
+    images_config = {   "./assets/sunny.png"        : ( [(10,  0), ( 9,  0)],  [(160, 160), ( 85,  80)], ["#F5B041", "#FFE082"], ["#55555D", "#929297"] ),
+                        "./assets/clear_sky.png"    : ( [(10,  0), (10,  0)],  [(160, 120), ( 80,  80)], ["#03A9F4", "#81D4FA"], ["#21618C", "#2980B9"] ),
+                        "./assets/cloudy.png"       : ( [(15,  5), ( 8,  5)],  [(130, 130), ( 90,  70)], ["#308DA5", "#87ceeb"], ["#308DA5", "#87ceeb"] ),
+                        "./assets/foggy.png"        : ( [( 5, 10), (10,  5)],  [(170, 110), (110,  70)], ["#48C9B0", "#A3E4D7"], ["#E3915C", "#EDBB99"] ),
+                        "./assets/snow.png"         : ( [(15,  5), (13,  0)],  [(160, 140), ( 90,  80)], ["#00BCD4", "#80DEEA"], ["#00BCD4", "#80DEEA"] ),
+                        "./assets/windy.png"        : ( [( 0,  5), (10,  0)],  [(160, 145), (100,  80)], ["#34495E", "#AEB6BF"], ["#34495E", "#AEB6BF"] ),
+                        "./assets/rainy.png"        : ( [(15,  0), ( 8,  0)],  [(160, 150), ( 80,  80)], ["#1976D2", "#64B5F6"], ["#1976D2", "#64B5F6"] ),
+                        "./assets/thunderstorm.png" : ( [( 0,  0), ( 0,  1)],  [(160, 150), (100,  80)], ["#2980B9", "#7FB3D5"], ["#2980B9", "#7FB3D5"] )
+                      }
+
+    # { weather id / icon code : (image name, images config) }, built once
+    weather_index = {}
+    for __image, __codes in (*weather_images.items(), *weather_icons.items()):
+        for __code in __codes:
+            weather_index.setdefault(__code, (__image, images_config[__image]))
+    del __image, __codes, __code
+
+    #----------------------------| Temperature Unit |----------------------------
+    @property
+    def unit(self) -> str:
+        """Selected temperature unit, C or F"""
+
+        return self._unit
+
+    @unit.setter
+    def unit(self, unit : str) -> None:
+        self._unit = unit
+
+    def unit_name(self, unit : str) -> str:
+        """Full name of temperature unit, e.g. Celsius"""
+
+        return self._UNITS[unit][0]
+
+    #----------------------------| Timings |----------------------------
+    @property
+    def timings(self) -> Timings:
+        """Durations of stages of searches and refreshes"""
+
+        return self._timings
+
+    #----------------------------| Saved Forecast |----------------------------
+    def load_forecast(self, city : str) -> bool:
+        """Set weather of city saved at last run, if there is one
+        return:
+            True if saved weather is set"""
+
+        __cached = self._forecasts.load(city)
+        return (__cached is not None) and (self.set_forecast(*__cached) == 0)
+
+    def save_forecast(self, city : str, current_json : dict, forecast_json : dict) -> None:
+        """Save fetched weather of city, for next run"""
+
+        self._forecasts.save(city, current_json, forecast_json)
+
+
+    def weather_image(self, weather_id : int, icon : str) -> tuple[str, tuple]:
+        """Get image name and its images config of weather, by OpenWeatherMap weather id,
+        else by its icon code, else cloudy."""
+
+        return self.weather_index.get(weather_id) or self.weather_index.get(icon) or self.weather_index["03d"]
+
+
+    def current_weather_details(self) -> dict[str, int | float | str]:
+        """--------------------------| Current Weather Details |--------------------------
+        It will make a Dictionary which holds, all values required in current temperature details.
+        Image path, Image pady, Frame ipadx, Image size, bg color."""
+        __start = time.perf_counter()
+        current_temp, current_feels, current_temp_name, current_temp_des, current_humid, current_visibility = self.current_weather()
+
+        today_min, today_max = self.today_min_max_temp()
+        current_time, current_date = self.current_time()
+
+        _, _, current_city, _, current_country, current_region, current_time_zone, _ = self.location_details()
+
+        current_sunrise, current_sunset = self.current_sun_time()
+        current_moonrise, current_moonset = self.current_moon_time()
+
+        current_image, current_config = self.weather_image(*self.current_condition())
+        raw_path = current_image.split("/")
+        
+        # If Time comes b/w sunrise and sunset
+        if datetime.datetime.strptime(current_sunrise, "%I:%M %p")\
+            <= datetime.datetime.strptime(current_time, "%I:%M %p") <= datetime.datetime.strptime(current_sunset, "%I:%M %p"):
+            raw_path.insert(2, "day")       # add day image
+            bg_img = current_config[2][0]
+            fg_img = current_config[2][1]
+        else:   # else add night image
+            raw_path.insert(2, "night")
+            bg_img = current_config[3][0]
+            fg_img = current_config[3][1]
+
+        current_exact_image = '/'.join(raw_path)
+
+        current_details = { "Image" : current_exact_image, "bg color" : bg_img,
+        "light color" : fg_img, "Image size" : current_config[1][0],
+        "ipadx" : current_config[0][0][0], "ipady" : current_config[0][0][1],
+        "Temp" : current_temp, "Feels" : current_feels, "Name" : current_temp_name,
+        "Humidity" : current_humid, "Visibility" : current_visibility, "Min" : today_min, "Max" : today_max,
+        "Time" : current_time, "Date" : current_date, "City" : current_city, "Country" : current_country,
+        "Region" : current_region, "Time zone" : current_time_zone, "Sunrise" : current_sunrise,
+        "Sunset" : current_sunset, "Moonrise" : current_moonrise, "Moonset" : current_moonset }
+        self._timings.add("current_weather_details", __start)
+        return current_details
+
+
+    def week_forecast_details(self, bg_color : str) -> list[dict[str, int | float | str]]:
+        """--------------------------| Week Weather Forecast Details |--------------------------
+        It will make a list of dictionaries which holds, all values in seven_days_forecast() return dict
+        as well as some extra things:
+        Image path, Image pady, Frame ipadx, Image size, bg color"""
+
+        __start = time.perf_counter()
+        week_forecast = self.Seven_days_forecast()
+        raw_Wdetails = []
+        for i, day in enumerate(week_forecast):
+
+            #-----| Getting image according to weather |-----
+            image, config = self.weather_image(day["Id"], day["Icon"])
+            raw_path = image.split('/')
+            img_path = "./" + raw_path[1] + "/day/" + raw_path[-1]
+
+            Ipady = config[0][1][1]
+            Fipadx = config[0][1][0]
+            size = config[1][1]
+            color = bg_color
+
+            # storing all required details in a dict format
+            details = {**day, "Image" : img_path, "Image pady" : Ipady, "Frame ipadx" : Fipadx, "Image size" : size, "bg color" : color}
+            if not i:
+                details["Date"] = "Tomorrow"
+            
+            raw_Wdetails.append(details)
+
+        self._timings.add("week_forecast_details", __start)
+        return raw_Wdetails